@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 from odoo_boost.config.schema import OdooBoostConfig
+from odoo_boost.guidelines.budget import compose_budgeted_guidelines
 from odoo_boost.guidelines.composer import compose_guidelines
 from odoo_boost.skills.loader import install_skills
 
@@ -24,9 +25,17 @@ class Agent(ABC):
     id: str  # e.g. "claude_code"
     display_name: str  # e.g. "Claude Code"
 
-    def __init__(self, config: OdooBoostConfig, project_path: Path) -> None:
+    def __init__(
+        self,
+        config: OdooBoostConfig,
+        project_path: Path,
+        installed_modules: list[str] | None = None,
+    ) -> None:
         self.config = config
         self.project_path = project_path
+        # Installed module names of the live instance; used to leave out
+        # irrelevant sections when the guidelines have a token budget.
+        self.installed_modules = installed_modules
 
     # -- public API ----------------------------------------------------------
 
@@ -79,9 +88,18 @@ class Agent(ABC):
         """
         return [sys.executable, "-m", "odoo_boost", "mcp"]
 
+    def _compose_guidelines(self) -> str:
+        """Return the guidelines markdown, within the configured token budget if any."""
+        token_budget = self.config.guidelines.token_budget
+        if token_budget:
+            return compose_budgeted_guidelines(
+                self.config.odoo_version, token_budget, self.installed_modules
+            )
+        return compose_guidelines(self.config.odoo_version)
+
     def _write_guidelines(self) -> Path:
         """Compose and write the guidelines file."""
-        content = compose_guidelines(self.config.odoo_version)
+        content = self._compose_guidelines()
         self.guidelines_path.parent.mkdir(parents=True, exist_ok=True)
         self.guidelines_path.write_text(content, encoding="utf-8")
         return self.guidelines_path
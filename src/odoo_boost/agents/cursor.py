@@ -6,7 +6,6 @@ import json
 from pathlib import Path
 
 from odoo_boost.agents.base import Agent
-from odoo_boost.guidelines.composer import compose_guidelines
 
 
 class CursorAgent(Agent):
@@ -27,7 +26,7 @@ class CursorAgent(Agent):
 
     def _write_guidelines(self) -> Path:
         """Cursor uses .mdc format with YAML frontmatter."""
-        content = compose_guidelines(self.config.odoo_version)
+        content = self._compose_guidelines()
         mdc = (
             "---\n"
             "description: Odoo development guidelines from Odoo Boost\n"
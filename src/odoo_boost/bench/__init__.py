@@ -0,0 +1,15 @@
+"""Benchmark suite: run the MCP tools against a local fake Odoo RPC server."""
+
+from odoo_boost.bench.dataset import BenchSizes, build_dataset
+from odoo_boost.bench.runner import BENCH_CALLS, ToolStats, run_benchmark
+from odoo_boost.bench.server import FakeOdoo, FakeOdooServer
+
+__all__ = [
+    "BenchSizes",
+    "build_dataset",
+    "BENCH_CALLS",
+    "ToolStats",
+    "run_benchmark",
+    "FakeOdoo",
+    "FakeOdooServer",
+]
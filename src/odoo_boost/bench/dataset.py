@@ -0,0 +1,305 @@
+"""Synthetic Odoo metadata and records served by the benchmark's fake server."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+_WRITE_DATE = "2025-01-01 00:00:00"
+_FIELD_TYPES = (
+    "char",
+    "integer",
+    "many2one",
+    "float",
+    "boolean",
+    "date",
+    "text",
+    "selection",
+    "one2many",
+    "datetime",
+)
+_VIEW_TYPES = ("form", "list", "search", "kanban")
+
+Tables = dict[str, list[dict[str, Any]]]
+
+# Many2one fields that domains traverse with a dotted path (model_id.model).
+RELATIONS: dict[str, dict[str, str]] = {
+    "ir.model.fields": {"model_id": "ir.model"},
+    "ir.model.access": {"model_id": "ir.model"},
+    "ir.rule": {"model_id": "ir.model"},
+    "ir.module.module.dependency": {"module_id": "ir.module.module"},
+    "res.partner": {"country_id": "res.country"},
+}
+
+
+@dataclass(frozen=True)
+class BenchSizes:
+    """Size of the synthetic database."""
+
+    models: int = 200
+    fields_per_model: int = 30
+    views_per_model: int = 4
+    modules: int = 80
+    records: int = 2000
+
+
+def model_name(index: int) -> str:
+    """Technical name of the synthetic model number *index* (1-based)."""
+    return f"x_bench.model_{index}"
+
+
+def module_name(index: int) -> str:
+    """Technical name of the synthetic module number *index* (1-based)."""
+    return f"bench_module_{index}"
+
+
+def build_dataset(sizes: BenchSizes) -> Tables:
+    """Return the records of every model the MCP tools query, keyed by model name."""
+    tables: Tables = {}
+    tables["ir.module.module"] = modules = [
+        {
+            "id": i,
+            "name": module_name(i),
+            "shortdesc": f"Bench Module {i}",
+            "summary": f"Synthetic module {i} for benchmarks",
+            "description": f"Module {i} description. " * 20,
+            "author": "Odoo Boost",
+            "website": "https://example.com",
+            "installed_version": "18.0.1.0.0",
+            "latest_version": "18.0.1.0.0",
+            "state": "installed",
+            "category_id": [1, "Bench"],
+            "application": i % 10 == 1,
+            "license": "LGPL-3",
+            "write_date": _WRITE_DATE,
+        }
+        for i in range(1, sizes.modules + 1)
+    ]
+    tables["ir.module.module.dependency"] = [
+        {
+            "id": i,
+            "name": module_name(i - 1),
+            "module_id": [i, module_name(i)],
+            "auto_install_required": False,
+        }
+        for i in range(2, len(modules) + 1)
+    ]
+
+    tables["ir.model"] = [
+        {
+            "id": i,
+            "model": model_name(i),
+            "name": f"Bench Model {i}",
+            "info": f"Synthetic model {i}",
+            "state": "base",
+            "transient": False,
+            "modules": module_name(i % max(sizes.modules, 1) + 1),
+            "write_date": _WRITE_DATE,
+        }
+        for i in range(1, sizes.models + 1)
+    ]
+    tables["ir.model.data"] = [
+        {
+            "id": i,
+            "module": model["modules"],
+            "model": "ir.model",
+            "name": f"model_{model['model'].replace('.', '_')}",
+            "res_id": model["id"],
+        }
+        for i, model in enumerate(tables["ir.model"], 1)
+    ]
+    tables["ir.model.fields"] = [
+        _field(model, j, i * sizes.fields_per_model + j)
+        for i, model in enumerate(tables["ir.model"])
+        for j in range(sizes.fields_per_model)
+    ]
+
+    tables["ir.ui.view"] = views = []
+    for model in tables["ir.model"]:
+        primary: dict[str, int] = {}
+        for j in range(sizes.views_per_model):
+            view_type = _VIEW_TYPES[j % len(_VIEW_TYPES)]
+            view_id = len(views) + 1
+            inherit = primary.get(view_type)
+            views.append(
+                {
+                    "id": view_id,
+                    "name": f"{model['model']}.{view_type}.{j}",
+                    "model": model["model"],
+                    "type": view_type,
+                    "mode": "extension" if inherit else "primary",
+                    "priority": 16,
+                    "active": True,
+                    "inherit_id": [inherit, f"{model['model']}.{view_type}"] if inherit else False,
+                    "arch": _arch(view_type, sizes.fields_per_model, extension=bool(inherit)),
+                    "write_date": _WRITE_DATE,
+                }
+            )
+            primary.setdefault(view_type, view_id)
+
+    tables["ir.model.access"] = [
+        {
+            "id": i * 2 + k + 1,
+            "name": f"access_{model['model']}_{group}",
+            "model_id": [model["id"], model["name"]],
+            "group_id": [k + 1, group],
+            "perm_read": True,
+            "perm_write": k == 1,
+            "perm_create": k == 1,
+            "perm_unlink": k == 1,
+            "write_date": _WRITE_DATE,
+        }
+        for i, model in enumerate(tables["ir.model"])
+        for k, group in enumerate(("User", "Manager"))
+    ]
+    tables["ir.rule"] = [
+        {
+            "id": i + 1,
+            "name": f"{model['name']} multi-company",
+            "model_id": [model["id"], model["name"]],
+            "groups": [],
+            "domain_force": "[('company_id', 'in', company_ids)]",
+            "perm_read": True,
+            "perm_write": True,
+            "perm_create": True,
+            "perm_unlink": True,
+            "global": True,
+            "write_date": _WRITE_DATE,
+        }
+        for i, model in enumerate(tables["ir.model"][::2])
+    ]
+
+    roots = max(sizes.modules // 10, 1)
+    tables["ir.ui.menu"] = [
+        {
+            "id": i,
+            "name": f"App {i}",
+            "parent_id": False,
+            "action": False,
+            "sequence": i,
+            "write_date": _WRITE_DATE,
+        }
+        for i in range(1, roots + 1)
+    ] + [
+        {
+            "id": roots + i,
+            "name": model["name"],
+            "parent_id": [i % roots + 1, f"App {i % roots + 1}"],
+            "action": f"ir.actions.act_window,{i}",
+            "sequence": 10,
+            "write_date": _WRITE_DATE,
+        }
+        for i, model in enumerate(tables["ir.model"], 1)
+    ]
+
+    tables["ir.config_parameter"] = [
+        {"id": i, "key": f"bench.param_{i}", "value": str(i)} for i in range(1, 51)
+    ]
+    tables["ir.logging"] = [
+        {
+            "id": i,
+            "create_date": f"2025-01-15 10:{i // 60 % 60:02d}:{i % 60:02d}",
+            "name": "odoo.addons.bench" if i % 3 else "odoo.http",
+            "level": ("INFO", "WARNING", "ERROR")[i % 3],
+            "dbname": "bench",
+            "func": "action_run",
+            "path": "/odoo/addons/bench/models/bench.py",
+            "line": str(i % 500),
+            "message": f"Log message {i}",
+        }
+        for i in range(1, sizes.records // 2 + 1)
+    ]
+    tables["website.page"] = [
+        {
+            "id": i,
+            "name": f"Page {i}",
+            "url": f"/page-{i}",
+            "is_published": True,
+            "website_id": [1, "Website"],
+        }
+        for i in range(1, 21)
+    ]
+    tables["website.rewrite"] = [
+        {"id": i, "name": f"Redirect {i}", "url_from": f"/old-{i}", "url_to": f"/page-{i}"}
+        for i in range(1, 6)
+    ]
+    tables["base.automation"] = [
+        {
+            "id": i,
+            "name": f"Automation {i}",
+            "model_name": model_name(i),
+            "trigger": "on_create_or_write",
+            "active": True,
+            "action_server_ids": [i],
+        }
+        for i in range(1, 21)
+    ]
+    tables["ir.actions.server"] = [
+        {
+            "id": i,
+            "name": f"Server action {i}",
+            "model_name": model_name(i),
+            "state": "code",
+            "code": "record.write({'x_done': True})",
+            "sequence": 5,
+        }
+        for i in range(1, 41)
+    ]
+
+    tables["res.country"] = [{"id": i, "name": f"Country {i}"} for i in range(1, 11)]
+    tables["res.partner"] = [
+        {
+            "id": i,
+            "name": f"Partner {i}",
+            "display_name": f"Partner {i}",
+            "email": f"partner{i}@example.com",
+            "phone": f"+1 555 {i:04d}",
+            "is_company": i % 4 == 0,
+            "country_id": [i % 10 + 1, f"Country {i % 10 + 1}"],
+            "credit": round(i * 1.5, 2),
+            "customer_rank": i % 3,
+            "active": True,
+            "create_date": _WRITE_DATE,
+            "write_date": _WRITE_DATE,
+        }
+        for i in range(1, sizes.records + 1)
+    ]
+    return tables
+
+
+def _field(model: dict[str, Any], index: int, field_id: int) -> dict[str, Any]:
+    ttype = _FIELD_TYPES[index % len(_FIELD_TYPES)]
+    return {
+        "id": field_id + 1,
+        "name": "name" if index == 0 else f"x_field_{index}",
+        "field_description": f"Field {index}",
+        "ttype": ttype,
+        "relation": "res.partner" if ttype in ("many2one", "one2many") else False,
+        "required": index == 0,
+        "readonly": False,
+        "store": True,
+        "index": index < 3,
+        "help": f"Help text for field {index} of {model['model']}",
+        "model_id": [model["id"], model["name"]],
+        "model": model["model"],
+        "write_date": _WRITE_DATE,
+    }
+
+
+def _arch(view_type: str, field_count: int, extension: bool) -> str:
+    if extension:
+        return (
+            "<data>"
+            '<xpath expr="//field[@name=\'name\']" position="after">'
+            '<field name="x_field_1"/></xpath>'
+            '<field name="x_field_2" position="attributes">'
+            '<attribute name="invisible">1</attribute></field>'
+            "</data>"
+        )
+    fields = "".join(
+        f'<field name="{"name" if j == 0 else f"x_field_{j}"}"/>'
+        for j in range(max(field_count // 2, 1))
+    )
+    if view_type == "form":
+        return f"<form><sheet><group>{fields}</group></sheet></form>"
+    return f"<{view_type}>{fields}</{view_type}>"
@@ -0,0 +1,191 @@
+"""Run every MCP tool against a :class:`FakeOdooServer` and collect latency statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+from odoo_boost.bench.dataset import BenchSizes, build_dataset, model_name, module_name
+from odoo_boost.bench.server import FakeOdoo, FakeOdooServer
+from odoo_boost.config.schema import CacheConfig, OdooBoostConfig, OdooConnection
+from odoo_boost.connection.base import DEFAULT_READ_CACHE_TTL
+from odoo_boost.connection.factory import create_async_connection
+from odoo_boost.mcp_server.context import ServerContext, set_context
+from odoo_boost.mcp_server.encoding import encoding_timer
+from odoo_boost.mcp_server.metrics import _percentile
+from odoo_boost.mcp_server.tools.application_info import application_info
+from odoo_boost.mcp_server.tools.database_query import database_query
+from odoo_boost.mcp_server.tools.database_schema import database_schema
+from odoo_boost.mcp_server.tools.execute_method import execute_method
+from odoo_boost.mcp_server.tools.export_records import export_records
+from odoo_boost.mcp_server.tools.get_config import get_config
+from odoo_boost.mcp_server.tools.get_module_info import get_module_info
+from odoo_boost.mcp_server.tools.get_view_arch import get_view_arch
+from odoo_boost.mcp_server.tools.group_records import group_records
+from odoo_boost.mcp_server.tools.list_access_rights import list_access_rights
+from odoo_boost.mcp_server.tools.list_menus import list_menus
+from odoo_boost.mcp_server.tools.list_models import list_models
+from odoo_boost.mcp_server.tools.list_routes import list_routes
+from odoo_boost.mcp_server.tools.list_views import list_views
+from odoo_boost.mcp_server.tools.list_workflows import list_workflows
+from odoo_boost.mcp_server.tools.read_log_entries import read_log_entries
+from odoo_boost.mcp_server.tools.search_docs import search_docs
+from odoo_boost.mcp_server.tools.search_guidelines import search_guidelines
+from odoo_boost.mcp_server.tools.search_records import search_records
+from odoo_boost.mcp_server.tools.server_stats import server_stats
+
+# One representative call per tool, against the synthetic dataset.
+BENCH_CALLS: dict[str, tuple[Callable[..., Any], dict[str, Any]]] = {
+    "application_info": (application_info, {}),
+    "database_schema": (database_schema, {"model_name": model_name(1)}),
+    "database_query": (
+        database_query,
+        {"model": "res.partner", "domain": '[["is_company","=",true]]', "limit": 50},
+    ),
+    "list_models": (list_models, {"limit": 500}),
+    "list_views": (list_views, {"model_name": model_name(1), "summarize": True}),
+    "get_view_arch": (get_view_arch, {"model_name": model_name(1), "view_type": "form"}),
+    "list_menus": (list_menus, {"tree": True}),
+    "list_routes": (list_routes, {}),
+    "list_access_rights": (list_access_rights, {"model_name": model_name(1)}),
+    "get_config": (get_config, {}),
+    "get_module_info": (
+        get_module_info,
+        {"module_name": f"{module_name(1)},{module_name(2)}", "dependency_tree": True},
+    ),
+    "search_records": (search_records, {"model": "res.partner", "limit": 80}),
+    "export_records": (
+        export_records,
+        {"model": "res.partner", "fields": '["name","email","country_id"]', "batch_size": 500},
+    ),
+    "group_records": (
+        group_records,
+        {"model": "res.partner", "groupby": '["country_id"]', "aggregates": '["credit:sum"]'},
+    ),
+    "execute_method": (
+        execute_method,
+        {"model": "res.partner", "method": "name_search", "args": '["Partner 1"]'},
+    ),
+    "read_log_entries": (read_log_entries, {"level": "ERROR"}),
+    "search_docs": (search_docs, {"topic": "record rules"}),
+    "search_guidelines": (search_guidelines, {"query": "computed fields"}),
+    "list_workflows": (list_workflows, {}),
+    "server_stats": (server_stats, {}),
+}
+
+
+@dataclass
+class ToolStats:
+    """Benchmark results of one tool; sizes and counts are per call."""
+
+    tool: str
+    calls: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    rpc_count: float
+    bytes_sent: float
+    bytes_received: float
+    serialize_ms: float
+    response_bytes: float
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def run_benchmark(
+    protocol: Literal["xmlrpc", "jsonrpc"] = "jsonrpc",
+    iterations: int = 20,
+    sizes: BenchSizes | None = None,
+    latency: float = 0.0,
+    cache: bool = True,
+    tools: list[str] | None = None,
+    server_version: str = "18.0",
+) -> list[ToolStats]:
+    """Benchmark *tools* (default: all) against a local fake Odoo server.
+
+    Each tool runs *iterations* times through the real connection classes.
+    ``bytes_sent``/``bytes_received`` are the RPC request and response
+    bodies seen from the client, ``serialize_ms`` is the time spent encoding
+    the tool result and ``response_bytes`` the size of that result.
+    *cache* False turns off the metadata cache, the read cache and
+    request coalescing.
+    """
+    names = tools or list(BENCH_CALLS)
+    unknown = [name for name in names if name not in BENCH_CALLS]
+    if unknown:
+        raise ValueError(f"Unknown tool(s): {', '.join(unknown)}")
+    odoo = FakeOdoo(build_dataset(sizes or BenchSizes()), server_version=server_version)
+    with FakeOdooServer(odoo, latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        config = OdooBoostConfig(
+            connection=OdooConnection(
+                url=server.url,
+                database="bench",
+                username="admin",
+                password="admin",
+                protocol=protocol,
+                coalesce_reads=cache,
+                read_cache_ttl=DEFAULT_READ_CACHE_TTL if cache else 0,
+            ),
+            odoo_version=server_version,
+            cache=CacheConfig(enabled=cache, persist=False),
+            export_dir=tmp,
+        )
+        return asyncio.run(_run(server, config, names, iterations))
+
+
+async def _run(
+    server: FakeOdooServer, config: OdooBoostConfig, names: list[str], iterations: int
+) -> list[ToolStats]:
+    conn = create_async_connection(config.connection)
+    set_context(ServerContext(connection=conn, config=config))
+    try:
+        await conn.authenticate()
+        return [await _bench_tool(server, name, iterations) for name in names]
+    finally:
+        await conn.aclose()
+
+
+async def _bench_tool(server: FakeOdooServer, name: str, iterations: int) -> ToolStats:
+    tool, kwargs = BENCH_CALLS[name]
+    timings: list[float] = []
+    serialize = 0.0
+    response_bytes = 0
+    errors = 0
+    requests_before, received_before, sent_before = server.counters()
+    for _ in range(iterations):
+        with encoding_timer() as encode_seconds:
+            started = time.perf_counter()
+            try:
+                result = tool(**kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception:
+                errors += 1
+                result = ""
+            timings.append(time.perf_counter() - started)
+        serialize += encode_seconds[0]
+        response_bytes += len(result.encode("utf-8"))
+        if result.startswith('{"error"'):
+            errors += 1
+    requests, received, sent = server.counters()
+
+    timings.sort()
+    return ToolStats(
+        tool=name,
+        calls=iterations,
+        errors=errors,
+        p50_ms=round(_percentile(timings, 50) * 1000, 3),
+        p95_ms=round(_percentile(timings, 95) * 1000, 3),
+        rpc_count=round((requests - requests_before) / iterations, 2),
+        # The server receives what the client sends, and vice versa.
+        bytes_sent=round((received - received_before) / iterations),
+        bytes_received=round((sent - sent_before) / iterations),
+        serialize_ms=round(serialize / iterations * 1000, 3),
+        response_bytes=round(response_bytes / iterations),
+    )
@@ -0,0 +1,442 @@
+"""Local stand-in for an Odoo server speaking XML-RPC and JSON-RPC.
+
+:class:`FakeOdooServer` serves a synthetic dataset (see
+:mod:`odoo_boost.bench.dataset`) on ``127.0.0.1`` from a background thread,
+so the real connection classes, transports and MCP tools can be exercised
+end to end without an Odoo instance. It implements the ORM methods the
+tools use (``search_read``, ``search_count``, ``read_group``,
+``formatted_read_group``, ``get_views`` ...), optionally sleeps before
+answering to simulate network and server latency, and counts requests
+and bytes on the wire.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import xmlrpc.client
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from odoo_boost.bench.dataset import RELATIONS, Tables
+
+_UID = 2
+
+
+class FakeOdooError(Exception):
+    """Raised for calls the fake server rejects; sent back as an RPC fault."""
+
+
+class FakeOdoo:
+    """In-memory ORM answering ``execute_kw`` calls against *tables*."""
+
+    def __init__(self, tables: Tables, server_version: str = "18.0") -> None:
+        self.tables = tables
+        self.server_version = server_version
+        # Synthetic models are registered in ir.model but hold no records.
+        for model in tables.get("ir.model", []):
+            tables.setdefault(model["model"], [])
+        self._by_id = {
+            model: {record["id"]: record for record in records} for model, records in tables.items()
+        }
+
+    def dispatch(self, service: str, method: str, args: list[Any]) -> Any:
+        if service == "common":
+            if method == "version":
+                return {
+                    "server_version": self.server_version,
+                    "server_version_info": [int(self.server_version.split(".")[0]), 0, 0],
+                    "server_serie": self.server_version,
+                    "protocol_version": 1,
+                }
+            if method in ("authenticate", "login"):
+                return _UID
+        if service == "object" and method == "execute_kw":
+            _db, _uid, _password, model, orm_method, orm_args, *rest = args
+            return self.execute(model, orm_method, list(orm_args), rest[0] if rest else {})
+        raise FakeOdooError(f"Unsupported call {service}.{method}")
+
+    def execute(self, model: str, method: str, args: list[Any], kwargs: dict[str, Any]) -> Any:
+        if model not in self.tables:
+            raise FakeOdooError(f"Object {model} doesn't exist")
+        handler: Callable[..., Any] | None = getattr(self, f"_orm_{method}", None)
+        if handler is None:
+            raise FakeOdooError(f"The method '{model}.{method}' does not exist")
+        return handler(model, *args, **kwargs)
+
+    # -- ORM methods -----------------------------------------------------------
+
+    def _orm_search_read(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+        fields: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+        **_: Any,
+    ) -> list[dict[str, Any]]:
+        records = self._search(model, domain or [], offset, limit, order)
+        return [_project(record, fields) for record in records]
+
+    def _orm_search_count(self, model: str, domain: list[Any] | None = None, **_: Any) -> int:
+        return len(self._search(model, domain or []))
+
+    def _orm_search(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+        **_: Any,
+    ) -> list[int]:
+        return [r["id"] for r in self._search(model, domain or [], offset, limit, order)]
+
+    def _orm_read(
+        self, model: str, ids: list[int], fields: list[str] | None = None, **_: Any
+    ) -> list[dict[str, Any]]:
+        by_id = self._by_id[model]
+        return [_project(by_id[i], fields) for i in ids if i in by_id]
+
+    def _orm_name_search(
+        self, model: str, name: str = "", limit: int = 100, **_: Any
+    ) -> list[list[Any]]:
+        records = self._search(model, [("name", "ilike", name)] if name else [], limit=limit)
+        return [[r["id"], r.get("name", "")] for r in records]
+
+    def _orm_read_group(
+        self,
+        model: str,
+        domain: list[Any],
+        fields: list[str],
+        groupby: list[str],
+        offset: int = 0,
+        limit: int | None = None,
+        orderby: str | None = None,
+        lazy: bool = True,
+        **_: Any,
+    ) -> list[dict[str, Any]]:
+        aggregates = []
+        for spec in fields:
+            alias, _, rest = spec.partition(":")
+            func, _, field = rest.rstrip(")").partition("(")
+            aggregates.append((alias, func or "sum", field or alias))
+        rows = []
+        for key, records in self._groups(model, domain, groupby):
+            row: dict[str, Any] = dict(zip(groupby, key, strict=True))
+            for alias, func, field in aggregates:
+                row[alias] = _aggregate(func, [r.get(field) for r in records])
+            row["__count"] = len(records)
+            row["__domain"] = list(domain)
+            rows.append(row)
+        return _page(rows, offset, limit)
+
+    def _orm_formatted_read_group(
+        self,
+        model: str,
+        domain: list[Any],
+        groupby: list[str] | None = None,
+        aggregates: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+        **_: Any,
+    ) -> list[dict[str, Any]]:
+        groupby = groupby or []
+        rows = []
+        for key, records in self._groups(model, domain, groupby):
+            row: dict[str, Any] = dict(zip(groupby, key, strict=True))
+            for spec in aggregates or []:
+                if spec == "__count":
+                    row[spec] = len(records)
+                else:
+                    field, _, func = spec.partition(":")
+                    row[spec] = _aggregate(func, [r.get(field) for r in records])
+            row["__extra_domain"] = []
+            rows.append(row)
+        return _page(rows, offset, limit)
+
+    def _orm_get_views(
+        self, model: str, views: list[list[Any]], options: dict[str, Any] | None = None, **_: Any
+    ) -> dict[str, Any]:
+        result = {}
+        for view_id, view_type in views:
+            view = self._view(model, view_id, view_type)
+            result[view_type] = {"arch": view["arch"], "id": view["id"]}
+        return {"views": result, "models": {model: {}}}
+
+    def _orm_fields_view_get(
+        self, model: str, view_id: int | bool = False, view_type: str = "form", **_: Any
+    ) -> dict[str, Any]:
+        view = self._view(model, view_id, view_type)
+        return {"arch": view["arch"], "view_id": view["id"], "type": view_type, "model": model}
+
+    def _orm_fields_get(self, model: str, *_: Any, **__: Any) -> dict[str, Any]:
+        fields = self._search("ir.model.fields", [("model", "=", model)])
+        return {f["name"]: {"type": f["ttype"], "string": f["field_description"]} for f in fields}
+
+    # -- internal ---------------------------------------------------------------
+
+    def _search(
+        self,
+        model: str,
+        domain: list[Any],
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+    ) -> list[dict[str, Any]]:
+        records = [r for r in self.tables[model] if self._match(model, r, domain)]
+        if order:
+            for part in reversed(order.split(",")):
+                field, _, direction = part.strip().partition(" ")
+                descending = direction.strip().lower() == "desc"
+                records.sort(key=lambda r, f=field: _sort_key(r.get(f)), reverse=descending)
+        return _page(records, offset, limit)
+
+    def _match(self, model: str, record: dict[str, Any], domain: list[Any]) -> bool:
+        # Domains are in Polish notation; evaluate right to left with a stack.
+        stack: list[bool] = []
+        for term in reversed(domain):
+            if term == "!":
+                stack.append(not stack.pop())
+            elif term in ("&", "|"):
+                first, second = stack.pop(), stack.pop()
+                stack.append(first and second if term == "&" else first or second)
+            else:
+                field, operator, value = term
+                stack.append(_compare(self._value(model, record, field), operator, value))
+        return all(stack)
+
+    def _value(self, model: str, record: dict[str, Any], path: str) -> Any:
+        field, _, rest = path.partition(".")
+        value = record.get(field, False)
+        if not rest:
+            return value
+        comodel = RELATIONS.get(model, {}).get(field)
+        target = self._by_id.get(comodel or "", {}).get(_id(value))
+        return self._value(comodel or "", target, rest) if target else False
+
+    def _groups(
+        self, model: str, domain: list[Any], groupby: list[str]
+    ) -> list[tuple[tuple[Any, ...], list[dict[str, Any]]]]:
+        groups: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        keys: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+        for record in self._search(model, domain):
+            key = tuple(_group_value(record, spec) for spec in groupby)
+            hashable = tuple(tuple(v) if isinstance(v, list) else v for v in key)
+            groups.setdefault(hashable, []).append(record)
+            keys.setdefault(hashable, key)
+        return [(keys[k], records) for k, records in groups.items()]
+
+    def _view(self, model: str, view_id: int | bool, view_type: str) -> dict[str, Any]:
+        if view_id:
+            view = self._by_id["ir.ui.view"].get(int(view_id))
+        else:
+            view_type = "list" if view_type == "tree" else view_type
+            view = next(
+                (
+                    v
+                    for v in self.tables["ir.ui.view"]
+                    if v["model"] == model and v["type"] == view_type and not v["inherit_id"]
+                ),
+                None,
+            )
+        if view is None:
+            raise FakeOdooError(f"No {view_type} view found for {model}")
+        return view
+
+
+class FakeOdooServer:
+    """Serve a :class:`FakeOdoo` over HTTP on a free local port.
+
+    Use as a context manager; :attr:`url` is the base URL to connect to.
+    *latency* seconds are slept before every response. :attr:`requests`,
+    :attr:`bytes_received` and :attr:`bytes_sent` count the traffic.
+    """
+
+    def __init__(self, odoo: FakeOdoo, latency: float = 0.0) -> None:
+        self.odoo = odoo
+        self.latency = latency
+        self.requests = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("Server not started.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> FakeOdooServer:
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _handler_class(self))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def counters(self) -> tuple[int, int, int]:
+        """Return ``(requests, bytes_received, bytes_sent)`` so far."""
+        with self._lock:
+            return self.requests, self.bytes_received, self.bytes_sent
+
+    def __enter__(self) -> FakeOdooServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def handle(self, path: str, body: bytes) -> tuple[bytes, str]:
+        if self.latency:
+            time.sleep(self.latency)
+        if path == "/jsonrpc":
+            response, content_type = self._handle_json(body), "application/json"
+        elif path.startswith("/xmlrpc/2/"):
+            response = self._handle_xml(path.rsplit("/", 1)[1], body)
+            content_type = "text/xml"
+        else:
+            raise FakeOdooError(f"Unknown endpoint {path}")
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += len(body)
+            self.bytes_sent += len(response)
+        return response, content_type
+
+    def _handle_json(self, body: bytes) -> bytes:
+        request = json.loads(body)
+        params = request.get("params", {})
+        try:
+            result = self.odoo.dispatch(params["service"], params["method"], params["args"])
+            payload = {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+        except FakeOdooError as exc:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {
+                    "code": 200,
+                    "message": "Odoo Server Error",
+                    "data": {"name": type(exc).__name__, "message": str(exc)},
+                },
+            }
+        return json.dumps(payload).encode("utf-8")
+
+    def _handle_xml(self, service: str, body: bytes) -> bytes:
+        args, method = xmlrpc.client.loads(body)
+        try:
+            result = self.odoo.dispatch(service, method or "", list(args))
+            response = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        except FakeOdooError as exc:
+            response = xmlrpc.client.dumps(xmlrpc.client.Fault(1, str(exc)), allow_none=True)
+        return response.encode("utf-8")
+
+
+def _handler_class(server: FakeOdooServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real Odoo behind a proxy
+        # Headers and body go out in separate writes; without TCP_NODELAY the
+        # client's delayed ACK would add ~40 ms to every call.
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                response, content_type = server.handle(self.path, body)
+            except FakeOdooError as exc:
+                self.send_error(404, str(exc))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # keep benchmark output clean
+
+    return Handler
+
+
+def _project(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    if not fields:
+        return dict(record)
+    return {"id": record["id"], **{f: record.get(f, False) for f in fields}}
+
+
+def _page(rows: list[Any], offset: int, limit: int | None) -> list[Any]:
+    return rows[offset : offset + limit if limit else None]
+
+
+def _id(value: Any) -> Any:
+    return value[0] if isinstance(value, (list, tuple)) and value else value
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    value = _id(value)
+    if value is False or value is None:
+        return (0, "")
+    return (1, value) if isinstance(value, (int, float)) else (2, str(value))
+
+
+def _compare(actual: Any, operator: str, value: Any) -> bool:
+    if operator in ("like", "ilike", "not like", "not ilike", "=like", "=ilike"):
+        text = actual[1] if isinstance(actual, list) and len(actual) == 2 else actual
+        found = str(value).lower() in str(text or "").lower()
+        return not found if operator.startswith("not") else found
+    if isinstance(actual, list) and not (isinstance(value, list) and operator in ("=", "!=")):
+        actual = _id(actual) if actual else False
+    if operator in ("=", "child_of", "parent_of"):
+        return actual == value or (value is False and not actual)
+    if operator in ("!=", "<>"):
+        return actual != value
+    if operator == "in":
+        return actual in value or (isinstance(actual, list) and any(a in value for a in actual))
+    if operator == "not in":
+        return actual not in value
+    if actual is False or actual is None:
+        return False
+    if operator == ">":
+        return bool(actual > value)
+    if operator == "<":
+        return bool(actual < value)
+    if operator == ">=":
+        return bool(actual >= value)
+    if operator == "<=":
+        return bool(actual <= value)
+    raise FakeOdooError(f"Unsupported domain operator {operator!r}")
+
+
+def _group_value(record: dict[str, Any], spec: str) -> Any:
+    field, _, granularity = spec.partition(":")
+    value = record.get(field, False)
+    if granularity and isinstance(value, str):
+        return value[: {"year": 4, "month": 7}.get(granularity, 10)]
+    return value
+
+
+def _aggregate(func: str, values: list[Any]) -> Any:
+    numbers = [v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+    if func == "count":
+        return len([v for v in values if v not in (False, None)])
+    if func == "count_distinct":
+        return len({_id(v) for v in values if v not in (False, None)})
+    if not numbers:
+        return False
+    if func == "avg":
+        return sum(numbers) / len(numbers)
+    if func == "min":
+        return min(numbers)
+    if func == "max":
+        return max(numbers)
+    return sum(numbers)
@@ -34,7 +34,9 @@ def _main(
 
 
 # Import commands so they register with the app
+from odoo_boost.cli.bench import bench  # noqa: E402
 from odoo_boost.cli.check import check  # noqa: E402
+from odoo_boost.cli.daemon import daemon  # noqa: E402
 from odoo_boost.cli.install import install  # noqa: E402
 from odoo_boost.cli.mcp_cmd import mcp  # noqa: E402
 from odoo_boost.cli.update import update  # noqa: E402
@@ -43,6 +45,8 @@ app.command()(check)
 app.command()(install)
 app.command()(update)
 app.command(name="mcp")(mcp)
+app.command()(bench)
+app.command()(daemon)
 
 
 def main() -> None:
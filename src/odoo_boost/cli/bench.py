@@ -0,0 +1,83 @@
+"""odoo-boost bench – benchmark the MCP tools against a local fake Odoo server."""
+
+from __future__ import annotations
+
+import json
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from odoo_boost.bench import BenchSizes, run_benchmark
+
+console = Console()
+
+
+def bench(
+    protocol: str = typer.Option("jsonrpc", help="RPC protocol: xmlrpc or jsonrpc"),
+    iterations: int = typer.Option(20, min=1, help="Calls per tool"),
+    models: int = typer.Option(200, min=1, help="Number of synthetic models"),
+    fields: int = typer.Option(30, min=1, help="Fields per model"),
+    views: int = typer.Option(4, min=1, help="Views per model"),
+    modules: int = typer.Option(80, min=1, help="Number of installed modules"),
+    records: int = typer.Option(2000, min=1, help="Number of res.partner records"),
+    latency: float = typer.Option(0.0, min=0.0, help="Simulated server latency per RPC (ms)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Disable the metadata and read caches"),
+    tool: list[str] | None = typer.Option(None, "--tool", "-t", help="Only run these tools"),
+    server_version: str = typer.Option("18.0", help="Odoo version the fake server reports"),
+    as_json: bool = typer.Option(False, "--json", help="Print results as JSON"),
+) -> None:
+    """Benchmark every MCP tool against a local fake Odoo server with synthetic data."""
+    if protocol not in ("xmlrpc", "jsonrpc"):
+        console.print(f"[red]Unknown protocol '{protocol}'. Use xmlrpc or jsonrpc.[/]")
+        raise typer.Exit(1)
+
+    sizes = BenchSizes(
+        models=models,
+        fields_per_model=fields,
+        views_per_model=views,
+        modules=modules,
+        records=records,
+    )
+    try:
+        results = run_benchmark(
+            protocol=protocol,  # type: ignore[arg-type]
+            iterations=iterations,
+            sizes=sizes,
+            latency=latency / 1000,
+            cache=not no_cache,
+            tools=tool or None,
+            server_version=server_version,
+        )
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/]")
+        raise typer.Exit(1) from None
+
+    if as_json:
+        typer.echo(json.dumps([stats.as_dict() for stats in results], indent=2))
+        return
+
+    table = Table(title=f"odoo-boost bench ({protocol}, {iterations} calls per tool)")
+    table.add_column("Tool", style="cyan")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("RPCs", justify="right")
+    table.add_column("Sent B", justify="right")
+    table.add_column("Recv B", justify="right")
+    table.add_column("Encode ms", justify="right")
+    table.add_column("Result B", justify="right")
+    table.add_column("Errors", justify="right")
+    for stats in results:
+        table.add_row(
+            stats.tool,
+            f"{stats.p50_ms:.2f}",
+            f"{stats.p95_ms:.2f}",
+            f"{stats.rpc_count:g}",
+            f"{stats.bytes_sent:,}",
+            f"{stats.bytes_received:,}",
+            f"{stats.serialize_ms:.3f}",
+            f"{stats.response_bytes:,}",
+            f"[red]{stats.errors}[/]" if stats.errors else "0",
+        )
+    console.print(table)
+    console.print("[dim]Sizes and RPC counts are averages per call.[/]")
@@ -0,0 +1,68 @@
+"""odoo-boost daemon – run or control the shared MCP daemon of a config."""
+
+from __future__ import annotations
+
+import os
+import signal
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from odoo_boost.config.settings import find_config_path, load_config
+
+console = Console(stderr=True)
+
+
+def daemon(
+    config: Path | None = typer.Option(None, "--config", "-c", help="Path to odoo-boost.json"),
+    status: bool = typer.Option(False, "--status", help="Show whether the daemon is running"),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon"),
+) -> None:
+    """Run the shared MCP daemon in the foreground ('odoo-boost mcp' starts it on demand)."""
+    config_path = config or find_config_path()
+    try:
+        cfg = load_config(config_path)
+    except FileNotFoundError:
+        console.print("[red]No odoo-boost.json found. Run 'odoo-boost install' first.[/]")
+        raise typer.Exit(1) from None
+    assert config_path is not None
+
+    from odoo_boost.mcp_server.daemon import (
+        DaemonError,
+        daemon_paths,
+        daemon_pid,
+        serve_daemon,
+        supports_daemon,
+    )
+
+    if not supports_daemon():
+        console.print("[red]The MCP daemon needs Unix domain sockets (not available here).[/]")
+        raise typer.Exit(1)
+    paths = daemon_paths(config_path, cfg)
+    pid = daemon_pid(paths)
+
+    if status or stop:
+        if pid is None:
+            console.print(f"Daemon not running [dim]({paths.socket})[/]")
+            return
+        if stop:
+            os.kill(pid, signal.SIGTERM)
+            console.print(f"Stopped daemon (pid {pid})")
+        else:
+            console.print(f"Daemon running (pid {pid}) on [cyan]{paths.socket}[/]")
+        return
+
+    if pid is not None:
+        console.print(f"[yellow]Daemon already running (pid {pid}) on {paths.socket}[/]")
+        raise typer.Exit(1)
+
+    from odoo_boost.mcp_server.server import create_mcp_server
+
+    console.print(f"[dim]Starting Odoo Boost MCP daemon on {paths.socket}…[/]")
+    server = create_mcp_server(cfg)
+    try:
+        serve_daemon(server, paths, cfg.server.idle_timeout)
+    except DaemonError as exc:
+        console.print(f"[red]{exc}[/]")
+        raise typer.Exit(1) from None
@@ -1,29 +1,84 @@
-"""odoo-boost mcp – start MCP server via stdio."""
+"""odoo-boost mcp – start MCP server via stdio or HTTP."""
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
-from odoo_boost.config.settings import load_config
+from odoo_boost.config.settings import find_config_path, load_config
 
 console = Console(stderr=True)
 
+# server.transport value -> FastMCP transport name
+_TRANSPORTS = {"stdio": "stdio", "http": "streamable-http", "sse": "sse"}
+_LOOPBACK = {"127.0.0.1", "localhost", "::1"}
+
 
 def mcp(
     config: Path | None = typer.Option(None, "--config", "-c", help="Path to odoo-boost.json"),
+    no_daemon: bool = typer.Option(
+        False, "--no-daemon", help="Serve from this process instead of the shared daemon"
+    ),
+    transport: str | None = typer.Option(
+        None, "--transport", help="stdio, http or sse (overrides server.transport)"
+    ),
+    host: str | None = typer.Option(None, "--host", help="Bind address (overrides server.host)"),
+    port: int | None = typer.Option(None, "--port", help="Port (overrides server.port)"),
 ) -> None:
-    """Start the MCP server (stdio transport)."""
+    """Start the MCP server (stdio by default, or HTTP for many clients).
+
+    With the stdio transport this connects to the shared background daemon
+    for the config (starting it if needed) and relays stdio to it.
+    """
+    config_path = config or find_config_path()
     try:
-        cfg = load_config(config)
+        cfg = load_config(config_path)
     except FileNotFoundError:
         console.print("[red]No odoo-boost.json found. Run 'odoo-boost install' first.[/]")
         raise typer.Exit(1) from None
 
+    if transport is not None and transport not in _TRANSPORTS:
+        console.print(f"[red]Unknown transport '{transport}'. Use stdio, http or sse.[/]")
+        raise typer.Exit(1)
+    # The daemon is keyed by the config as saved on disk (it loads the file
+    # itself), so the command line overrides only apply to this process.
+    overrides = {"transport": transport, "host": host, "port": port}
+    server_cfg = cfg.server.model_copy(
+        update={key: value for key, value in overrides.items() if value is not None}
+    )
+
+    if server_cfg.transport == "stdio":
+        from odoo_boost.mcp_server.daemon import (
+            DaemonError,
+            bridge,
+            connect_daemon,
+            supports_daemon,
+        )
+
+        if cfg.server.daemon and not no_daemon and config_path and supports_daemon():
+            try:
+                sock = connect_daemon(config_path, cfg)
+            except DaemonError as exc:
+                console.print(f"[yellow]{exc}; serving from this process instead.[/]")
+            else:
+                bridge(sock, sys.stdin.buffer, sys.stdout.buffer)
+                return
+
     from odoo_boost.mcp_server.server import create_mcp_server
 
     console.print("[dim]Starting Odoo Boost MCP server…[/]")
-    server = create_mcp_server(cfg)
-    server.run(transport="stdio")
+    server = create_mcp_server(cfg.model_copy(update={"server": server_cfg}))
+    if server_cfg.transport != "stdio":
+        path = server.settings.streamable_http_path
+        if server_cfg.transport == "sse":
+            path = server.settings.sse_path
+        console.print(f"Serving MCP on [cyan]http://{server_cfg.host}:{server_cfg.port}{path}[/]")
+        if server_cfg.host not in _LOOPBACK:
+            console.print(
+                "[yellow]The MCP endpoint has no authentication; anyone who can reach "
+                "it can use the Odoo credentials in odoo-boost.json.[/]"
+            )
+    server.run(transport=_TRANSPORTS[server_cfg.transport])  # type: ignore[arg-type]
@@ -8,7 +8,9 @@ import typer
 from rich.console import Console
 
 from odoo_boost.agents import AGENTS
+from odoo_boost.config.schema import OdooBoostConfig
 from odoo_boost.config.settings import load_config
+from odoo_boost.connection.factory import create_connection
 
 console = Console()
 
@@ -32,13 +34,19 @@ def update(
     if not cfg.generate_ai_files:
         console.print("  [dim]AI file generation disabled[/]")
 
+    installed_modules = None
+    if cfg.generate_ai_files and cfg.guidelines.token_budget:
+        installed_modules = _installed_modules(cfg)
+
     for agent_id in cfg.agents:
         agent_cls = AGENTS.get(agent_id)
         if agent_cls is None:
             console.print(f"  [yellow]Unknown agent '{agent_id}', skipping.[/]")
             continue
 
-        agent = agent_cls(config=cfg, project_path=project_path)
+        agent = agent_cls(
+            config=cfg, project_path=project_path, installed_modules=installed_modules
+        )
         created = agent.install()
         for p in created:
             try:
@@ -48,3 +56,17 @@ def update(
             console.print(f"  [green]Updated[/] {rel}")
 
     console.print("\n[green]Update complete![/]")
+
+
+def _installed_modules(cfg: OdooBoostConfig) -> list[str] | None:
+    """Return the installed module names, or None if the instance is unreachable."""
+    try:
+        conn = create_connection(cfg.connection)
+        conn.authenticate()
+        modules = conn.search_read(
+            "ir.module.module", [("state", "=", "installed")], fields=["name"]
+        )
+    except Exception as exc:
+        console.print(f"  [yellow]Cannot read installed modules ({exc}); using all sections.[/]")
+        return None
+    return [module["name"] for module in modules]
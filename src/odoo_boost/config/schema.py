@@ -14,7 +14,76 @@ class OdooConnection(BaseModel):
     database: str = Field(description="Database name")
     username: str = Field(default="admin", description="Login username")
     password: str = Field(default="admin", description="Login password or API key")
-    protocol: Literal["xmlrpc"] = Field(default="xmlrpc", description="Connection protocol")
+    protocol: Literal["xmlrpc", "jsonrpc"] = Field(
+        default="xmlrpc", description="Connection protocol ('xmlrpc' or 'jsonrpc')"
+    )
+    pool_size: int = Field(
+        default=10, ge=1, description="Maximum number of pooled keep-alive HTTP connections"
+    )
+    pool_idle_timeout: float = Field(
+        default=60.0, gt=0, description="Seconds an idle pooled connection is kept open"
+    )
+    coalesce_reads: bool = Field(
+        default=True,
+        description="Send identical concurrent read-only RPCs once and share the result",
+    )
+    read_cache_ttl: float = Field(
+        default=2.0,
+        ge=0,
+        description="Seconds a read-only RPC result is reused by identical calls (0 = off)",
+    )
+
+
+class CacheConfig(BaseModel):
+    """Metadata cache settings for the MCP server."""
+
+    enabled: bool = Field(default=True, description="Cache model/field/module metadata")
+    max_entries: int = Field(default=256, ge=1, description="Maximum cached tool results (LRU)")
+    check_interval: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds between write_date checks that invalidate the cache",
+    )
+    persist: bool = Field(
+        default=True, description="Keep an on-disk snapshot shared across server restarts"
+    )
+    directory: str | None = Field(
+        default=None,
+        description="Snapshot directory (defaults to $XDG_CACHE_HOME/odoo-boost)",
+    )
+
+
+class GuidelinesConfig(BaseModel):
+    """Settings for the generated agent guideline files."""
+
+    token_budget: int = Field(
+        default=0,
+        ge=0,
+        description="Approximate maximum size of the guidelines file in tokens (0 = full set)",
+    )
+
+
+class ServerConfig(BaseModel):
+    """How ``odoo-boost mcp`` serves the MCP tools."""
+
+    daemon: bool = Field(
+        default=True,
+        description="Share one background server per config between all agents (Unix socket)",
+    )
+    idle_timeout: float = Field(
+        default=900.0,
+        ge=0,
+        description="Seconds without connected agents before the daemon exits (0 = never)",
+    )
+    transport: Literal["stdio", "http", "sse"] = Field(
+        default="stdio",
+        description="'stdio' (one agent per process), 'http' (streamable HTTP) or 'sse'",
+    )
+    host: str = Field(default="127.0.0.1", description="Bind address for the http/sse transports")
+    port: int = Field(default=8000, ge=1, le=65535, description="Port for the http/sse transports")
+    max_concurrency: int = Field(
+        default=16, ge=1, description="Maximum number of tool calls executed at the same time"
+    )
 
 
 class OdooBoostConfig(BaseModel):
@@ -33,3 +102,26 @@ class OdooBoostConfig(BaseModel):
     generate_ai_files: bool = Field(
         default=True, description="Generate AI guideline and skill files for agents"
     )
+    cache: CacheConfig = Field(default_factory=CacheConfig, description="Metadata cache settings")
+    guidelines: GuidelinesConfig = Field(
+        default_factory=GuidelinesConfig, description="Guideline file generation settings"
+    )
+    server: ServerConfig = Field(
+        default_factory=ServerConfig, description="MCP server process settings"
+    )
+    output_format: Literal["pretty", "compact", "columnar"] = Field(
+        default="compact",
+        description="Default MCP tool response encoding ('pretty', 'compact' or 'columnar')",
+    )
+    log_file: str | None = Field(
+        default=None,
+        description="Odoo log file or glob incl. rotated files (e.g. /var/log/odoo/odoo.log*)",
+    )
+    metrics_file: str | None = Field(
+        default=None,
+        description="Append one JSON line per MCP tool call (timings, RPCs, bytes) to this file",
+    )
+    export_dir: str | None = Field(
+        default=None,
+        description="Directory for export_records files (defaults to $XDG_CACHE_HOME/odoo-boost/exports)",
+    )
@@ -1,6 +1,13 @@
 """Odoo connection layer."""
 
-from odoo_boost.connection.base import OdooConnection
-from odoo_boost.connection.factory import create_connection
+from odoo_boost.connection.base import AsyncOdooConnection, OdooConnection, RpcCall, RpcObserver
+from odoo_boost.connection.factory import create_async_connection, create_connection
 
-__all__ = ["OdooConnection", "create_connection"]
+__all__ = [
+    "AsyncOdooConnection",
+    "OdooConnection",
+    "RpcCall",
+    "RpcObserver",
+    "create_async_connection",
+    "create_connection",
+]
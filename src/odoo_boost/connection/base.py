@@ -1,10 +1,126 @@
-"""Abstract connection interface for Odoo."""
+"""Abstract connection interfaces for Odoo (sync and async)."""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import re
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
+import httpx
+
+
+def _derived_count(records: list[dict[str, Any]], limit: int | None, offset: int) -> int | None:
+    """Return the total match count if it follows from the page alone, else None.
+
+    A page shorter than *limit* is the last one, so the total is simply
+    ``offset + len(records)`` (an empty page past the end proves nothing).
+    """
+    if limit is None or (len(records) < limit and (records or offset == 0)):
+        return offset + len(records)
+    return None
+
+
+def _search_read_kwargs(
+    fields: list[str] | None,
+    limit: int | None,
+    offset: int,
+    order: str | None,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"offset": offset}
+    if fields is not None:
+        kwargs["fields"] = fields
+    if limit is not None:
+        kwargs["limit"] = limit
+    if order is not None:
+        kwargs["order"] = order
+    return kwargs
+
+
+# ORM methods without side effects. Identical calls to them that overlap, or
+# follow each other within the read cache TTL, share one round trip.
+READ_ONLY_METHODS = frozenset(
+    {
+        "search",
+        "search_read",
+        "search_count",
+        "read",
+        "name_search",
+        "fields_get",
+        "default_get",
+        "read_group",
+        "formatted_read_group",
+        "get_views",
+        "fields_view_get",
+    }
+)
+
+DEFAULT_READ_CACHE_TTL = 2.0
+_READ_CACHE_MAX_ENTRIES = 256
+# Size bounds of the read cache in rows (list items, or keys of a dict result):
+# in total, and per result. Larger results are not cached at all.
+_READ_CACHE_MAX_ROWS = 20_000
+_READ_CACHE_MAX_RESULT_ROWS = 1_000
+
+# Set by AsyncOdooConnection.bypass_read_cache() for bulk readers.
+_bypass_read_cache: ContextVar[bool] = ContextVar("odoo_boost_bypass_read_cache", default=False)
+
+
+def _call_key(model: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    return json.dumps([model, method, args, kwargs], sort_keys=True, default=str)
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # Mark a shared call's error as seen even if every caller was cancelled.
+    if not task.cancelled():
+        task.exception()
+
+
+# Keys of legacy read_group rows that only matter to the web client.
+_READ_GROUP_INTERNAL_KEYS = ("__domain", "__context", "__range", "__fold", "__extra_domain")
+
+
+def _major_version(version_info: dict[str, Any]) -> int:
+    """Return the major version from ``server_serie`` ('18.0', 'saas~17.4' ...)."""
+    match = re.search(r"\d+", str(version_info.get("server_serie", "")))
+    if match:
+        return int(match.group())
+    return int(version_info.get("server_version_info", [0])[0])
+
+
+def _legacy_aggregate(spec: str) -> tuple[str, str]:
+    """Map ``field:agg`` to a read_group ``alias:agg(field)`` spec and its result key."""
+    field, _, func = spec.partition(":")
+    alias = f"{field}__{func or 'sum'}"
+    return f"{alias}:{func or 'sum'}({field})", alias
+
+
+@dataclass(frozen=True)
+class RpcCall:
+    """One RPC round trip as reported to an :data:`RpcObserver`.
+
+    ``model`` and ``orm_method`` are set for ``object.execute_kw`` calls;
+    ``error`` holds the exception class name when the call failed.
+    """
+
+    service: str
+    method: str
+    model: str | None
+    orm_method: str | None
+    seconds: float
+    request_bytes: int
+    response_bytes: int
+    error: str | None = None
+
+
+RpcObserver = Callable[[RpcCall], None]
+
 
 class OdooConnection(ABC):
     """Abstract base class for Odoo connections."""
@@ -51,3 +167,328 @@ class OdooConnection(ABC):
     @abstractmethod
     def uid(self) -> int:
         """Return the authenticated user ID."""
+
+
+class AsyncOdooConnection(ABC):
+    """Abstract base class for non-blocking Odoo connections.
+
+    Mirrors :class:`OdooConnection`, but every RPC is a coroutine so a
+    caller waiting on the network does not block the event loop.
+    """
+
+    _server_major: int | None = None
+    _observer: RpcObserver | None = None
+    _coalesce_reads: bool = False
+    _read_cache_ttl: float = 0.0
+    coalesced_reads = 0
+    cached_reads = 0
+
+    @abstractmethod
+    async def authenticate(self) -> int:
+        """Authenticate and return the user ID."""
+
+    @abstractmethod
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute an ORM method on a model."""
+
+    @abstractmethod
+    async def get_version(self) -> dict[str, Any]:
+        """Return server version info."""
+
+    @property
+    @abstractmethod
+    def uid(self) -> int:
+        """Return the authenticated user ID."""
+
+    async def aclose(self) -> None:
+        """Release network resources (pooled connections)."""
+        return None
+
+    def _init_shared_reads(self, coalesce: bool, ttl: float) -> None:
+        """Enable single-flight reads (*coalesce*) and a *ttl* second read cache.
+
+        Called by the concrete clients, whose :meth:`execute` routes through
+        :meth:`_execute_shared`. Results are shared between callers, so they
+        must be treated as read-only.
+        """
+        self._coalesce_reads = coalesce
+        self._read_cache_ttl = ttl
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        # key -> (expires, rows, result); insertion order is expiry order
+        self._read_cache: dict[str, tuple[float, int, Any]] = {}
+        self._read_cache_rows = 0
+        self._read_generation = 0
+
+    @contextlib.contextmanager
+    def bypass_read_cache(self) -> Iterator[None]:
+        """Send reads made inside the block (and in tasks started there) straight to Odoo.
+
+        For bulk readers such as ``export_records``, whose large results are
+        never asked for again and should not be held in memory.
+        """
+        token = _bypass_read_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_read_cache.reset(token)
+
+    async def _execute_shared(
+        self,
+        model: str,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Await *call()*, sharing the result of identical read-only calls.
+
+        An identical call already in flight is joined instead of sent again,
+        and a result younger than the read cache TTL is returned directly.
+        Any other method may change data, so before and after it the read
+        cache is emptied and reads in flight are no longer joined.
+        """
+        if method not in READ_ONLY_METHODS:
+            self._forget_reads()
+            try:
+                return await call()
+            finally:
+                self._forget_reads()
+        if _bypass_read_cache.get() or not (self._coalesce_reads or self._read_cache_ttl):
+            return await call()
+
+        self._purge_expired_reads()
+        key = _call_key(model, method, args, kwargs)
+        cached = self._read_cache.get(key)
+        if cached is not None:
+            self.cached_reads += 1
+            return cached[2]
+        if not self._coalesce_reads:
+            return await self._load_shared(key, call)
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            # A task of its own, so a cancelled caller does not cancel the others.
+            task = asyncio.ensure_future(self._load_shared(key, call))
+            task.add_done_callback(_retrieve_exception)
+            self._inflight[key] = task
+        else:
+            self.coalesced_reads += 1
+        return await asyncio.shield(task)
+
+    def _forget_reads(self) -> None:
+        # Reads still in flight finish for their callers but are not cached
+        self._read_generation += 1
+        self._read_cache.clear()
+        self._read_cache_rows = 0
+        self._inflight.clear()
+
+    async def _load_shared(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._read_generation
+        try:
+            value = await call()
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        # Skip caching if a write happened while the read was in flight
+        if self._read_cache_ttl and generation == self._read_generation:
+            self._cache_read(key, value)
+        return value
+
+    def _cache_read(self, key: str, value: Any) -> None:
+        rows = len(value) if isinstance(value, (list, dict)) else 1
+        if rows > _READ_CACHE_MAX_RESULT_ROWS:
+            return
+        self._drop_read(key)
+        self._purge_expired_reads()
+        while self._read_cache and (
+            len(self._read_cache) >= _READ_CACHE_MAX_ENTRIES
+            or self._read_cache_rows + rows > _READ_CACHE_MAX_ROWS
+        ):
+            self._drop_read(next(iter(self._read_cache)))
+        self._read_cache[key] = (time.monotonic() + self._read_cache_ttl, rows, value)
+        self._read_cache_rows += rows
+
+    def _purge_expired_reads(self) -> None:
+        # The TTL is fixed, so the oldest entries expire first
+        now = time.monotonic()
+        while self._read_cache:
+            key, (expires, _rows, _value) = next(iter(self._read_cache.items()))
+            if expires > now:
+                break
+            self._drop_read(key)
+
+    def _drop_read(self, key: str) -> None:
+        entry = self._read_cache.pop(key, None)
+        if entry is not None:
+            self._read_cache_rows -= entry[1]
+
+    def reset_read_stats(self) -> None:
+        """Zero the ``coalesced_reads`` and ``cached_reads`` counters."""
+        self.coalesced_reads = 0
+        self.cached_reads = 0
+
+    def set_observer(self, observer: RpcObserver | None) -> None:
+        """Report every RPC round trip to *observer* (None to stop reporting)."""
+        self._observer = observer
+
+    def _notify(
+        self,
+        service: str,
+        method: str,
+        args: tuple[Any, ...],
+        started: float,
+        response: httpx.Response | None,
+        error: BaseException | None,
+    ) -> None:
+        """Report a finished ``_call`` to the observer; called by the concrete clients."""
+        if self._observer is None:
+            return
+        execute_kw = service == "object" and method == "execute_kw" and len(args) > 4
+        self._observer(
+            RpcCall(
+                service=service,
+                method=method,
+                model=args[3] if execute_kw else None,
+                orm_method=args[4] if execute_kw else None,
+                seconds=time.perf_counter() - started,
+                request_bytes=len(response.request.content) if response is not None else 0,
+                response_bytes=len(response.content) if response is not None else 0,
+                error=type(error).__name__ if error is not None else None,
+            )
+        )
+
+    async def search_read(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+        fields: list[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        order: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Convenience wrapper for search_read."""
+        kwargs = _search_read_kwargs(fields, limit, offset, order)
+        return await self.execute(model, "search_read", domain or [], **kwargs)  # type: ignore[no-any-return]
+
+    async def search_count(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+    ) -> int:
+        """Return the count of records matching *domain*."""
+        return await self.execute(model, "search_count", domain or [])  # type: ignore[no-any-return]
+
+    async def search_read_with_count(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+        fields: list[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        order: str | None = None,
+        exact_count: bool = True,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Return one page of records together with the total match count.
+
+        When the page comes back shorter than *limit* the total is derived
+        from it, so no ``search_count`` round-trip is made. Otherwise the
+        count is fetched, unless *exact_count* is False, in which case the
+        total is returned as None.
+        """
+        records = await self.search_read(
+            model, domain=domain, fields=fields, limit=limit, offset=offset, order=order
+        )
+        total = _derived_count(records, limit, offset)
+        if total is None and exact_count:
+            total = await self.search_count(model, domain=domain)
+        return records, total
+
+    async def server_major_version(self) -> int:
+        """Return the server's major version (17, 18, 19 ...), fetched once."""
+        if self._server_major is None:
+            self._server_major = _major_version(await self.get_version())
+        return self._server_major
+
+    async def read_group(
+        self,
+        model: str,
+        domain: list[Any] | None = None,
+        groupby: list[str] | None = None,
+        aggregates: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Group and aggregate records on the server.
+
+        *groupby* entries are field names, optionally with a date granularity
+        (``date_order:month``); *aggregates* are ``field:function`` specs
+        (``amount_total:sum``). Odoo 19+ is queried with
+        ``formatted_read_group``; older versions with ``read_group(lazy=False)``.
+        Either way each returned row maps every groupby and aggregate spec to
+        its value, plus ``__count`` for the number of records in the group.
+        """
+        groupby = list(groupby or [])
+        aggregates = [spec for spec in aggregates or [] if spec != "__count"]
+        kwargs: dict[str, Any] = {"offset": offset}
+        if limit is not None:
+            kwargs["limit"] = limit
+
+        if await self.server_major_version() >= 19:
+            if order:
+                kwargs["order"] = order
+            rows = await self.execute(
+                model,
+                "formatted_read_group",
+                domain or [],
+                groupby=groupby,
+                aggregates=[*aggregates, "__count"],
+                **kwargs,
+            )
+            return [
+                {k: v for k, v in row.items() if k not in _READ_GROUP_INTERNAL_KEYS} for row in rows
+            ]
+
+        if order:
+            kwargs["orderby"] = order
+        legacy = [_legacy_aggregate(spec) for spec in aggregates]
+        rows = await self.execute(
+            model,
+            "read_group",
+            domain or [],
+            [field_spec for field_spec, _ in legacy],
+            groupby,
+            lazy=False,
+            **kwargs,
+        )
+        return [
+            {
+                **{spec: row.get(spec) for spec in groupby},
+                **{
+                    spec: row.get(alias)
+                    for spec, (_, alias) in zip(aggregates, legacy, strict=True)
+                },
+                "__count": row.get("__count"),
+            }
+            for row in rows
+        ]
+
+    async def gather(
+        self,
+        *calls: Awaitable[Any],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Await independent *calls* concurrently and return their results in order.
+
+        A tool making several unrelated queries waits for the slowest one
+        instead of the sum of all of them. With *return_exceptions*, a
+        failing call yields its exception in place of a result instead of
+        raising.
+        """
+        return list(await asyncio.gather(*calls, return_exceptions=return_exceptions))
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from odoo_boost.config.schema import OdooConnection as OdooConnectionConfig
-from odoo_boost.connection.base import OdooConnection
-from odoo_boost.connection.xmlrpc import XmlRpcConnection
+from odoo_boost.connection.base import AsyncOdooConnection, OdooConnection
+from odoo_boost.connection.jsonrpc import AsyncJsonRpcConnection, JsonRpcConnection
+from odoo_boost.connection.transport import create_http_client
+from odoo_boost.connection.xmlrpc import AsyncXmlRpcConnection, XmlRpcConnection
 
 
 def create_connection(config: OdooConnectionConfig) -> OdooConnection:
@@ -15,5 +17,41 @@ def create_connection(config: OdooConnectionConfig) -> OdooConnection:
             database=config.database,
             username=config.username,
             password=config.password,
+            client=create_http_client(config.pool_size, config.pool_idle_timeout),
+        )
+    if config.protocol == "jsonrpc":
+        return JsonRpcConnection(
+            url=config.url,
+            database=config.database,
+            username=config.username,
+            password=config.password,
+            client=create_http_client(config.pool_size, config.pool_idle_timeout),
+        )
+    raise ValueError(f"Unsupported protocol: {config.protocol}")
+
+
+def create_async_connection(config: OdooConnectionConfig) -> AsyncOdooConnection:
+    """Create a non-blocking Odoo connection from configuration."""
+    if config.protocol == "xmlrpc":
+        return AsyncXmlRpcConnection(
+            url=config.url,
+            database=config.database,
+            username=config.username,
+            password=config.password,
+            pool_size=config.pool_size,
+            pool_idle_timeout=config.pool_idle_timeout,
+            coalesce_reads=config.coalesce_reads,
+            read_cache_ttl=config.read_cache_ttl,
+        )
+    if config.protocol == "jsonrpc":
+        return AsyncJsonRpcConnection(
+            url=config.url,
+            database=config.database,
+            username=config.username,
+            password=config.password,
+            pool_size=config.pool_size,
+            pool_idle_timeout=config.pool_idle_timeout,
+            coalesce_reads=config.coalesce_reads,
+            read_cache_ttl=config.read_cache_ttl,
         )
     raise ValueError(f"Unsupported protocol: {config.protocol}")
@@ -0,0 +1,75 @@
+"""Pooled keep-alive HTTP plumbing shared by the RPC connections."""
+
+from __future__ import annotations
+
+import xmlrpc.client
+from typing import Any
+
+import httpx
+
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 60.0
+
+
+def _limits(pool_size: int, idle_timeout: float) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=idle_timeout,
+    )
+
+
+def create_http_client(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+) -> httpx.Client:
+    """Return an :class:`httpx.Client` that keeps up to *pool_size* sockets alive.
+
+    Idle connections are dropped after *idle_timeout* seconds.
+    """
+    return httpx.Client(limits=_limits(pool_size, idle_timeout), timeout=DEFAULT_TIMEOUT)
+
+
+def create_async_http_client(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Async counterpart of :func:`create_http_client`."""
+    return httpx.AsyncClient(limits=_limits(pool_size, idle_timeout), timeout=DEFAULT_TIMEOUT)
+
+
+class HttpxTransport(xmlrpc.client.Transport):
+    """XML-RPC transport that sends requests through a pooled :class:`httpx.Client`.
+
+    The stock :class:`xmlrpc.client.Transport` holds a single socket and
+    reconnects whenever the server closes it. Routing through httpx keeps
+    sockets alive across calls and lets several proxies share one pool.
+    """
+
+    def __init__(self, client: httpx.Client, scheme: str = "http") -> None:
+        super().__init__()
+        self._client = client
+        self._scheme = scheme
+
+    def request(
+        self,
+        host: Any,
+        handler: str,
+        request_body: bytes,
+        verbose: bool = False,
+    ) -> tuple[Any, ...]:
+        url = f"{self._scheme}://{host}{handler}"
+        response = self._client.post(
+            url,
+            content=request_body,
+            headers={"Content-Type": "text/xml", "User-Agent": self.user_agent},
+        )
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                url, response.status_code, response.reason_phrase, dict(response.headers)
+            )
+        parser, unmarshaller = self.getparser()
+        parser.feed(response.content)
+        parser.close()
+        return unmarshaller.close()
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import time
 import xmlrpc.client
 from typing import Any
+from urllib.parse import urlsplit
 
+import httpx
+
+from odoo_boost.connection.base import (
+    DEFAULT_READ_CACHE_TTL,
+    AsyncOdooConnection,
+    _search_read_kwargs,
+)
 from odoo_boost.connection.base import OdooConnection as BaseConnection
+from odoo_boost.connection.transport import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    HttpxTransport,
+    create_async_http_client,
+    create_http_client,
+)
 
 
 class XmlRpcConnection(BaseConnection):
-    """Connects to Odoo via XML-RPC (works on all supported versions)."""
+    """Connects to Odoo via XML-RPC (works on all supported versions).
+
+    Both the ``common`` and ``object`` proxies send their requests through one
+    pooled keep-alive :class:`httpx.Client`, so consecutive calls reuse the
+    same TCP/TLS connection instead of reconnecting every time.
+    """
 
     def __init__(
         self,
@@ -17,22 +38,35 @@ class XmlRpcConnection(BaseConnection):
         database: str,
         username: str,
         password: str,
+        client: httpx.Client | None = None,
     ) -> None:
         self._url = url.rstrip("/")
         self._database = database
         self._username = username
         self._password = password
         self._uid: int | None = None
+        self._client = client
+        self._transport: HttpxTransport | None = None
         self._common: xmlrpc.client.ServerProxy | None = None
         self._object: xmlrpc.client.ServerProxy | None = None
 
     # -- lazy proxy helpers --------------------------------------------------
 
+    @property
+    def _shared_transport(self) -> HttpxTransport:
+        if self._transport is None:
+            if self._client is None:
+                self._client = create_http_client()
+            self._transport = HttpxTransport(self._client, scheme=urlsplit(self._url).scheme)
+        return self._transport
+
     @property
     def _common_proxy(self) -> xmlrpc.client.ServerProxy:
         if self._common is None:
             self._common = xmlrpc.client.ServerProxy(
-                f"{self._url}/xmlrpc/2/common", allow_none=True
+                f"{self._url}/xmlrpc/2/common",
+                transport=self._shared_transport,
+                allow_none=True,
             )
         return self._common
 
@@ -40,7 +74,9 @@ class XmlRpcConnection(BaseConnection):
     def _object_proxy(self) -> xmlrpc.client.ServerProxy:
         if self._object is None:
             self._object = xmlrpc.client.ServerProxy(
-                f"{self._url}/xmlrpc/2/object", allow_none=True
+                f"{self._url}/xmlrpc/2/object",
+                transport=self._shared_transport,
+                allow_none=True,
             )
         return self._object
 
@@ -85,13 +121,7 @@ class XmlRpcConnection(BaseConnection):
         offset: int = 0,
         order: str | None = None,
     ) -> list[dict[str, Any]]:
-        kwargs: dict[str, Any] = {"offset": offset}
-        if fields is not None:
-            kwargs["fields"] = fields
-        if limit is not None:
-            kwargs["limit"] = limit
-        if order is not None:
-            kwargs["order"] = order
+        kwargs = _search_read_kwargs(fields, limit, offset, order)
         return self.execute(model, "search_read", domain or [], **kwargs)
 
     def search_count(
@@ -103,3 +133,120 @@ class XmlRpcConnection(BaseConnection):
 
     def get_version(self) -> dict[str, Any]:
         return self._common_proxy.version()  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        self._transport = None
+        self._common = None
+        self._object = None
+
+
+class AsyncXmlRpcConnection(AsyncOdooConnection):
+    """Non-blocking :class:`XmlRpcConnection` built on :class:`httpx.AsyncClient`.
+
+    Requests are marshalled with :func:`xmlrpc.client.dumps` and posted to
+    the same ``/xmlrpc/2`` endpoints; faults are raised as
+    :class:`xmlrpc.client.Fault` exactly like the sync client. The HTTP
+    client is created lazily, inside the event loop that uses it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        database: str,
+        username: str,
+        password: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        client: httpx.AsyncClient | None = None,
+        coalesce_reads: bool = True,
+        read_cache_ttl: float = DEFAULT_READ_CACHE_TTL,
+    ) -> None:
+        self._url = url.rstrip("/")
+        self._database = database
+        self._username = username
+        self._password = password
+        self._pool_size = pool_size
+        self._pool_idle_timeout = pool_idle_timeout
+        self._uid: int | None = None
+        self._client = client
+        self._init_shared_reads(coalesce_reads, read_cache_ttl)
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_async_http_client(self._pool_size, self._pool_idle_timeout)
+        return self._client
+
+    async def _call(self, service: str, method: str, *args: Any) -> Any:
+        url = f"{self._url}/xmlrpc/2/{service}"
+        body = xmlrpc.client.dumps(args, method, allow_none=True).encode("utf-8")
+        started = time.perf_counter()
+        response: httpx.Response | None = None
+        error: Exception | None = None
+        try:
+            response = await self._http.post(
+                url, content=body, headers={"Content-Type": "text/xml"}
+            )
+            if response.status_code != 200:
+                raise xmlrpc.client.ProtocolError(
+                    url, response.status_code, response.reason_phrase, dict(response.headers)
+                )
+            params, _ = xmlrpc.client.loads(response.content)
+            return params[0]
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._notify(service, method, args, started, response, error)
+
+    async def authenticate(self) -> int:
+        uid = await self._call(
+            "common", "authenticate", self._database, self._username, self._password, {}
+        )
+        if not uid:
+            raise ConnectionError(f"Authentication failed for {self._username}@{self._database}")
+        self._uid = int(uid)
+        return self._uid
+
+    @property
+    def uid(self) -> int:
+        if self._uid is None:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        return self._uid
+
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return await self._execute_shared(
+            model,
+            method,
+            args,
+            kwargs,
+            lambda: self._call(
+                "object",
+                "execute_kw",
+                self._database,
+                self.uid,
+                self._password,
+                model,
+                method,
+                list(args),
+                kwargs or {},
+            ),
+        )
+
+    async def get_version(self) -> dict[str, Any]:
+        return await self._call("common", "version")  # type: ignore[no-any-return]
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,168 @@
+"""Token-budgeted guideline composition tailored to an instance's installed modules."""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Iterable
+
+from odoo_boost.guidelines.composer import GUIDELINES_HEADER
+from odoo_boost.knowledge.corpus import Section, guideline_sections
+
+# Rough size estimate used for budgeting: about four characters per token.
+_CHARS_PER_TOKEN = 4
+
+# A condensed section keeps at most this many lines, each cut at the end of
+# its first sentence (not at abbreviations like "e.g.") or at a dash.
+_CONDENSED_LINES = 3
+_CLAUSE_END = re.compile(r"(?<=[\w)`*]{2}[.!?])\s| — ")
+
+# Modules whose presence means the database serves website/portal pages or
+# ships its own frontend, so OWL, asset and controller guidance is relevant.
+_FRONTEND_MODULES = frozenset({"portal", "point_of_sale", "web_studio", "im_livechat"})
+
+# Section (``document#slug``) or whole-document prefix -> profile tag it requires.
+_SECTION_TAGS = {
+    "guidelines/javascript_owl": "frontend",
+    "guidelines/controllers": "frontend",
+    "guidelines/coding_style#javascript": "frontend",
+}
+
+# Higher priority sections are kept in full first when the budget is tight.
+_PRIORITIES = {
+    "guidelines/odoo_general": 3,
+    "guidelines/orm_best_practices": 3,
+    "guidelines/security": 3,
+    "guidelines/versions": 3,
+    "guidelines/module_structure": 2,
+    "guidelines/views_and_ui": 2,
+    "guidelines/testing": 1,
+    "guidelines/controllers": 1,
+    "guidelines/javascript_owl": 1,
+    "guidelines/coding_style": 0,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Return an approximate token count for *text*."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def module_profile(installed_modules: Iterable[str]) -> frozenset[str]:
+    """Derive the relevance tags (e.g. ``frontend``) from installed module names."""
+    tags = set()
+    for name in installed_modules:
+        if name in _FRONTEND_MODULES or name.startswith("website"):
+            tags.add("frontend")
+    return frozenset(tags)
+
+
+def compose_budgeted_guidelines(
+    version: str | None,
+    token_budget: int,
+    installed_modules: Iterable[str] | None = None,
+) -> str:
+    """Assemble the guidelines that matter for an instance within *token_budget*.
+
+    Sections that need a capability the instance lacks (e.g. OWL and
+    controller guidance on a database without website or portal) are left
+    out. If the rest still exceeds the budget, every section is first
+    included condensed (code examples dropped, bullets cut to their first
+    sentence) in priority order, then upgraded to its full text while the
+    budget allows. Results are cached per (version, profile, budget).
+
+    Args:
+        version: Odoo version string (e.g. '17.0'); None skips the version addendum.
+        token_budget: Approximate maximum size of the result in tokens.
+        installed_modules: Installed module names of the live instance, or None
+            to treat every section as relevant.
+    """
+    profile = module_profile(installed_modules) if installed_modules is not None else None
+    major = version.split(".")[0] if version else None
+    return _compose(major, profile, token_budget)
+
+
+@functools.lru_cache(maxsize=32)
+def _compose(major: str | None, profile: frozenset[str] | None, token_budget: int) -> str:
+    sections = [s for s in guideline_sections(major) if _relevant(s, profile)]
+    budget = token_budget * _CHARS_PER_TOKEN - len(GUIDELINES_HEADER)
+    full = {s.id: _render_size(s, s.text) for s in sections}
+
+    chosen: dict[str, str] = {}
+    if sum(full.values()) <= budget:
+        chosen = {s.id: s.text for s in sections}
+    else:
+        ranked = sorted(sections, key=lambda s: -_priority(s))  # stable: keeps file order
+        condensed = {s.id: _condense(s.text) for s in sections}
+        used = len(_footer(len(sections)))
+        for section in ranked:
+            size = _render_size(section, condensed[section.id])
+            if condensed[section.id] and used + size <= budget:
+                chosen[section.id] = condensed[section.id]
+                used += size
+        for section in ranked:
+            current = chosen.get(section.id, "")
+            extra = full[section.id] - _render_size(section, current)
+            if current != section.text and used + extra <= budget:
+                chosen[section.id] = section.text
+                used += extra
+
+    parts = [GUIDELINES_HEADER]
+    emitted: set[tuple[str, ...]] = set()
+    for section in sections:
+        if section.id not in chosen:
+            continue
+        path = tuple(section.title.split(" > "))
+        for depth in range(1, len(path) + 1):
+            if path[:depth] not in emitted:
+                emitted.add(path[:depth])
+                parts.append(f"{'#' * (depth + 1)} {path[depth - 1]}\n")
+        parts.append(chosen[section.id] + "\n")
+    shortened = sum(1 for s in sections if chosen.get(s.id) != s.text)
+    if shortened:
+        parts.append(_footer(shortened))
+    return "\n".join(parts)
+
+
+def _relevant(section: Section, profile: frozenset[str] | None) -> bool:
+    if profile is None:
+        return True
+    for prefix, tag in _SECTION_TAGS.items():
+        if (section.id == prefix or section.document == prefix) and tag not in profile:
+            return False
+    return True
+
+
+def _priority(section: Section) -> int:
+    for prefix, priority in _PRIORITIES.items():
+        if section.document.startswith(prefix):
+            return priority
+    return 0
+
+
+def _render_size(section: Section, text: str) -> int:
+    # Body plus an allowance for the heading line(s) emitted before it.
+    return len(text) + len(section.title) + 8 if text else 0
+
+
+def _condense(text: str) -> str:
+    """Drop code examples and keep the first few lines, cut to their first clause."""
+    lines = []
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence or not line.strip():
+            continue
+        lines.append(_CLAUSE_END.split(line, maxsplit=1)[0].rstrip(" .:") + ".")
+        if len(lines) == _CONDENSED_LINES:
+            break
+    return "\n".join(lines)
+
+
+def _footer(shortened: int) -> str:
+    return (
+        f"> {shortened} section(s) condensed or left out to fit the token budget. "
+        "Use the `search_guidelines` MCP tool to read any section in full.\n"
+    )
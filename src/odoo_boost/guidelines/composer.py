@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.resources
+import re
 
 _CORE_FILES = [
     "odoo_general.md",
@@ -16,6 +17,12 @@ _CORE_FILES = [
     "coding_style.md",
 ]
 
+GUIDELINES_HEADER = (
+    "# Odoo Development Guidelines\n\n"
+    "> Auto-generated by **Odoo Boost**. "
+    "These guidelines help AI coding agents write idiomatic Odoo code.\n"
+)
+
 
 def _read_resource(subpath: str) -> str:
     """Read a markdown file from the guidelines/core package data."""
@@ -23,6 +30,33 @@ def _read_resource(subpath: str) -> str:
     return ref.read_text(encoding="utf-8")
 
 
+def guideline_documents() -> list[tuple[str, str]]:
+    """Return ``(name, markdown)`` for each core guideline file, in document order."""
+    return [(filename.removesuffix(".md"), _read_resource(filename)) for filename in _CORE_FILES]
+
+
+def version_addendum(version: str | None) -> str | None:
+    """Return the version-specific guidelines for *version* (e.g. '18.0'), or None."""
+    if not version:
+        return None
+    major = version.split(".")[0]
+    try:
+        return _read_resource(f"versions/v{major}.md")
+    except (FileNotFoundError, TypeError):
+        return None  # No version-specific guidelines available
+
+
+def version_addenda() -> dict[str, str]:
+    """Return the markdown of every version-specific addendum keyed by major version."""
+    versions_dir = importlib.resources.files("odoo_boost.guidelines") / "core" / "versions"
+    addenda = {}
+    for entry in sorted(versions_dir.iterdir(), key=lambda e: e.name):
+        match = re.fullmatch(r"v(\d+)\.md", entry.name)
+        if match:
+            addenda[match.group(1)] = entry.read_text(encoding="utf-8")
+    return addenda
+
+
 def compose_guidelines(version: str | None = None) -> str:
     """Assemble all core guideline files plus a version-specific addendum.
 
@@ -33,28 +67,16 @@ def compose_guidelines(version: str | None = None) -> str:
     Returns:
         A single markdown string with all guidelines concatenated.
     """
-    parts: list[str] = []
-
-    parts.append("# Odoo Development Guidelines\n")
-    parts.append(
-        "> Auto-generated by **Odoo Boost**. "
-        "These guidelines help AI coding agents write idiomatic Odoo code.\n"
-    )
+    parts: list[str] = [GUIDELINES_HEADER]
 
-    for filename in _CORE_FILES:
-        content = _read_resource(filename)
+    for _name, content in guideline_documents():
         parts.append(content.strip())
         parts.append("")  # blank line separator
 
     # Version-specific addendum
-    if version:
-        major = version.split(".")[0]
-        version_file = f"versions/v{major}.md"
-        try:
-            version_content = _read_resource(version_file)
-            parts.append(version_content.strip())
-            parts.append("")
-        except (FileNotFoundError, TypeError):
-            pass  # No version-specific guidelines available
+    version_content = version_addendum(version)
+    if version_content is not None:
+        parts.append(version_content.strip())
+        parts.append("")
 
     return "\n\n".join(parts) + "\n"
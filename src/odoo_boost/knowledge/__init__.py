@@ -0,0 +1,19 @@
+"""Local full-text search over the bundled guidelines and skills."""
+
+from odoo_boost.knowledge.corpus import (
+    Section,
+    guideline_sections,
+    load_sections,
+    split_sections,
+)
+from odoo_boost.knowledge.index import SearchIndex, get_index, tokenize
+
+__all__ = [
+    "Section",
+    "guideline_sections",
+    "load_sections",
+    "split_sections",
+    "SearchIndex",
+    "get_index",
+    "tokenize",
+]
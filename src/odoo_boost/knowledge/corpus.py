@@ -0,0 +1,99 @@
+"""Split the bundled guideline and skill markdown into searchable sections."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from odoo_boost.guidelines.composer import guideline_documents, version_addenda, version_addendum
+from odoo_boost.skills.loader import list_skills, load_skill
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FRONT_MATTER = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Section:
+    """One heading-delimited section of a bundled markdown document."""
+
+    id: str
+    source: str  # "guideline", "version" or "skill"
+    document: str
+    title: str
+    text: str
+    version: str | None = None
+
+
+def split_sections(
+    markdown: str, source: str, document: str, version: str | None = None
+) -> list[Section]:
+    """Split *markdown* on its headings into :class:`Section` objects.
+
+    Headings inside fenced code blocks (e.g. Python comments) are ignored.
+    Each section's title is its heading path, e.g. ``Security > Record Rules``;
+    sections without body text are skipped.
+    """
+    markdown = _FRONT_MATTER.sub("", markdown)
+    sections: list[Section] = []
+    path: list[tuple[int, str]] = []
+    body: list[str] = []
+    used_ids: set[str] = set()
+    in_fence = False
+
+    def flush() -> None:
+        text = "\n".join(body).strip()
+        if text and path:
+            slug = _slug(path[-1][1]) or "section"
+            section_id = f"{document}#{slug}"
+            n = 2
+            while section_id in used_ids:
+                section_id = f"{document}#{slug}-{n}"
+                n += 1
+            used_ids.add(section_id)
+            title = " > ".join(heading for _, heading in path)
+            sections.append(Section(section_id, source, document, title, text, version))
+        body.clear()
+
+    for line in markdown.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING.match(line)
+        if not match:
+            body.append(line)
+            continue
+        flush()
+        level = len(match.group(1))
+        while path and path[-1][0] >= level:
+            path.pop()
+        path.append((level, match.group(2)))
+    flush()
+    return sections
+
+
+def guideline_sections(version: str | None = None) -> list[Section]:
+    """Return the sections of the core guidelines plus the addendum for *version*."""
+    sections: list[Section] = []
+    for name, content in guideline_documents():
+        sections += split_sections(content, "guideline", f"guidelines/{name}")
+    addendum = version_addendum(version)
+    if version and addendum is not None:
+        major = version.split(".")[0]
+        sections += split_sections(
+            addendum, "version", f"guidelines/versions/v{major}", version=major
+        )
+    return sections
+
+
+def load_sections() -> list[Section]:
+    """Return the sections of all core guidelines, version addenda and skills."""
+    sections = guideline_sections()
+    for major, content in version_addenda().items():
+        sections += split_sections(content, "version", f"guidelines/versions/v{major}", major)
+
+    for skill in list_skills():
+        sections += split_sections(load_skill(skill), "skill", f"skills/{skill}")
+    return sections
+
+
+def _slug(heading: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", heading.lower()).strip("-")
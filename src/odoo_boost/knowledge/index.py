@@ -0,0 +1,128 @@
+"""BM25 inverted index over :class:`~odoo_boost.knowledge.corpus.Section` objects."""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+from odoo_boost.knowledge.corpus import Section, load_sections
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "can",
+        "do",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "the",
+        "this",
+        "to",
+        "use",
+        "what",
+        "when",
+        "with",
+        "you",
+        "your",
+    ]
+)
+
+# Standard BM25 parameters; titles count double so a heading match ranks first.
+_K1 = 1.2
+_B = 0.75
+_TITLE_WEIGHT = 2
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case *text*, split it into words and fold simple plurals."""
+    tokens = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class SearchIndex:
+    """In-memory inverted index with BM25 ranking."""
+
+    def __init__(self, sections: Iterable[Section]) -> None:
+        self.sections = list(sections)
+        self._by_id = {section.id: section for section in self.sections}
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        for doc, section in enumerate(self.sections):
+            terms = Counter(tokenize(section.text))
+            for token in tokenize(section.title):
+                terms[token] += _TITLE_WEIGHT
+            self._lengths.append(sum(terms.values()))
+            for term, freq in terms.items():
+                self._postings.setdefault(term, []).append((doc, freq))
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def get(self, section_id: str) -> Section | None:
+        return self._by_id.get(section_id)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        sources: Iterable[str] | None = None,
+        version: str | None = None,
+    ) -> list[tuple[float, Section]]:
+        """Return up to *limit* ``(score, section)`` pairs ranked by BM25.
+
+        *sources* restricts the result to those section sources. With a
+        *version* (e.g. ``'17'``), addenda for other versions are skipped.
+        """
+        allowed = set(sources) if sources is not None else None
+        scores: dict[int, float] = {}
+        total = len(self.sections)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, freq in postings:
+                norm = _K1 * (1 - _B + _B * self._lengths[doc] / self._avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * freq * (_K1 + 1) / (freq + norm)
+
+        ranked = []
+        for doc, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+            section = self.sections[doc]
+            if allowed is not None and section.source not in allowed:
+                continue
+            if version and section.version not in (None, version):
+                continue
+            ranked.append((round(score, 3), section))
+            if len(ranked) >= limit:
+                break
+        return ranked
+
+
+@functools.lru_cache(maxsize=1)
+def get_index() -> SearchIndex:
+    """Return the index over all bundled sections, built on first use."""
+    return SearchIndex(load_sections())
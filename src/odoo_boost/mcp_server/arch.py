@@ -0,0 +1,68 @@
+"""Helpers for analysing ``ir.ui.view`` architectures (XML arch strings)."""
+
+from __future__ import annotations
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Any
+
+
+def summarize_arch(arch: str) -> dict[str, Any]:
+    """Return a compact summary of *arch*, parsed as a stream.
+
+    The summary lists the field names the view references, the targets of
+    its inheritance specs (xpath expressions and ``position`` elements) and
+    the total number of XML elements.
+    """
+    fields: dict[str, None] = {}
+    targets: list[str] = []
+    node_count = 0
+    for event, elem in ET.iterparse(io.BytesIO(arch.encode("utf-8")), events=("start", "end")):
+        if event == "end":
+            elem.clear()  # drop finished subtrees so memory stays flat
+            continue
+        node_count += 1
+        if elem.get("position") is not None:
+            targets.append(_target(elem))
+        elif elem.tag == "field" and elem.get("name"):
+            fields[elem.get("name", "")] = None
+    return {"fields": list(fields), "xpath_targets": targets, "node_count": node_count}
+
+
+def inheritance_changes(arch: str) -> list[dict[str, Any]]:
+    """Return the modifications an inheriting view's *arch* applies to its parent.
+
+    Each entry has the ``target`` (the ``xpath`` expression, or the element
+    spec such as ``field[@name='partner_id']``), the ``position`` and the
+    XML ``content`` that is inserted. For ``position="attributes"`` the
+    attribute changes are listed under ``attributes`` instead.
+    """
+    root = ET.fromstring(arch)
+    specs = list(root) if root.tag == "data" else [root]
+    changes = []
+    for spec in specs:
+        if not isinstance(spec.tag, str):
+            continue  # comments and processing instructions
+        change: dict[str, Any] = {
+            "target": _target(spec),
+            "position": spec.get("position", "inside"),
+        }
+        if change["position"] == "attributes":
+            change["attributes"] = {
+                attr.get("name", ""): attr.text or "" for attr in spec if attr.tag == "attribute"
+            }
+        else:
+            change["content"] = "".join(
+                ET.tostring(child, encoding="unicode") for child in spec
+            ).strip()
+        changes.append(change)
+    return changes
+
+
+def _target(spec: ET.Element) -> str:
+    if spec.tag == "xpath":
+        return spec.get("expr", "")
+    conditions = "".join(
+        f"[@{name}='{value}']" for name, value in spec.attrib.items() if name != "position"
+    )
+    return f"{spec.tag}{conditions}"
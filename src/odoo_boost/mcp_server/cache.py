@@ -0,0 +1,160 @@
+"""In-memory LRU cache for Odoo metadata (models, fields, modules, views, ACLs).
+
+Metadata only changes when a module is installed or upgraded, or when a
+field, view or rule is edited through the UI. Instead of re-querying
+``ir.model`` and ``ir.model.fields`` on every tool call, results are cached
+and the whole cache is dropped as soon as the latest ``write_date`` or the
+record count of any model in ``_FINGERPRINT_MODELS`` changes (deleting a
+record does not move ``write_date``). An optional on-disk
+:class:`~odoo_boost.mcp_server.snapshot.SnapshotStore` keeps the cached
+results across server restarts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from odoo_boost.connection.base import AsyncOdooConnection
+from odoo_boost.mcp_server.snapshot import SnapshotStore
+
+T = TypeVar("T")
+
+# Models whose latest write_date and record count make up the invalidation
+# fingerprint.
+# ir.module.module moves on every install, upgrade and uninstall.
+_FINGERPRINT_MODELS = (
+    "ir.module.module",
+    "ir.model.fields",
+    "ir.ui.view",
+    "ir.model.access",
+    "ir.rule",
+    "ir.ui.menu",
+)
+
+
+class MetadataCache:
+    """LRU cache keyed per database and invalidated by a metadata fingerprint.
+
+    The fingerprint costs two small RPCs per model in ``_FINGERPRINT_MODELS``
+    (issued concurrently) and is re-checked at most every *check_interval* seconds. When
+    *snapshot_dir* is given, misses fall through to an on-disk snapshot
+    keyed by *namespace* and the fingerprint before calling the loader.
+    """
+
+    def __init__(
+        self,
+        connection: AsyncOdooConnection,
+        namespace: str,
+        max_entries: int = 256,
+        check_interval: float = 30.0,
+        snapshot_dir: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._connection = connection
+        self._namespace = namespace
+        self._max_entries = max_entries
+        self._check_interval = check_interval
+        self._snapshot_dir = snapshot_dir
+        self._snapshot: SnapshotStore | None = None
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, Hashable], Any] = OrderedDict()
+        self._fingerprint: tuple[Any, ...] | None = None
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for *key*, awaiting *loader()* on a miss."""
+        if not self.enabled:
+            return await loader()
+
+        await self._revalidate()
+        full_key = (self._namespace, key)
+        with self._lock:
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return self._entries[full_key]  # type: ignore[no-any-return]
+            snapshot = self._snapshot
+
+        value = snapshot.get(key) if snapshot is not None else None
+        if value is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            value = await loader()
+            if snapshot is not None:
+                snapshot.put(key, value)
+
+        with self._lock:
+            self._entries[full_key] = value
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached entry and force a fingerprint re-check."""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprint = None
+            self._checked_at = None
+
+    def reset_stats(self) -> None:
+        """Zero the hit and miss counters (the cached entries are kept)."""
+        with self._lock:
+            self.hits = self.disk_hits = self.misses = 0
+
+    async def fingerprint(self) -> tuple[Any, ...]:
+        """Return the latest ``write_date`` and the record count of each fingerprint model."""
+        conn = self._connection
+        probes = await conn.gather(
+            *(
+                probe
+                for model in _FINGERPRINT_MODELS
+                for probe in (
+                    conn.search_read(
+                        model, [], fields=["write_date"], limit=1, order="write_date desc"
+                    ),
+                    conn.search_count(model, []),
+                )
+            )
+        )
+        latest, counts = probes[::2], probes[1::2]
+        return tuple(
+            (rows[0].get("write_date") if rows else None, count)
+            for rows, count in zip(latest, counts, strict=True)
+        )
+
+    # -- internal ------------------------------------------------------------
+
+    async def _revalidate(self) -> None:
+        now = self._clock()
+        if self._checked_at is not None and now - self._checked_at < self._check_interval:
+            return
+        fingerprint = await self.fingerprint()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._entries.clear()
+                self._fingerprint = fingerprint
+                if self._snapshot is not None:
+                    self._snapshot.close()
+                if self._snapshot_dir is not None:
+                    self._snapshot = SnapshotStore.for_fingerprint(
+                        self._snapshot_dir, self._namespace, fingerprint
+                    )
+            self._checked_at = now
@@ -1,19 +1,52 @@
-"""Shared server context holding the Odoo connection and config."""
+"""Shared server context holding the Odoo connection, config and metadata cache."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
 
 from odoo_boost.config.schema import OdooBoostConfig
-from odoo_boost.connection.base import OdooConnection
+from odoo_boost.connection.base import AsyncOdooConnection
+from odoo_boost.mcp_server.cache import MetadataCache
+from odoo_boost.mcp_server.logfile import LogFileIndex
+from odoo_boost.mcp_server.metrics import ServerMetrics
+from odoo_boost.mcp_server.snapshot import default_cache_dir
 
 
 @dataclass
 class ServerContext:
-    """Holds connection + config for MCP tool handlers."""
+    """Holds connection + config (and the derived cache and metrics) for MCP tool handlers."""
 
-    connection: OdooConnection
+    connection: AsyncOdooConnection
     config: OdooBoostConfig
+    cache: MetadataCache = field(init=False)
+    log_index: LogFileIndex | None = field(init=False, default=None)
+    metrics: ServerMetrics = field(init=False)
+
+    def __post_init__(self) -> None:
+        cache_cfg = self.config.cache
+        conn_cfg = self.config.connection
+        snapshot_dir = None
+        if cache_cfg.persist:
+            snapshot_dir = Path(cache_cfg.directory) if cache_cfg.directory else default_cache_dir()
+        # Per user: models, views, menus and ACLs are read under their access rights
+        self.cache = MetadataCache(
+            self.connection,
+            namespace=f"{conn_cfg.url.rstrip('/')}/{conn_cfg.database}?user={conn_cfg.username}",
+            max_entries=cache_cfg.max_entries if cache_cfg.enabled else 0,
+            check_interval=cache_cfg.check_interval,
+            snapshot_dir=snapshot_dir,
+        )
+        if self.config.log_file:
+            cache_dir = Path(cache_cfg.directory) if cache_cfg.directory else default_cache_dir()
+            digest = hashlib.sha256(self.config.log_file.encode("utf-8")).hexdigest()[:16]
+            self.log_index = LogFileIndex(
+                self.config.log_file, cache_dir / "logs" / f"{digest}.sqlite"
+            )
+        metrics_file = self.config.metrics_file
+        self.metrics = ServerMetrics(Path(metrics_file).expanduser() if metrics_file else None)
+        self.connection.set_observer(self.metrics.observe_rpc)
 
 
 # Module-level singleton set at server start.
@@ -31,5 +64,17 @@ def get_context() -> ServerContext:
     return _ctx
 
 
-def get_connection() -> OdooConnection:
+def get_connection() -> AsyncOdooConnection:
     return get_context().connection
+
+
+def get_metadata_cache() -> MetadataCache:
+    return get_context().cache
+
+
+def get_log_index() -> LogFileIndex | None:
+    return get_context().log_index
+
+
+def get_metrics() -> ServerMetrics:
+    return get_context().metrics
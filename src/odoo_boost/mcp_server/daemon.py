@@ -0,0 +1,292 @@
+"""Shared MCP daemon reachable over a Unix domain socket.
+
+Every agent starts its own ``odoo-boost mcp`` process. Instead of each one
+authenticating and warming its own caches and connection pool, ``mcp``
+connects to one background daemon per config (starting it on first use)
+and only copies bytes between its stdio and the daemon's socket. The
+daemon serves every socket connection as a separate MCP session over the
+same :class:`~odoo_boost.mcp_server.context.ServerContext`, so the Odoo
+connection pool, the metadata cache and the metrics are shared. It exits
+after ``server.idle_timeout`` seconds without connected agents.
+
+Sockets live in ``$XDG_RUNTIME_DIR/odoo-boost`` (or a per-user directory
+in the system temp dir), named after the config file and its content, so
+editing the config starts a fresh daemon.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import anyio
+from anyio import CancelScope
+from anyio.abc import ByteStream
+from anyio.streams.buffered import BufferedByteReceiveStream
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from odoo_boost.config.schema import OdooBoostConfig
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from mcp.shared.message import SessionMessage
+
+# Largest single JSON-RPC message accepted from a client.
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+# Seconds to wait for a freshly spawned daemon (it authenticates first).
+_START_TIMEOUT = 30.0
+_CHUNK = 65536
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or started."""
+
+
+@dataclass(frozen=True)
+class DaemonPaths:
+    """Files of the daemon serving one config."""
+
+    socket: Path
+    pid: Path
+    log: Path
+    lock: Path
+
+
+def supports_daemon() -> bool:
+    """Return whether this platform can run the Unix socket daemon."""
+    return hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+def runtime_dir() -> Path:
+    """Return the private directory holding daemon sockets, creating it if needed."""
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        path = Path(base) / "odoo-boost"
+    else:
+        path = Path(tempfile.gettempdir()) / f"odoo-boost-{os.getuid()}"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if path.stat().st_uid != os.getuid():
+        raise DaemonError(f"{path} belongs to another user")
+    return path
+
+
+def daemon_paths(config_path: Path, config: OdooBoostConfig) -> DaemonPaths:
+    """Return the socket, pid, log and lock files of the daemon for this config."""
+    key = f"{config_path.resolve()}\0{config.model_dump_json()}"
+    stem = runtime_dir() / hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return DaemonPaths(
+        socket=stem.with_suffix(".sock"),
+        pid=stem.with_suffix(".pid"),
+        log=stem.with_suffix(".log"),
+        lock=stem.with_suffix(".lock"),
+    )
+
+
+def daemon_pid(paths: DaemonPaths) -> int | None:
+    """Return the pid of the daemon if it is accepting connections, else None."""
+    sock = _try_connect(paths.socket)
+    if sock is None:
+        return None
+    sock.close()
+    try:
+        return int(paths.pid.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+# -- client side -------------------------------------------------------------
+
+
+def connect_daemon(config_path: Path, config: OdooBoostConfig) -> socket.socket:
+    """Connect to the daemon for *config*, starting it first if it is not running."""
+    paths = daemon_paths(config_path, config)
+    sock = _try_connect(paths.socket)
+    if sock is not None:
+        return sock
+
+    import fcntl
+
+    # Serialise start-up so agents launched together share one daemon
+    with open(paths.lock, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = _try_connect(paths.socket)
+        if sock is not None:
+            return sock
+        with open(paths.log, "wb") as log:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "odoo_boost", "daemon", "--config", str(config_path)],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+        deadline = time.monotonic() + _START_TIMEOUT
+        while time.monotonic() < deadline:
+            sock = _try_connect(paths.socket)
+            if sock is not None:
+                return sock
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+    raise DaemonError(f"MCP daemon did not start (see {paths.log})")
+
+
+def bridge(sock: socket.socket, stdin: BinaryIO, stdout: BinaryIO) -> None:
+    """Copy *stdin* to the daemon and its replies to *stdout* until the daemon closes."""
+
+    def upstream() -> None:
+        try:
+            while chunk := stdin.read1(_CHUNK):  # type: ignore[attr-defined]
+                sock.sendall(chunk)
+        except OSError:
+            pass
+        finally:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_WR)
+
+    threading.Thread(target=upstream, daemon=True).start()
+    try:
+        while data := sock.recv(_CHUNK):
+            stdout.write(data)
+            stdout.flush()
+    finally:
+        sock.close()
+
+
+def _try_connect(path: Path) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+# -- daemon side -------------------------------------------------------------
+
+
+def serve_daemon(server: FastMCP, paths: DaemonPaths, idle_timeout: float) -> None:
+    """Serve MCP sessions for *server* on the Unix socket until idle or signalled."""
+    anyio.run(_serve, server, paths, idle_timeout)
+
+
+@dataclass
+class _Clients:
+    active: int = 0
+    last_seen: float = 0.0
+
+
+async def _serve(server: FastMCP, paths: DaemonPaths, idle_timeout: float) -> None:
+    running = _try_connect(paths.socket)
+    if running is not None:
+        running.close()
+        raise DaemonError(f"Another daemon is already serving {paths.socket}")
+    paths.socket.unlink(missing_ok=True)  # left behind by a killed daemon
+    listener = await anyio.create_unix_listener(paths.socket)
+    os.chmod(paths.socket, 0o600)
+    pid = str(os.getpid())
+    paths.pid.write_text(pid)
+    clients = _Clients(last_seen=time.monotonic())
+    try:
+        async with listener, anyio.create_task_group() as tg:
+            if threading.current_thread() is threading.main_thread():
+                tg.start_soon(_exit_on_signal, tg.cancel_scope)
+            if idle_timeout:
+                tg.start_soon(_exit_when_idle, clients, idle_timeout, tg.cancel_scope)
+            await listener.serve(partial(_session, server, clients), task_group=tg)
+    finally:
+        with contextlib.suppress(OSError):
+            if paths.pid.read_text() == pid:
+                paths.socket.unlink(missing_ok=True)
+                paths.pid.unlink()
+
+
+async def _exit_on_signal(scope: CancelScope) -> None:
+    with anyio.open_signal_receiver(signal.SIGTERM, signal.SIGINT) as signals:
+        async for _ in signals:
+            scope.cancel()
+            return
+
+
+async def _exit_when_idle(clients: _Clients, idle_timeout: float, scope: CancelScope) -> None:
+    while True:
+        await anyio.sleep(min(idle_timeout, 1.0))
+        if not clients.active and time.monotonic() - clients.last_seen >= idle_timeout:
+            scope.cancel()
+            return
+
+
+async def _session(server: FastMCP, clients: _Clients, stream: ByteStream) -> None:
+    """Run one MCP session over a client connection (newline-delimited JSON-RPC)."""
+    clients.active += 1
+    read_writer: MemoryObjectSendStream[Any]
+    read_stream: MemoryObjectReceiveStream[Any]
+    write_stream: MemoryObjectSendStream[SessionMessage]
+    write_reader: MemoryObjectReceiveStream[SessionMessage]
+    read_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_reader = anyio.create_memory_object_stream(0)
+    lowlevel = server._mcp_server
+    try:
+        async with stream, anyio.create_task_group() as tg:
+            tg.start_soon(_read_messages, BufferedByteReceiveStream(stream), read_writer)
+            async with anyio.create_task_group() as writer:
+                writer.start_soon(_write_messages, stream, write_reader)
+                await lowlevel.run(
+                    read_stream, write_stream, lowlevel.create_initialization_options()
+                )
+                await write_stream.aclose()
+            tg.cancel_scope.cancel()  # stop reading if the client is still connected
+    except Exception as exc:  # one broken session must not stop the daemon
+        print(f"MCP session ended with an error: {exc!r}", file=sys.stderr)
+    finally:
+        clients.active -= 1
+        clients.last_seen = time.monotonic()
+
+
+async def _read_messages(
+    stream: BufferedByteReceiveStream, sink: MemoryObjectSendStream[Any]
+) -> None:
+    import mcp.types as types
+    from mcp.shared.message import SessionMessage
+
+    async with sink:
+        while True:
+            try:
+                line = await stream.receive_until(b"\n", _MAX_MESSAGE_BYTES)
+            except (anyio.EndOfStream, anyio.IncompleteRead, anyio.DelimiterNotFound):
+                return
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                return
+            if not line.strip():
+                continue
+            try:
+                message = types.JSONRPCMessage.model_validate_json(line)
+            except Exception as exc:
+                await sink.send(exc)
+                continue
+            await sink.send(SessionMessage(message))
+
+
+async def _write_messages(
+    stream: ByteStream, source: MemoryObjectReceiveStream[SessionMessage]
+) -> None:
+    async with source:
+        async for session_message in source:
+            data = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+            try:
+                await stream.send(data.encode("utf-8") + b"\n")
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                return
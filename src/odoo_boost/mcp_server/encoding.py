@@ -0,0 +1,120 @@
+"""Response encoding for MCP tool results.
+
+Three output formats are supported:
+
+``pretty``
+    Indented JSON, easiest for humans to read.
+``compact``
+    JSON without insignificant whitespace.
+``columnar``
+    Compact JSON in which every list of records (dicts) is replaced by
+    ``{"columns": [...], "rows": [[...], ...]}``, so field names are sent
+    once per list instead of once per record.
+
+When the optional ``orjson`` package is installed (``pip install
+odoo-boost[fast]``) it is used for serialisation; otherwise the standard
+library ``json`` module is used.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Literal
+
+from odoo_boost.mcp_server.context import get_context
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+OutputFormat = Literal["pretty", "compact", "columnar"]
+
+OUTPUT_FORMATS: tuple[str, ...] = ("pretty", "compact", "columnar")
+
+# Seconds spent in encode_result, summed while an encoding_timer() scope is active.
+_encode_timer: ContextVar[list[float] | None] = ContextVar("_encode_timer", default=None)
+
+
+def encode_result(result: Any, output_format: OutputFormat | None = None) -> str:
+    """Serialise a tool *result* to a JSON string in *output_format*.
+
+    When *output_format* is None the ``output_format`` setting of the
+    running server's config is used. Values JSON cannot represent natively
+    (dates, XML-RPC ``DateTime`` ...) are converted with :func:`str`.
+    """
+    timer = _encode_timer.get()
+    started = time.perf_counter() if timer is not None else 0.0
+    output_format = output_format or _configured_format()
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format {output_format!r}; expected one of {', '.join(OUTPUT_FORMATS)}"
+        )
+    if output_format == "columnar":
+        result = to_columnar(result)
+    encoded = _dumps(result, pretty=output_format == "pretty")
+    if timer is not None:
+        timer[0] += time.perf_counter() - started
+    return encoded
+
+
+@contextmanager
+def encoding_timer() -> Iterator[list[float]]:
+    """Measure the time spent in :func:`encode_result` within the ``with`` block.
+
+    Yields a one-element list whose value is the accumulated number of
+    seconds; calls made from threads started with :func:`asyncio.to_thread`
+    inside the block are included.
+    """
+    timer = [0.0]
+    token = _encode_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _encode_timer.reset(token)
+
+
+def to_columnar(value: Any) -> Any:
+    """Recursively replace lists of dicts with a columns/rows table.
+
+    Columns are the union of the records' keys in first-seen order; a
+    record lacking a column gets ``null`` in that position.
+    """
+    if isinstance(value, dict):
+        return {key: to_columnar(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(item, dict) for item in value):
+            columns: dict[str, None] = {}
+            for record in value:
+                columns.update(dict.fromkeys(record))
+            return {
+                "columns": list(columns),
+                "rows": [[to_columnar(record.get(col)) for col in columns] for record in value],
+            }
+        return [to_columnar(item) for item in value]
+    return value
+
+
+# -- internal ----------------------------------------------------------------
+
+
+def _configured_format() -> OutputFormat:
+    return get_context().config.output_format
+
+
+def _dumps(value: Any, pretty: bool) -> str:
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=str, option=options).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    if pretty:
+        return json.dumps(value, indent=2, default=str)
+    return json.dumps(value, separators=(",", ":"), default=str)
@@ -0,0 +1,244 @@
+"""Indexed reader for local Odoo log files.
+
+Odoo writes one header line per log record::
+
+    2025-01-15 10:30:00,123 4242 ERROR mydb odoo.addons.sale.models.sale_order: message
+
+followed by optional continuation lines (tracebacks). :class:`LogFileIndex`
+parses the files matching a path or glob (e.g. ``/var/log/odoo/odoo.log*``
+to include rotated files) with a memory-mapped reader and records, per log
+record, its byte range plus timestamp, level, logger, database and pid in
+a SQLite index. Queries by level, logger and time range are answered from
+the index; only the matching records are read back from the log files.
+
+Indexing is incremental: each file is tracked by device and inode together
+with the offset indexed so far, so appended lines are picked up on the next
+query and a rotated (renamed) file keeps its entries. New records are
+committed in chunks, so a first pass over a large log neither holds all of
+them in memory nor loses its progress if it is interrupted.
+"""
+
+from __future__ import annotations
+
+import glob
+import mmap
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+_HEADER = re.compile(
+    rb"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)(?:,\d+)? (\d+) ([A-Z]+) (\S+) ([^\s:]+): "
+)
+
+# Records inserted and committed at a time while indexing, so memory stays
+# flat on large logs and an interrupted first pass keeps its progress.
+_INDEX_CHUNK = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    dev INTEGER, ino INTEGER, path TEXT, indexed_to INTEGER,
+    PRIMARY KEY (dev, ino)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dev INTEGER, ino INTEGER, offset INTEGER, length INTEGER,
+    timestamp TEXT, level TEXT, logger TEXT, dbname TEXT, pid INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_level_time ON entries (level, timestamp);
+CREATE INDEX IF NOT EXISTS entries_time ON entries (timestamp);
+CREATE INDEX IF NOT EXISTS entries_logger ON entries (logger);
+CREATE INDEX IF NOT EXISTS entries_file ON entries (dev, ino, offset);
+"""
+
+
+class LogFileIndex:
+    """On-disk index over the Odoo log files matching *pattern*."""
+
+    def __init__(self, pattern: str, index_path: Path) -> None:
+        self.pattern = pattern
+        self.index_path = index_path
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """Index lines appended since the last call and return the number of new records."""
+        with self._lock:
+            db = self._connect()
+            seen: set[tuple[int, int]] = set()
+            added = 0
+            files = []
+            for path in glob.glob(os.path.expanduser(self.pattern)):
+                try:
+                    files.append((os.stat(path), path))
+                except OSError:
+                    continue
+            # Oldest (rotated) files first, so record ids follow log order
+            for st, path in sorted(files, key=lambda item: item[0].st_mtime):
+                key = (st.st_dev, st.st_ino)
+                seen.add(key)
+                added += self._index_file(db, path, key, st.st_size)
+            for dev, ino in db.execute("SELECT dev, ino FROM files").fetchall():
+                if (dev, ino) not in seen:  # deleted (e.g. rotated away)
+                    db.execute("DELETE FROM entries WHERE dev = ? AND ino = ?", (dev, ino))
+                    db.execute("DELETE FROM files WHERE dev = ? AND ino = ?", (dev, ino))
+            db.commit()
+            return added
+
+    def search(
+        self,
+        level: str = "",
+        logger: str = "",
+        since: str = "",
+        until: str = "",
+        cursor: int = 0,
+        text: str = "",
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Return matching records, newest first (oldest first when following *cursor*)."""
+        clauses, params = [], []
+        if level:
+            clauses.append("e.level = ?")
+            params.append(level.upper())
+        if logger:
+            clauses.append("e.logger LIKE ?")
+            params.append(f"%{logger}%")
+        if since:
+            clauses.append("e.timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("e.timestamp <= ?")
+            params.append(until)
+        if cursor:
+            clauses.append("e.id > ?")
+            params.append(cursor)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "e.id ASC" if cursor else "e.timestamp DESC, e.id DESC"
+        query = (
+            "SELECT e.id, e.offset, e.length, e.timestamp, e.level, e.logger, e.dbname, e.pid,"
+            " f.path FROM entries e JOIN files f ON f.dev = e.dev AND f.ino = e.ino"
+            f" {where} ORDER BY {order}"
+        )
+        with self._lock:
+            rows = self._connect().execute(query, params)
+            return list(self._read(rows, text.lower(), limit))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # -- internal ------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.index_path, check_same_thread=False)
+            db.executescript(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def _index_file(
+        self, db: sqlite3.Connection, path: str, key: tuple[int, int], size: int
+    ) -> int:
+        row = db.execute("SELECT indexed_to FROM files WHERE dev = ? AND ino = ?", key).fetchone()
+        start = row[0] if row else 0
+        if start > size:  # truncated in place: start over
+            db.execute("DELETE FROM entries WHERE dev = ? AND ino = ?", key)
+            start = 0
+        db.execute(
+            "INSERT OR REPLACE INTO files (dev, ino, path, indexed_to) VALUES (?, ?, ?, ?)",
+            (*key, path, start),
+        )
+        if start == size:
+            return 0
+
+        records: list[list[Any]] = []
+        added = 0
+        end = start
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset, line_end in _lines(mm, start, size):
+                match = _HEADER.match(mm[offset : min(line_end, offset + 512)])
+                if match:
+                    timestamp, pid, level, dbname, logger = (g.decode() for g in match.groups())
+                    records.append(
+                        [
+                            *key,
+                            offset,
+                            line_end - offset,
+                            timestamp,
+                            level,
+                            logger,
+                            dbname,
+                            int(pid),
+                        ]
+                    )
+                elif records:
+                    records[-1][3] = line_end - records[-1][2]
+                else:  # continuation of the last record already stored
+                    db.execute(
+                        "UPDATE entries SET length = ? - offset WHERE id = "
+                        "(SELECT MAX(id) FROM entries WHERE dev = ? AND ino = ?)",
+                        (line_end, *key),
+                    )
+                end = line_end + 1
+                if len(records) >= _INDEX_CHUNK:
+                    added += self._store(db, key, records, end)
+                    records = []
+        return added + self._store(db, key, records, end)
+
+    @staticmethod
+    def _store(
+        db: sqlite3.Connection, key: tuple[int, int], records: list[list[Any]], end: int
+    ) -> int:
+        db.executemany(
+            "INSERT INTO entries (dev, ino, offset, length, timestamp, level, logger, dbname, pid)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            records,
+        )
+        db.execute("UPDATE files SET indexed_to = ? WHERE dev = ? AND ino = ?", (end, *key))
+        db.commit()
+        return len(records)
+
+    def _read(self, rows: Any, text: str, limit: int) -> Iterator[dict[str, Any]]:
+        returned = 0
+        maps: dict[str, mmap.mmap] = {}
+        try:
+            for entry_id, offset, length, timestamp, level, logger, dbname, pid, path in rows:
+                if path not in maps:
+                    with open(path, "rb") as fh:
+                        maps[path] = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                raw = maps[path][offset : offset + length].decode("utf-8", "replace")
+                message = raw.split(": ", 1)[1] if ": " in raw else raw
+                if text and text not in message.lower():
+                    continue
+                yield {
+                    "id": entry_id,
+                    "timestamp": timestamp,
+                    "level": level,
+                    "name": logger,
+                    "dbname": dbname,
+                    "pid": pid,
+                    "message": message,
+                }
+                returned += 1
+                if returned >= limit:
+                    break
+        finally:
+            for mm in maps.values():
+                mm.close()
+
+
+def _lines(mm: mmap.mmap, start: int, size: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(offset, end)`` of each complete line in ``mm[start:size]``."""
+    pos = start
+    while pos < size:
+        newline = mm.find(b"\n", pos, size)
+        if newline == -1:
+            return  # partial line still being written; picked up next time
+        yield pos, newline
+        pos = newline + 1
@@ -0,0 +1,229 @@
+"""Per-tool and per-RPC metrics for the MCP server.
+
+:class:`ServerMetrics` is installed as the connection's RPC observer and
+wraps every registered tool (see :meth:`ServerMetrics.instrument`). Each
+tool call is tracked in a context variable, so the RPCs it makes, also from
+tasks started with ``conn.gather()``, are attributed to it. Totals are
+kept in memory for the ``server_stats`` tool; with a *metrics_file* every
+finished tool call is also appended to it as one JSON line.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+from odoo_boost.connection.base import RpcCall
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Durations kept per tool for the p50/p95 figures.
+_SAMPLE_SIZE = 512
+
+# Tools report expected failures as ``{"error": "..."}`` instead of raising.
+_ERROR_RESULT = re.compile(r'\{\s*"error"\s*:')
+
+
+@dataclass
+class _Totals:
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    rpc_count: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    result_bytes: int = 0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=_SAMPLE_SIZE))
+
+    def add(self, seconds: float, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.samples.append(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": _ms(self.seconds / self.calls) if self.calls else 0.0,
+            "p50_ms": _ms(_percentile(ordered, 50)),
+            "p95_ms": _ms(_percentile(ordered, 95)),
+            "max_ms": _ms(self.max_seconds),
+            "rpc_count": self.rpc_count,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "result_bytes": self.result_bytes,
+        }
+
+
+@dataclass
+class _ToolCall:
+    tool: str
+    rpcs: list[RpcCall] = field(default_factory=list)
+    result_bytes: int = 0
+    error: str | None = None
+
+    def set_result(self, result: Any) -> None:
+        if isinstance(result, str):
+            self.result_bytes = len(result.encode("utf-8"))
+            if _ERROR_RESULT.match(result):
+                self.error = "error_result"
+
+
+_current_call: ContextVar[_ToolCall | None] = ContextVar("odoo_boost_tool_call", default=None)
+
+
+class ServerMetrics:
+    """Collects tool and RPC statistics; optionally appends tool calls to *metrics_file*."""
+
+    def __init__(self, metrics_file: Path | None = None) -> None:
+        self.metrics_file = metrics_file
+        self.started_at = time.time()
+        self._tools: dict[str, _Totals] = {}
+        self._rpcs: dict[str, _Totals] = {}
+        self._lock = threading.Lock()
+
+    def observe_rpc(self, call: RpcCall) -> None:
+        """:data:`~odoo_boost.connection.base.RpcObserver` recording one RPC."""
+        key = f"{call.model}.{call.orm_method}" if call.model else f"{call.service}.{call.method}"
+        with self._lock:
+            totals = self._rpcs.setdefault(key, _Totals())
+            totals.add(call.seconds, call.error is not None)
+            totals.rpc_count += 1
+            totals.request_bytes += call.request_bytes
+            totals.response_bytes += call.response_bytes
+        current = _current_call.get()
+        if current is not None:
+            current.rpcs.append(call)
+
+    @contextlib.contextmanager
+    def track(self, tool: str) -> Iterator[_ToolCall]:
+        """Attribute the RPCs made inside the block to one call of *tool*."""
+        call = _ToolCall(tool)
+        token = _current_call.set(call)
+        started = time.perf_counter()
+        try:
+            yield call
+        except BaseException as exc:
+            call.error = type(exc).__name__
+            raise
+        finally:
+            _current_call.reset(token)
+            self._finish(call, time.perf_counter() - started)
+
+    def instrument(self, tool: F) -> F:
+        """Wrap *tool* in :meth:`track`, keeping its name, docstring and signature."""
+        name = tool.__name__
+        if inspect.iscoroutinefunction(tool):
+
+            @functools.wraps(tool)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.track(name) as call:
+                    result = await tool(*args, **kwargs)
+                    call.set_result(result)
+                    return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(tool)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.track(name) as call:
+                result = tool(*args, **kwargs)
+                call.set_result(result)
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the totals per tool and per ``model.method``, busiest first."""
+        with self._lock:
+            tools = {name: totals.as_dict() for name, totals in self._tools.items()}
+            rpcs = {name: totals.as_dict() for name, totals in self._rpcs.items()}
+        for stats in rpcs.values():
+            del stats["rpc_count"], stats["result_bytes"]  # calls / not applicable
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "tools": dict(sorted(tools.items(), key=lambda item: -item[1]["calls"])),
+            "rpcs": dict(sorted(rpcs.items(), key=lambda item: -item[1]["calls"])),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self._rpcs.clear()
+            self.started_at = time.time()
+
+    # -- internal ------------------------------------------------------------
+
+    def _finish(self, call: _ToolCall, seconds: float) -> None:
+        request_bytes = sum(rpc.request_bytes for rpc in call.rpcs)
+        response_bytes = sum(rpc.response_bytes for rpc in call.rpcs)
+        with self._lock:
+            totals = self._tools.setdefault(call.tool, _Totals())
+            totals.add(seconds, call.error is not None)
+            totals.rpc_count += len(call.rpcs)
+            totals.request_bytes += request_bytes
+            totals.response_bytes += response_bytes
+            totals.result_bytes += call.result_bytes
+            if self.metrics_file is not None:
+                _append(
+                    self.metrics_file,
+                    {
+                        "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                        "tool": call.tool,
+                        "ms": _ms(seconds),
+                        "error": call.error,
+                        "rpc_count": len(call.rpcs),
+                        "request_bytes": request_bytes,
+                        "response_bytes": response_bytes,
+                        "result_bytes": call.result_bytes,
+                        "rpcs": [
+                            {
+                                "model": rpc.model,
+                                "method": rpc.orm_method or rpc.method,
+                                "ms": _ms(rpc.seconds),
+                                "request_bytes": rpc.request_bytes,
+                                "response_bytes": rpc.response_bytes,
+                                "error": rpc.error,
+                            }
+                            for rpc in call.rpcs
+                        ],
+                    },
+                )
+
+
+def _append(path: Path, record: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+    except OSError:
+        pass  # metrics must never fail a tool call
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
@@ -1,11 +1,18 @@
-"""FastMCP server definition – registers all 15 Odoo tools."""
+"""FastMCP server definition – registers all 20 Odoo tools."""
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
 from mcp.server.fastmcp import FastMCP
 
 from odoo_boost.config.schema import OdooBoostConfig
-from odoo_boost.connection.factory import create_connection
+from odoo_boost.connection.base import AsyncOdooConnection
+from odoo_boost.connection.factory import create_async_connection
 from odoo_boost.mcp_server.context import ServerContext, set_context
 
 # Tool implementations
@@ -13,8 +20,11 @@ from odoo_boost.mcp_server.tools.application_info import application_info
 from odoo_boost.mcp_server.tools.database_query import database_query
 from odoo_boost.mcp_server.tools.database_schema import database_schema
 from odoo_boost.mcp_server.tools.execute_method import execute_method
+from odoo_boost.mcp_server.tools.export_records import export_records
 from odoo_boost.mcp_server.tools.get_config import get_config
 from odoo_boost.mcp_server.tools.get_module_info import get_module_info
+from odoo_boost.mcp_server.tools.get_view_arch import get_view_arch
+from odoo_boost.mcp_server.tools.group_records import group_records
 from odoo_boost.mcp_server.tools.list_access_rights import list_access_rights
 from odoo_boost.mcp_server.tools.list_menus import list_menus
 from odoo_boost.mcp_server.tools.list_models import list_models
@@ -23,17 +33,49 @@ from odoo_boost.mcp_server.tools.list_views import list_views
 from odoo_boost.mcp_server.tools.list_workflows import list_workflows
 from odoo_boost.mcp_server.tools.read_log_entries import read_log_entries
 from odoo_boost.mcp_server.tools.search_docs import search_docs
+from odoo_boost.mcp_server.tools.search_guidelines import search_guidelines
 from odoo_boost.mcp_server.tools.search_records import search_records
+from odoo_boost.mcp_server.tools.server_stats import server_stats
+
+
+async def _authenticate(conn: AsyncOdooConnection) -> None:
+    # The HTTP pool is bound to the event loop it was opened on, so release it
+    # here; the server's own loop opens a fresh one on the first tool call.
+    try:
+        await conn.authenticate()
+    finally:
+        await conn.aclose()
+
+
+def _limit_concurrency(fn: Callable[..., Any], semaphore: asyncio.Semaphore) -> Callable[..., Any]:
+    # Sync tools run on the event loop and cannot overlap anyway
+    if not inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def limited(*args: Any, **kwargs: Any) -> Any:
+        async with semaphore:
+            return await fn(*args, **kwargs)
+
+    return limited
 
 
 def create_mcp_server(config: OdooBoostConfig) -> FastMCP:
-    """Build a FastMCP server wired to a live Odoo connection."""
+    """Build a FastMCP server wired to a live Odoo connection.
+
+    Tool handlers are coroutines sharing one non-blocking connection, so a
+    slow RPC does not stall other requests on the server's event loop. At
+    most ``server.max_concurrency`` tool calls run at once; further calls
+    wait for a free slot. ``server.host`` and ``server.port`` are used by
+    the http and sse transports.
+    """
 
-    # Establish connection
-    conn = create_connection(config.connection)
-    conn.authenticate()
+    # Establish connection (fail fast on bad credentials)
+    conn = create_async_connection(config.connection)
+    asyncio.run(_authenticate(conn))
 
-    set_context(ServerContext(connection=conn, config=config))
+    ctx = ServerContext(connection=conn, config=config)
+    set_context(ctx)
 
     mcp = FastMCP(
         "odoo-boost",
@@ -42,23 +84,37 @@ def create_mcp_server(config: OdooBoostConfig) -> FastMCP:
             "running Odoo instance. Use these tools to explore models, views, "
             "records, configuration, access rights, and more."
         ),
+        host=config.server.host,
+        port=config.server.port,
     )
 
-    # Register all tools with the FastMCP server
-    mcp.tool()(application_info)
-    mcp.tool()(database_schema)
-    mcp.tool()(database_query)
-    mcp.tool()(list_models)
-    mcp.tool()(list_views)
-    mcp.tool()(list_menus)
-    mcp.tool()(list_routes)
-    mcp.tool()(list_access_rights)
-    mcp.tool()(get_config)
-    mcp.tool()(get_module_info)
-    mcp.tool()(search_records)
-    mcp.tool()(execute_method)
-    mcp.tool()(read_log_entries)
-    mcp.tool()(search_docs)
-    mcp.tool()(list_workflows)
+    # Register all tools with the FastMCP server; each call is timed and its
+    # RPCs counted for server_stats (and the optional metrics file). Time
+    # spent waiting for a concurrency slot is not part of the tool's timing.
+    semaphore = asyncio.Semaphore(config.server.max_concurrency)
+
+    def tool(fn: Callable[..., Any]) -> None:
+        mcp.tool()(_limit_concurrency(ctx.metrics.instrument(fn), semaphore))
+
+    tool(application_info)
+    tool(database_schema)
+    tool(database_query)
+    tool(list_models)
+    tool(list_views)
+    tool(get_view_arch)
+    tool(list_menus)
+    tool(list_routes)
+    tool(list_access_rights)
+    tool(get_config)
+    tool(get_module_info)
+    tool(search_records)
+    tool(export_records)
+    tool(group_records)
+    tool(execute_method)
+    tool(read_log_entries)
+    tool(search_docs)
+    tool(search_guidelines)
+    tool(list_workflows)
+    tool(server_stats)
 
     return mcp
@@ -0,0 +1,104 @@
+"""On-disk schema snapshot shared across MCP server restarts.
+
+Every agent session starts a fresh ``odoo-boost mcp`` process, so the
+in-memory :class:`~odoo_boost.mcp_server.cache.MetadataCache` starts cold
+each time. A snapshot persists cached metadata (models, fields, modules,
+views, access rules) in a small SQLite file whose name is derived from the
+server URL, the database and the metadata fingerprint. A new fingerprint
+means a new file, so a snapshot never has to be invalidated in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+# Let SQLite memory-map up to this many bytes of the snapshot file.
+_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (``$XDG_CACHE_HOME/odoo-boost``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "odoo-boost"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+class SnapshotStore:
+    """Key/value snapshot of metadata results backed by an indexed SQLite file.
+
+    The file is opened lazily on first access. Keys and values are stored
+    as JSON, so only JSON-serialisable results should be put in the store.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_fingerprint(
+        cls, directory: Path, namespace: str, fingerprint: tuple[Any, ...]
+    ) -> SnapshotStore:
+        """Return the store for *namespace* (URL + database) at *fingerprint*.
+
+        Snapshot files left behind by older fingerprints of the same
+        namespace are removed.
+        """
+        prefix = _digest(namespace)
+        name = f"{prefix}-{_digest(json.dumps(list(fingerprint), default=str))}.sqlite"
+        if directory.is_dir():
+            for stale in directory.glob(f"{prefix}-*.sqlite"):
+                if stale.name != name:
+                    stale.unlink(missing_ok=True)
+        return cls(directory / name)
+
+    def get(self, key: Any) -> Any | None:
+        """Return the stored value for *key*, or None when absent."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM snapshot WHERE key = ?", (self._encode_key(key),))
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store *value* under *key*, replacing any previous value."""
+        encoded = json.dumps(value, default=str)
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO snapshot (key, value) VALUES (?, ?)",
+                (self._encode_key(key), encoded),
+            )
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # -- internal ------------------------------------------------------------
+
+    @staticmethod
+    def _encode_key(key: Any) -> str:
+        return json.dumps(key, default=str)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+            db.execute("CREATE TABLE IF NOT EXISTS snapshot (key TEXT PRIMARY KEY, value TEXT)")
+            self._db = db
+        return self._db
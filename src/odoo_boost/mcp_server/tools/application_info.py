@@ -2,27 +2,32 @@
 
 from __future__ import annotations
 
-import json
-
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+
 
+async def application_info(output_format: OutputFormat | None = None) -> str:
+    """Get Odoo application info: server version, installed modules, database details.
 
-def application_info() -> str:
-    """Get Odoo application info: server version, installed modules, database details."""
+    Args:
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
     conn = get_connection()
 
-    version_info = conn.get_version()
+    # Version and installed modules are independent; fetch them concurrently
+    version_info, modules = await conn.gather(
+        conn.get_version(),
+        conn.search_read(
+            "ir.module.module",
+            [("state", "=", "installed")],
+            fields=["name", "shortdesc", "installed_version"],
+            order="name",
+        ),
+    )
     server_version = version_info.get("server_version", "unknown")
     server_serie = version_info.get("server_serie", "unknown")
 
-    # Installed modules
-    modules = conn.search_read(
-        "ir.module.module",
-        [("state", "=", "installed")],
-        fields=["name", "shortdesc", "installed_version"],
-        order="name",
-    )
-
     result = {
         "server_version": server_version,
         "server_serie": server_serie,
@@ -37,4 +42,4 @@ def application_info() -> str:
             for m in modules
         ],
     }
-    return json.dumps(result, indent=2)
+    return encode_result(result, output_format)
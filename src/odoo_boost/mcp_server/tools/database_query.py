@@ -5,15 +5,18 @@ from __future__ import annotations
 import json
 
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def database_query(
+async def database_query(
     model: str,
     domain: str = "[]",
     fields: str = "[]",
     limit: int = 80,
     offset: int = 0,
     order: str = "",
+    exact_count: bool = True,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """Execute an ORM search_read on any Odoo model (safe, respects access rights).
 
@@ -24,23 +27,27 @@ def database_query(
         limit: Maximum number of records to return (default 80).
         offset: Number of records to skip (default 0).
         order: Sort order, e.g. 'name asc, id desc'.
+        exact_count: Count all matches even when the page is full (default true). Set to
+            false to skip the extra count query; total_count is then null when more
+            records may exist.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
     parsed_domain = json.loads(domain) if domain else []
     parsed_fields = json.loads(fields) if fields else []
 
-    records = conn.search_read(
+    records, total = await conn.search_read_with_count(
         model,
         domain=parsed_domain,
         fields=parsed_fields or None,
         limit=limit,
         offset=offset,
         order=order or None,
+        exact_count=exact_count,
     )
 
-    total = conn.search_count(model, domain=parsed_domain)
-
     result = {
         "model": model,
         "total_count": total,
@@ -49,4 +56,4 @@ def database_query(
         "limit": limit,
         "records": records,
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
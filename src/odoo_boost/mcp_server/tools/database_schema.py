@@ -2,33 +2,46 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def database_schema(model_name: str) -> str:
+async def database_schema(
+    model_name: str,
+    output_format: OutputFormat | None = None,
+) -> str:
     """Get the field definitions (schema) of an Odoo model.
 
     Args:
         model_name: Technical model name, e.g. 'res.partner'.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
+    result = await get_metadata_cache().get_or_load(
+        ("database_schema", model_name), lambda: _load_schema(model_name)
+    )
+    return encode_result(result, output_format)
+
+
+async def _load_schema(model_name: str) -> dict[str, Any]:
     conn = get_connection()
 
     # Look up the ir.model record
-    models = conn.search_read(
+    models = await conn.search_read(
         "ir.model",
         [("model", "=", model_name)],
         fields=["id", "name", "model", "info"],
         limit=1,
     )
     if not models:
-        return json.dumps({"error": f"Model '{model_name}' not found."})
+        return {"error": f"Model '{model_name}' not found."}
 
     ir_model = models[0]
 
     # Fetch all fields for this model
-    fields = conn.search_read(
+    fields = await conn.search_read(
         "ir.model.fields",
         [("model_id", "=", ir_model["id"])],
         fields=[
@@ -46,7 +59,7 @@ def database_schema(model_name: str) -> str:
         order="name",
     )
 
-    result = {
+    return {
         "model": ir_model["model"],
         "name": ir_model["name"],
         "info": ir_model.get("info", ""),
@@ -66,4 +79,3 @@ def database_schema(model_name: str) -> str:
             for f in fields
         ],
     }
-    return json.dumps(result, indent=2)
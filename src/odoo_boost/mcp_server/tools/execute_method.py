@@ -5,13 +5,15 @@ from __future__ import annotations
 import json
 
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def execute_method(
+async def execute_method(
     model: str,
     method: str,
     args: str = "[]",
     kwargs: str = "{}",
+    output_format: OutputFormat | None = None,
 ) -> str:
     """Execute an arbitrary ORM method on an Odoo model.
 
@@ -23,12 +25,14 @@ def execute_method(
         method: Method name, e.g. 'name_search', 'default_get', 'fields_get'.
         args: Positional arguments as JSON list, e.g. '[[1, 2, 3]]' for record IDs.
         kwargs: Keyword arguments as JSON object, e.g. '{"fields": ["name"]}'.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
     parsed_args = json.loads(args) if args else []
     parsed_kwargs = json.loads(kwargs) if kwargs else {}
 
-    result = conn.execute(model, method, *parsed_args, **parsed_kwargs)
+    result = await conn.execute(model, method, *parsed_args, **parsed_kwargs)
 
-    return json.dumps({"model": model, "method": method, "result": result}, indent=2, default=str)
+    return encode_result({"model": model, "method": method, "result": result}, output_format)
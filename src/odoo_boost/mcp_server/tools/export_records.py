@@ -0,0 +1,143 @@
+"""MCP tool: export_records – stream a whole (filtered) model to an NDJSON or CSV file."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from odoo_boost.mcp_server.context import get_connection, get_context
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+from odoo_boost.mcp_server.snapshot import default_cache_dir
+
+
+async def export_records(
+    model: str,
+    domain: str = "[]",
+    fields: str = "[]",
+    file_format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = 1000,
+    max_records: int = 0,
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Export all records matching a domain to an NDJSON or CSV file and return its path.
+
+    Use this instead of paging through search_records/database_query when you
+    need thousands of rows. Only the file path and a summary are returned.
+
+    Args:
+        model: Technical model name, e.g. 'stock.move'.
+        domain: Odoo domain filter as JSON string, e.g. '[["state","=","done"]]'.
+        fields: JSON list of field names, e.g. '["name","product_id"]'. Empty for all fields.
+        file_format: 'ndjson' (one JSON object per line) or 'csv'.
+        batch_size: Records fetched per RPC (default 1000).
+        max_records: Stop after this many records (default 0 = no limit).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
+    if batch_size < 1:
+        return encode_result({"error": "batch_size must be at least 1."}, output_format)
+    if max_records < 0:
+        return encode_result(
+            {"error": "max_records must be 0 (no limit) or positive."}, output_format
+        )
+
+    conn = get_connection()
+
+    parsed_domain = json.loads(domain) if domain else []
+    parsed_fields = json.loads(fields) if fields else []
+
+    async def fetch(last_id: int, count: int) -> list[dict[str, Any]]:
+        limit = batch_size if not max_records else min(batch_size, max_records - count)
+        return await conn.search_read(
+            model,
+            domain=[*parsed_domain, ("id", ">", last_id)],
+            fields=parsed_fields or None,
+            limit=limit,
+            order="id",
+        )
+
+    path = _new_export_path(model, file_format)
+    writer: _CsvWriter | _NdjsonWriter
+    writer = _CsvWriter(parsed_fields) if file_format == "csv" else _NdjsonWriter()
+    exported = 0
+    batches = 0
+    # Batches are never read twice, so keep them out of the shared read cache
+    with path.open("w", encoding="utf-8", newline="") as fh, conn.bypass_read_cache():
+        # Keyset pagination (id > last id) stays fast however deep the export
+        # goes. The next batch is requested before the current one is written,
+        # so the RPC round-trip overlaps with the disk write.
+        pending = asyncio.ensure_future(fetch(0, 0))
+        try:
+            while True:
+                batch = await pending
+                if not batch:
+                    break
+                batches += 1
+                exported += len(batch)
+                more = len(batch) == batch_size and (not max_records or exported < max_records)
+                if more:
+                    pending = asyncio.ensure_future(fetch(batch[-1]["id"], exported))
+                await asyncio.to_thread(writer.write, fh, batch)
+                if not more:
+                    break
+        finally:
+            pending.cancel()
+
+    result = {
+        "model": model,
+        "path": str(path),
+        "file_format": file_format,
+        "record_count": exported,
+        "batch_count": batches,
+        "size_bytes": path.stat().st_size,
+    }
+    if isinstance(writer, _CsvWriter):
+        result["columns"] = writer.columns
+    return encode_result(result, output_format)
+
+
+def _new_export_path(model: str, file_format: str) -> Path:
+    configured = get_context().config.export_dir
+    directory = Path(configured) if configured else default_cache_dir() / "exports"
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(
+        prefix=f"{model.replace('.', '_')}-", suffix=f".{file_format}", dir=directory
+    )
+    os.close(fd)  # only the unique name is needed; the file is reopened for writing
+    return Path(name)
+
+
+class _NdjsonWriter:
+    def write(self, fh: IO[str], records: list[dict[str, Any]]) -> None:
+        fh.writelines(encode_result(record, "compact") + "\n" for record in records)
+
+
+class _CsvWriter:
+    """Write records as CSV; relational values (lists) are JSON-encoded in their cell."""
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns = list(columns)
+        self._writer: Any = None
+
+    def write(self, fh: IO[str], records: list[dict[str, Any]]) -> None:
+        if self._writer is None:
+            if not self.columns:
+                self.columns = list(records[0])
+            elif "id" not in self.columns:
+                self.columns.insert(0, "id")
+            self._writer = csv.writer(fh)
+            self._writer.writerow(self.columns)
+        self._writer.writerows(
+            [_cell(record.get(col)) for col in self.columns] for record in records
+        )
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return encode_result(value, "compact")
+    return value
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-import json
-
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def get_config(
+async def get_config(
     key: str = "",
     limit: int = 100,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """Get Odoo system configuration parameters (ir.config_parameter).
 
     Args:
         key: Exact key or substring filter. Empty returns all.
         limit: Maximum number of parameters to return (default 100).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
@@ -23,7 +25,7 @@ def get_config(
     if key:
         domain.append(("key", "ilike", key))
 
-    params = conn.search_read(
+    params = await conn.search_read(
         "ir.config_parameter",
         domain=domain,
         fields=["key", "value"],
@@ -35,4 +37,4 @@ def get_config(
         "total": len(params),
         "parameters": [{"key": p["key"], "value": p.get("value", "")} for p in params],
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
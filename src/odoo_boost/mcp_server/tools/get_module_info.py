@@ -2,23 +2,76 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.connection.base import AsyncOdooConnection
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def get_module_info(module_name: str) -> str:
-    """Get detailed information about an Odoo module including dependencies and models.
+async def get_module_info(
+    module_name: str,
+    dependency_tree: bool = False,
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Get detailed information about Odoo modules including dependencies and models.
 
     Args:
-        module_name: Technical module name, e.g. 'sale' or 'account'.
+        module_name: Technical module name, e.g. 'sale', or several comma-separated
+            names, e.g. 'sale,purchase,stock'.
+        dependency_tree: Also return every transitive dependency (in load order) and
+            the direct dependencies of each module in that tree (default false).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
+    names = tuple(dict.fromkeys(n.strip() for n in module_name.split(",") if n.strip()))
+    result = await get_metadata_cache().get_or_load(
+        ("get_module_info", names, dependency_tree),
+        lambda: _load_module_info(names, dependency_tree),
+    )
+    return encode_result(result, output_format)
+
+
+async def _load_module_info(names: tuple[str, ...], dependency_tree: bool) -> dict[str, Any]:
     conn = get_connection()
 
-    # Module record
-    modules = conn.search_read(
+    # The module/dependency and model-data/model lookups are independent
+    # chains, so the whole plan costs two round-trips for any number of modules.
+    calls = [_fetch_modules(conn, names), _fetch_models(conn, names)]
+    if dependency_tree:
+        calls.append(
+            get_metadata_cache().get_or_load(("module_dependency_graph",), _load_dependency_graph)
+        )
+    modules, models, *graph = await conn.gather(*calls)
+
+    infos = {
+        mod["name"]: _module_info(mod, models.get(mod["name"], [])) for mod in modules.values()
+    }
+    if dependency_tree:
+        for name, info in infos.items():
+            closure = _dependency_closure(graph[0], name)
+            info["all_dependencies"] = closure
+            info["dependency_graph"] = {dep: graph[0].get(dep, []) for dep in [name, *closure]}
+
+    not_found = [name for name in names if name not in infos]
+    if len(names) == 1:
+        if not_found:
+            return {"error": f"Module '{names[0]}' not found."}
+        return infos[names[0]]
+    return {
+        "total": len(infos),
+        "modules": [infos[name] for name in names if name in infos],
+        "not_found": not_found,
+    }
+
+
+async def _fetch_modules(
+    conn: AsyncOdooConnection, names: tuple[str, ...]
+) -> dict[int, dict[str, Any]]:
+    """Return module records by id, each with its direct ``dependencies``."""
+    modules = await conn.search_read(
         "ir.module.module",
-        [("name", "=", module_name)],
+        [("name", "in", list(names))],
         fields=[
             "name",
             "shortdesc",
@@ -32,40 +85,96 @@ def get_module_info(module_name: str) -> str:
             "license",
             "application",
         ],
-        limit=1,
     )
-    if not modules:
-        return json.dumps({"error": f"Module '{module_name}' not found."})
+    by_id = {mod["id"]: {**mod, "dependencies": []} for mod in modules}
+    if by_id:
+        deps = await conn.search_read(
+            "ir.module.module.dependency",
+            [("module_id", "in", list(by_id))],
+            fields=["name", "auto_install_required", "module_id"],
+            order="name",
+        )
+        for dep in deps:
+            by_id[_many2one_id(dep["module_id"])]["dependencies"].append(
+                {
+                    "name": dep["name"],
+                    "auto_install_required": dep.get("auto_install_required", False),
+                }
+            )
+    return by_id
 
-    mod = modules[0]
 
-    # Dependencies
-    deps = conn.search_read(
-        "ir.module.module.dependency",
-        [("module_id.name", "=", module_name)],
-        fields=["name", "auto_install_required"],
-    )
+async def _fetch_models(
+    conn: AsyncOdooConnection, names: tuple[str, ...]
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the models registered by each module, keyed by module name.
 
-    # Models provided by this module.
-    # The `modules` field on ir.model is not stored in Odoo 19+, so we
-    # look up ir.model.data for model registrations from this module.
-    model_data = conn.search_read(
+    The ``modules`` field on ir.model is not stored in Odoo 19+, so model
+    registrations are looked up through ir.model.data.
+    """
+    model_data = await conn.search_read(
         "ir.model.data",
-        [("module", "=", module_name), ("model", "=", "ir.model")],
-        fields=["res_id"],
+        [("module", "in", list(names)), ("model", "=", "ir.model")],
+        fields=["res_id", "module"],
     )
-    model_ids = [d["res_id"] for d in model_data]
-    if model_ids:
-        models = conn.search_read(
-            "ir.model",
-            [("id", "in", model_ids)],
-            fields=["model", "name"],
-            order="model",
-        )
-    else:
-        models = []
+    if not model_data:
+        return {}
+    models = await conn.search_read(
+        "ir.model",
+        [("id", "in", [d["res_id"] for d in model_data])],
+        fields=["model", "name"],
+        order="model",
+    )
+    by_id = {m["id"]: {"model": m["model"], "name": m["name"]} for m in models}
+    result: dict[str, list[dict[str, Any]]] = {}
+    for data in model_data:
+        if data["res_id"] in by_id:
+            result.setdefault(data["module"], []).append(by_id[data["res_id"]])
+    for module_models in result.values():
+        module_models.sort(key=lambda m: m["model"])
+    return result
+
+
+async def _load_dependency_graph() -> dict[str, list[str]]:
+    """Return the direct dependencies of every module, fetched in one go."""
+    conn = get_connection()
+    modules, deps = await conn.gather(
+        conn.search_read("ir.module.module", [], fields=["name"]),
+        conn.search_read(
+            "ir.module.module.dependency", [], fields=["name", "module_id"], order="name"
+        ),
+    )
+    names = {mod["id"]: mod["name"] for mod in modules}
+    graph: dict[str, list[str]] = {}
+    for dep in deps:
+        owner = names.get(_many2one_id(dep.get("module_id")))
+        if owner:
+            graph.setdefault(owner, []).append(dep["name"])
+    return graph
+
+
+def _dependency_closure(graph: dict[str, list[str]], name: str) -> list[str]:
+    """Return all transitive dependencies of *name*, dependencies first."""
+    ordered: list[str] = []
+    seen = {name}
 
-    result = {
+    def visit(module: str) -> None:
+        for dep in graph.get(module, []):
+            if dep not in seen:
+                seen.add(dep)
+                visit(dep)
+                ordered.append(dep)
+
+    visit(name)
+    return ordered
+
+
+def _many2one_id(value: Any) -> Any:
+    return value[0] if isinstance(value, (list, tuple)) else value
+
+
+def _module_info(mod: dict[str, Any], models: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
         "name": mod["name"],
         "title": mod.get("shortdesc", ""),
         "summary": mod.get("summary", ""),
@@ -78,10 +187,6 @@ def get_module_info(module_name: str) -> str:
         else str(mod.get("category_id", "")),
         "license": mod.get("license", ""),
         "application": mod.get("application", False),
-        "dependencies": [
-            {"name": d["name"], "auto_install_required": d.get("auto_install_required", False)}
-            for d in deps
-        ],
-        "models": [{"model": m["model"], "name": m["name"]} for m in models],
+        "dependencies": mod["dependencies"],
+        "models": models,
     }
-    return json.dumps(result, indent=2, default=str)
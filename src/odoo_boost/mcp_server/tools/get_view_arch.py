@@ -0,0 +1,103 @@
+"""MCP tool: get_view_arch – combined (inheritance-resolved) view architecture."""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from typing import Any
+
+from odoo_boost.mcp_server.arch import inheritance_changes
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+
+
+async def get_view_arch(
+    model_name: str,
+    view_type: str = "form",
+    view_id: int = 0,
+    only_changes: bool = False,
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Get the final view architecture of a model with all inherited views applied.
+
+    Args:
+        model_name: Technical model name, e.g. 'sale.order'.
+        view_type: View type, e.g. 'form', 'list' (or 'tree'), 'kanban', 'search'.
+        view_id: Specific view ID (default 0 = the model's default view of that type).
+        only_changes: Instead of the combined arch, return just the changes the
+            inheriting view view_id makes to its parent: xpath targets, positions and
+            inserted XML (default false).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
+    cache = get_metadata_cache()
+    if not only_changes:
+        try:
+            result = await cache.get_or_load(
+                ("get_view_arch", model_name, view_type, view_id),
+                lambda: _load_combined_arch(model_name, view_type, view_id),
+            )
+        except Exception as exc:  # not cached, so a later call can succeed
+            result = {"error": f"Cannot load {view_type} view of '{model_name}': {exc}"}
+    elif view_id:
+        result = await cache.get_or_load(
+            ("get_view_changes", view_id), lambda: _load_view_changes(view_id)
+        )
+    else:
+        result = {"error": "only_changes requires the view_id of an inheriting view."}
+    return encode_result(result, output_format)
+
+
+async def _load_combined_arch(model_name: str, view_type: str, view_id: int) -> dict[str, Any]:
+    conn = get_connection()
+    major = await conn.server_major_version()
+
+    # The list view type is called "tree" up to Odoo 17 and "list" from 18 on.
+    if major >= 18 and view_type == "tree":
+        view_type = "list"
+    elif major < 18 and view_type == "list":
+        view_type = "tree"
+
+    if major >= 16:
+        views = await conn.execute(
+            model_name, "get_views", [[view_id or False, view_type]], options={}
+        )
+        view = views["views"][view_type]
+        arch, resolved_id = view["arch"], view.get("id")
+    else:
+        view = await conn.execute(model_name, "fields_view_get", view_id or False, view_type)
+        arch, resolved_id = view["arch"], view.get("view_id")
+
+    return {
+        "model": model_name,
+        "view_type": view_type,
+        "view_id": resolved_id,
+        "arch": arch,
+    }
+
+
+async def _load_view_changes(view_id: int) -> dict[str, Any]:
+    conn = get_connection()
+    views = await conn.search_read(
+        "ir.ui.view",
+        [("id", "=", view_id)],
+        fields=["name", "model", "type", "arch", "inherit_id"],
+        limit=1,
+    )
+    if not views:
+        return {"error": f"View {view_id} not found."}
+    view = views[0]
+    if not view.get("inherit_id"):
+        return {"error": f"View {view_id} ('{view['name']}') does not inherit from another view."}
+    try:
+        changes = inheritance_changes(view["arch"] or "")
+    except ET.ParseError as exc:  # malformed or empty arch
+        return {"error": f"Cannot parse arch of view {view_id}: {exc}"}
+
+    return {
+        "view_id": view["id"],
+        "name": view["name"],
+        "model": view["model"],
+        "type": view["type"],
+        "inherit_id": view["inherit_id"],
+        "changes": changes,
+    }
@@ -0,0 +1,57 @@
+"""MCP tool: group_records – server-side read_group aggregation (sums, counts, averages)."""
+
+from __future__ import annotations
+
+import json
+
+from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+
+
+async def group_records(
+    model: str,
+    groupby: str,
+    aggregates: str = "[]",
+    domain: str = "[]",
+    order: str = "",
+    limit: int = 0,
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Group and aggregate records in the database (read_group) instead of fetching raw rows.
+
+    Args:
+        model: Technical model name, e.g. 'sale.order'.
+        groupby: JSON list of fields to group by. Date fields take a granularity
+            (day, week, month, quarter, year), e.g. '["user_id","date_order:month"]'.
+        aggregates: JSON list of 'field:function' specs, e.g. '["amount_total:sum"]'.
+            Functions: sum, avg, min, max, count, count_distinct. The record count of
+            each group is always returned as __count.
+        domain: Odoo domain filter as JSON string, e.g. '[["state","=","sale"]]'.
+        order: Sort order of the groups, e.g. 'date_order:month desc'.
+        limit: Maximum number of groups to return (default 0 = all).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
+    conn = get_connection()
+
+    parsed_groupby = json.loads(groupby) if groupby else []
+    parsed_aggregates = json.loads(aggregates) if aggregates else []
+    parsed_domain = json.loads(domain) if domain else []
+
+    groups = await conn.read_group(
+        model,
+        domain=parsed_domain,
+        groupby=parsed_groupby,
+        aggregates=parsed_aggregates,
+        order=order or None,
+        limit=limit or None,
+    )
+
+    result = {
+        "model": model,
+        "groupby": parsed_groupby,
+        "aggregates": parsed_aggregates,
+        "group_count": len(groups),
+        "groups": groups,
+    }
+    return encode_result(result, output_format)
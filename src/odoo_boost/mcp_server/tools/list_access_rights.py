@@ -2,68 +2,47 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.connection.base import AsyncOdooConnection
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_access_rights(
+async def list_access_rights(
     model_name: str = "",
     limit: int = 100,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """List access rights (ir.model.access) and record rules (ir.rule) for a model.
 
     Args:
         model_name: Filter by model technical name (e.g. 'res.partner').
         limit: Maximum number of entries to return per type (default 100).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
-    conn = get_connection()
+    result = await get_metadata_cache().get_or_load(
+        ("list_access_rights", model_name, limit),
+        lambda: _load_access_rights(model_name, limit),
+    )
+    return encode_result(result, output_format)
 
-    # --- ACL (ir.model.access) ---
-    acl_domain: list = []
-    if model_name:
-        acl_domain.append(("model_id.model", "=", model_name))
 
-    acls = conn.search_read(
-        "ir.model.access",
-        domain=acl_domain,
-        fields=[
-            "name",
-            "model_id",
-            "group_id",
-            "perm_read",
-            "perm_write",
-            "perm_create",
-            "perm_unlink",
-        ],
-        limit=limit,
-        order="model_id, name",
-    )
+async def _load_access_rights(model_name: str, limit: int) -> dict[str, Any]:
+    conn = get_connection()
 
-    # --- Record rules (ir.rule) ---
-    rule_domain: list = []
+    domain: list = []
     if model_name:
-        rule_domain.append(("model_id.model", "=", model_name))
+        domain.append(("model_id.model", "=", model_name))
 
-    rules = conn.search_read(
-        "ir.rule",
-        domain=rule_domain,
-        fields=[
-            "name",
-            "model_id",
-            "groups",
-            "domain_force",
-            "perm_read",
-            "perm_write",
-            "perm_create",
-            "perm_unlink",
-            "global",
-        ],
-        limit=limit,
-        order="model_id, name",
+    # ACLs and record rules are independent; fetch them concurrently
+    acls, rules = await conn.gather(
+        _fetch_acls(conn, domain, limit),
+        _fetch_rules(conn, domain, limit),
     )
 
-    result = {
+    return {
         "model_filter": model_name or "(all)",
         "access_rights": [
             {
@@ -97,4 +76,41 @@ def list_access_rights(
             for r in rules
         ],
     }
-    return json.dumps(result, indent=2, default=str)
+
+
+async def _fetch_acls(conn: AsyncOdooConnection, domain: list, limit: int) -> list[dict[str, Any]]:
+    return await conn.search_read(
+        "ir.model.access",
+        domain=domain,
+        fields=[
+            "name",
+            "model_id",
+            "group_id",
+            "perm_read",
+            "perm_write",
+            "perm_create",
+            "perm_unlink",
+        ],
+        limit=limit,
+        order="model_id, name",
+    )
+
+
+async def _fetch_rules(conn: AsyncOdooConnection, domain: list, limit: int) -> list[dict[str, Any]]:
+    return await conn.search_read(
+        "ir.rule",
+        domain=domain,
+        fields=[
+            "name",
+            "model_id",
+            "groups",
+            "domain_force",
+            "perm_read",
+            "perm_write",
+            "perm_create",
+            "perm_unlink",
+            "global",
+        ],
+        limit=limit,
+        order="model_id, name",
+    )
@@ -1,52 +1,125 @@
-"""MCP tool: list_menus – ir.ui.menu hierarchy."""
+"""MCP tool: list_menus – ir.ui.menu hierarchy, one level or as a tree."""
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_menus(
+async def list_menus(
     parent_id: int = 0,
     limit: int = 200,
+    tree: bool = False,
+    max_depth: int = 0,
+    output_format: OutputFormat | None = None,
 ) -> str:
-    """List Odoo menu items (ir.ui.menu).
+    """List Odoo menu items (ir.ui.menu), one level at a time or as a nested tree.
 
     Args:
         parent_id: Filter by parent menu ID. 0 = root menus only. -1 = all menus.
-        limit: Maximum number of menus to return (default 200).
+            In tree mode, a positive ID returns the subtree below that menu.
+        limit: Maximum number of menus to return (default 200). Ignored in tree mode.
+        tree: Return the nested menu hierarchy instead of a flat list (default false).
+        max_depth: Levels to expand in tree mode (default 0 = unlimited). Menus
+            below the cut-off are only reported through child_count.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
-    conn = get_connection()
+    menus = await get_metadata_cache().get_or_load(("menu_index",), _load_menu_index)
+    by_id = {m["id"]: m for m in menus}
+    children: dict[int | None, list[dict[str, Any]]] = {}
+    for menu in menus:
+        parent = menu["parent_id"] if menu["parent_id"] in by_id else None
+        children.setdefault(parent, []).append(menu)
 
-    domain: list = []
-    if parent_id == 0:
-        domain.append(("parent_id", "=", False))
-    elif parent_id > 0:
-        domain.append(("parent_id", "=", parent_id))
-    # parent_id == -1 means no filter (all menus)
+    if parent_id > 0 and parent_id not in by_id:
+        return encode_result({"error": f"Menu {parent_id} not found."}, output_format)
 
-    menus = conn.search_read(
-        "ir.ui.menu",
-        domain=domain,
-        fields=["name", "parent_id", "action", "sequence", "child_id", "complete_name"],
-        limit=limit,
-        order="sequence, id",
-    )
+    if tree:
+        roots = [by_id[parent_id]] if parent_id > 0 else children.get(None, [])
+        nodes = [_tree_node(m, children, max_depth, 1) for m in roots]
+        result = {"total": _count_nodes(nodes), "menus": nodes}
+        return encode_result(result, output_format)
+
+    selected = menus if parent_id == -1 else children.get(parent_id or None, [])
+    selected = selected[:limit]
 
     result = {
-        "total": len(menus),
+        "total": len(selected),
         "menus": [
             {
                 "id": m["id"],
                 "name": m["name"],
-                "complete_name": m.get("complete_name", ""),
-                "parent_id": m.get("parent_id", False) or None,
-                "action": str(m.get("action", "")) if m.get("action") else None,
-                "sequence": m.get("sequence", 10),
-                "child_count": len(m.get("child_id", [])),
+                "complete_name": _complete_name(m, by_id),
+                "parent_id": m["parent_id"],
+                "action": m["action"],
+                "sequence": m["sequence"],
+                "child_count": len(children.get(m["id"], [])),
             }
-            for m in menus
+            for m in selected
         ],
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
+
+
+async def _load_menu_index() -> list[dict[str, Any]]:
+    """Fetch every visible menu once, with just the fields needed to build the tree."""
+    conn = get_connection()
+    menus = await conn.search_read(
+        "ir.ui.menu",
+        [],
+        fields=["name", "parent_id", "action", "sequence"],
+        order="sequence, id",
+    )
+    return [
+        {
+            "id": m["id"],
+            "name": m["name"],
+            "parent_id": _many2one_id(m.get("parent_id")),
+            "action": str(m["action"]) if m.get("action") else None,
+            "sequence": m.get("sequence", 10),
+        }
+        for m in menus
+    ]
+
+
+def _tree_node(
+    menu: dict[str, Any],
+    children: dict[int | None, list[dict[str, Any]]],
+    max_depth: int,
+    depth: int,
+) -> dict[str, Any]:
+    kids = children.get(menu["id"], [])
+    node = {
+        "id": menu["id"],
+        "name": menu["name"],
+        "action": menu["action"],
+        "sequence": menu["sequence"],
+        "child_count": len(kids),
+    }
+    if kids and (not max_depth or depth < max_depth):
+        node["children"] = [_tree_node(kid, children, max_depth, depth + 1) for kid in kids]
+    return node
+
+
+def _count_nodes(nodes: list[dict[str, Any]]) -> int:
+    return sum(1 + _count_nodes(node.get("children", [])) for node in nodes)
+
+
+def _complete_name(menu: dict[str, Any], by_id: dict[int, dict[str, Any]]) -> str:
+    names = [menu["name"]]
+    seen = {menu["id"]}
+    parent = by_id.get(menu["parent_id"])
+    while parent is not None and parent["id"] not in seen:
+        names.append(parent["name"])
+        seen.add(parent["id"])
+        parent = by_id.get(parent["parent_id"])
+    return " / ".join(reversed(names))
+
+
+def _many2one_id(value: Any) -> int | None:
+    if isinstance(value, (list, tuple)):
+        return value[0] if value else None
+    return value or None
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_models(
+async def list_models(
     filter_name: str = "",
     filter_module: str = "",
     limit: int = 200,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """List available Odoo models with field counts.
 
@@ -18,7 +20,17 @@ def list_models(
         filter_name: Optional substring filter on model technical name.
         filter_module: Optional module name filter (models belonging to a module).
         limit: Maximum number of models to return (default 200).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
+    result = await get_metadata_cache().get_or_load(
+        ("list_models", filter_name, filter_module, limit),
+        lambda: _load_models(filter_name, filter_module, limit),
+    )
+    return encode_result(result, output_format)
+
+
+async def _load_models(filter_name: str, filter_module: str, limit: int) -> dict[str, Any]:
     conn = get_connection()
 
     domain: list = []
@@ -27,33 +39,46 @@ def list_models(
 
     # If filtering by module, look up model IDs via ir.model.data first
     if filter_module:
-        model_data = conn.search_read(
+        model_data = await conn.search_read(
             "ir.model.data",
             [("module", "=", filter_module), ("model", "=", "ir.model")],
             fields=["res_id"],
         )
         model_ids = [d["res_id"] for d in model_data]
         if not model_ids:
-            return json.dumps({"total": 0, "models": []}, indent=2)
+            return {"total": 0, "models": []}
         domain.append(("id", "in", model_ids))
 
-    models = conn.search_read(
+    models = await conn.search_read(
         "ir.model",
         domain=domain,
-        fields=["model", "name", "info", "field_id"],
+        fields=["model", "name", "info"],
         limit=limit,
         order="model",
     )
 
-    result = {
+    # Count fields with one grouped query instead of reading every field id
+    counts: dict[int, int] = {}
+    if models:
+        groups = await conn.read_group(
+            "ir.model.fields",
+            [("model_id", "in", [m["id"] for m in models])],
+            groupby=["model_id"],
+        )
+        for group in groups:
+            model_id = group["model_id"]
+            if isinstance(model_id, (list, tuple)):
+                model_id = model_id[0]
+            counts[model_id] = group["__count"]
+
+    return {
         "total": len(models),
         "models": [
             {
                 "model": m["model"],
                 "name": m["name"],
-                "field_count": len(m.get("field_id", [])),
+                "field_count": counts.get(m["id"], 0),
             }
             for m in models
         ],
     }
-    return json.dumps(result, indent=2)
@@ -2,38 +2,51 @@
 
 from __future__ import annotations
 
-import json
-
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_routes(
+async def list_routes(
     filter_url: str = "",
     limit: int = 100,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """List website pages and known controller routes.
 
     Args:
         filter_url: Optional substring filter on URL path.
         limit: Maximum number of routes to return (default 100).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
     routes: list[dict] = []
 
-    # 1. Try website.page (if website module is installed)
-    try:
-        domain: list = []
-        if filter_url:
-            domain.append(("url", "ilike", filter_url))
+    domain: list = []
+    if filter_url:
+        domain.append(("url", "ilike", filter_url))
 
-        pages = conn.search_read(
+    # Both queries are independent; a failure means the model is missing
+    pages, url_rewrites = await conn.gather(
+        conn.search_read(
             "website.page",
             domain=domain,
             fields=["name", "url", "is_published", "website_id"],
             limit=limit,
             order="url",
-        )
+        ),
+        conn.search_read(
+            "website.rewrite",
+            domain=domain,
+            fields=["name", "url_from", "url_to"],
+            limit=limit,
+        ),
+        return_exceptions=True,
+    )
+
+    # 1. website.page (if website module is installed)
+    if not isinstance(pages, Exception):
         for p in pages:
             routes.append(
                 {
@@ -43,21 +56,9 @@ def list_routes(
                     "published": p.get("is_published", False),
                 }
             )
-    except Exception:
-        pass  # website module not installed
 
-    # 2. Try ir.http routing rules (available on all versions)
-    try:
-        domain = []
-        if filter_url:
-            domain.append(("url", "ilike", filter_url))
-
-        url_rewrites = conn.search_read(
-            "website.rewrite",
-            domain=domain,
-            fields=["name", "url_from", "url_to"],
-            limit=limit,
-        )
+    # 2. website.rewrite URL rewrites (model may not exist)
+    if not isinstance(url_rewrites, Exception):
         for r in url_rewrites:
             routes.append(
                 {
@@ -67,11 +68,9 @@ def list_routes(
                     "name": r.get("name", ""),
                 }
             )
-    except Exception:
-        pass  # model may not exist
 
     result = {
         "total": len(routes),
         "routes": routes,
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
@@ -1,24 +1,57 @@
-"""MCP tool: list_views – ir.ui.view with arch XML, filter by model/type."""
+"""MCP tool: list_views – ir.ui.view index, with optional arch XML or arch summaries."""
 
 from __future__ import annotations
 
 import json
+import xml.etree.ElementTree as ET
+from typing import Any
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.arch import summarize_arch
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_views(
+async def list_views(
     model_name: str = "",
     view_type: str = "",
     limit: int = 50,
+    view_ids: str = "[]",
+    include_arch: bool = False,
+    summarize: bool = False,
+    output_format: OutputFormat | None = None,
 ) -> str:
-    """List Odoo views (ir.ui.view), optionally filtered by model or type.
+    """List Odoo views (ir.ui.view), optionally filtered by model, type or IDs.
+
+    Without include_arch or summarize only the view index (name, type, priority,
+    inheritance) is returned, which is cheap even for models with many views.
 
     Args:
         model_name: Filter by model technical name (e.g. 'res.partner').
         view_type: Filter by view type (e.g. 'form', 'tree', 'kanban', 'search').
         limit: Maximum number of views to return (default 50).
+        view_ids: JSON list of view IDs to fetch, e.g. '[101, 102]'. Empty for no filter.
+        include_arch: Include the full arch XML of each view (default false).
+        summarize: Include an arch summary instead: referenced field names, xpath
+            targets and node count (default false).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
+    parsed_ids = tuple(json.loads(view_ids)) if view_ids else ()
+    result = await get_metadata_cache().get_or_load(
+        ("list_views", model_name, view_type, limit, parsed_ids, include_arch, summarize),
+        lambda: _load_views(model_name, view_type, limit, parsed_ids, include_arch, summarize),
+    )
+    return encode_result(result, output_format)
+
+
+async def _load_views(
+    model_name: str,
+    view_type: str,
+    limit: int,
+    view_ids: tuple[int, ...],
+    include_arch: bool,
+    summarize: bool,
+) -> dict[str, Any]:
     conn = get_connection()
 
     domain: list = []
@@ -26,29 +59,42 @@ def list_views(
         domain.append(("model", "=", model_name))
     if view_type:
         domain.append(("type", "=", view_type))
+    if view_ids:
+        domain.append(("id", "in", list(view_ids)))
 
-    views = conn.search_read(
+    fields = ["name", "model", "type", "inherit_id", "priority", "active"]
+    if include_arch or summarize:
+        fields.append("arch")
+    views = await conn.search_read(
         "ir.ui.view",
         domain=domain,
-        fields=["name", "model", "type", "arch", "inherit_id", "priority", "active"],
+        fields=fields,
         limit=limit,
         order="model, priority",
     )
 
-    result = {
-        "total": len(views),
-        "views": [
-            {
-                "id": v["id"],
-                "name": v["name"],
-                "model": v["model"],
-                "type": v["type"],
-                "priority": v.get("priority", 16),
-                "inherit_id": v.get("inherit_id", False) or None,
-                "active": v.get("active", True),
-                "arch": v.get("arch", ""),
-            }
-            for v in views
-        ],
-    }
-    return json.dumps(result, indent=2, default=str)
+    entries = []
+    for v in views:
+        entry = {
+            "id": v["id"],
+            "name": v["name"],
+            "model": v["model"],
+            "type": v["type"],
+            "priority": v.get("priority", 16),
+            "inherit_id": v.get("inherit_id", False) or None,
+            "active": v.get("active", True),
+        }
+        if summarize:
+            entry["summary"] = _summary(v.get("arch") or "")
+        if include_arch:
+            entry["arch"] = v.get("arch", "")
+        entries.append(entry)
+
+    return {"total": len(entries), "views": entries}
+
+
+def _summary(arch: str) -> dict[str, Any]:
+    try:
+        return summarize_arch(arch)
+    except ET.ParseError as exc:  # malformed or empty arch
+        return {"error": f"Cannot parse arch: {exc}"}
@@ -2,39 +2,53 @@
 
 from __future__ import annotations
 
-import json
-
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def list_workflows(
+async def list_workflows(
     model_name: str = "",
     limit: int = 50,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """List automated actions (base.automation) and server actions (ir.actions.server).
 
     Args:
         model_name: Filter by model technical name (e.g. 'sale.order').
         limit: Maximum entries per type (default 50).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
     automations: list[dict] = []
     server_actions: list[dict] = []
 
-    # 1. base.automation (automated actions)
-    try:
-        auto_domain: list = []
-        if model_name:
-            auto_domain.append(("model_name", "=", model_name))
+    domain: list = []
+    if model_name:
+        domain.append(("model_name", "=", model_name))
 
-        autos = conn.search_read(
+    # Both queries are independent; a failure means the model is missing
+    autos, actions = await conn.gather(
+        conn.search_read(
             "base.automation",
-            domain=auto_domain,
+            domain=domain,
             fields=["name", "model_name", "trigger", "active", "action_server_ids"],
             limit=limit,
             order="model_name, name",
-        )
+        ),
+        conn.search_read(
+            "ir.actions.server",
+            domain=domain,
+            fields=["name", "model_name", "state", "code", "sequence"],
+            limit=limit,
+            order="model_name, sequence, name",
+        ),
+        return_exceptions=True,
+    )
+
+    # 1. base.automation (base_automation module may not be installed)
+    if not isinstance(autos, Exception):
         for a in autos:
             automations.append(
                 {
@@ -46,22 +60,9 @@ def list_workflows(
                     "server_action_count": len(a.get("action_server_ids", [])),
                 }
             )
-    except Exception:
-        pass  # base_automation module may not be installed
 
     # 2. ir.actions.server
-    sa_domain: list = []
-    if model_name:
-        sa_domain.append(("model_name", "=", model_name))
-
-    try:
-        actions = conn.search_read(
-            "ir.actions.server",
-            domain=sa_domain,
-            fields=["name", "model_name", "state", "code", "sequence"],
-            limit=limit,
-            order="model_name, sequence, name",
-        )
+    if not isinstance(actions, Exception):
         for a in actions:
             server_actions.append(
                 {
@@ -73,12 +74,10 @@ def list_workflows(
                     "sequence": a.get("sequence", 5),
                 }
             )
-    except Exception:
-        pass
 
     result = {
         "model_filter": model_name or "(all)",
         "automated_actions": automations,
         "server_actions": server_actions,
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
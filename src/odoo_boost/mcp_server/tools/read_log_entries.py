@@ -1,24 +1,66 @@
-"""MCP tool: read_log_entries – ir.logging entries (if log_db configured)."""
+"""MCP tool: read_log_entries – ir.logging entries (log_db) or an indexed local log file."""
 
 from __future__ import annotations
 
-import json
+import asyncio
+from typing import Any, Literal
 
-from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.context import get_connection, get_log_index
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+from odoo_boost.mcp_server.logfile import LogFileIndex
 
 
-def read_log_entries(
+async def read_log_entries(
     level: str = "",
     func: str = "",
     limit: int = 50,
+    cursor: int = 0,
+    name: str = "",
+    path: str = "",
+    since: str = "",
+    until: str = "",
+    message: str = "",
+    source: Literal["auto", "database", "file"] = "auto",
+    output_format: OutputFormat | None = None,
 ) -> str:
-    """Read Odoo log entries from ir.logging (requires log_db to be configured).
+    """Read Odoo log entries from ir.logging (log_db) or from the configured log file.
+
+    Without a cursor the newest entries are returned. Every result carries a
+    cursor; pass it back to get only the entries logged since (oldest first).
 
     Args:
         level: Filter by log level (e.g. 'WARNING', 'ERROR', 'CRITICAL').
         func: Filter by function name substring.
         limit: Maximum entries to return (default 50).
+        cursor: Cursor from a previous call; only newer entries are returned.
+        name: Filter by logger name substring (e.g. 'odoo.addons.sale').
+        path: Filter by source file path substring.
+        since: Only entries logged at or after this time ('YYYY-MM-DD HH:MM:SS', UTC).
+        until: Only entries logged at or before this time ('YYYY-MM-DD HH:MM:SS', UTC).
+        message: Filter by message substring.
+        source: 'database' reads ir.logging (requires log_db in odoo.conf), 'file' reads
+            the log_file set in odoo-boost.json. 'auto' (default) uses the log file when
+            one is configured. func and path filters only apply to the database.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
+    log_index = get_log_index()
+    if source == "file" or (source == "auto" and log_index is not None):
+        if log_index is None:
+            return encode_result(
+                {"error": "No log_file configured in odoo-boost.json."}, output_format
+            )
+        entries = await asyncio.to_thread(
+            _search_log_file, log_index, level, name, since, until, cursor, message, limit
+        )
+        result = {
+            "source": "file",
+            "total": len(entries),
+            "cursor": max((entry["id"] for entry in entries), default=cursor),
+            "entries": entries,
+        }
+        return encode_result(result, output_format)
+
     conn = get_connection()
 
     domain: list = []
@@ -26,27 +68,44 @@ def read_log_entries(
         domain.append(("level", "=", level.upper()))
     if func:
         domain.append(("func", "ilike", func))
+    if name:
+        domain.append(("name", "ilike", name))
+    if path:
+        domain.append(("path", "ilike", path))
+    if since:
+        domain.append(("create_date", ">=", since))
+    if until:
+        domain.append(("create_date", "<=", until))
+    if message:
+        domain.append(("message", "ilike", message))
+    if cursor:
+        domain.append(("id", ">", cursor))
 
     try:
-        logs = conn.search_read(
+        logs = await conn.search_read(
             "ir.logging",
             domain=domain,
             fields=["create_date", "name", "level", "dbname", "func", "path", "line", "message"],
             limit=limit,
-            order="create_date desc",
+            # Following a cursor reads forward so no entry is skipped between polls
+            order="id asc" if cursor else "id desc",
         )
     except Exception as exc:
-        return json.dumps(
+        return encode_result(
             {
                 "error": f"Cannot read ir.logging: {exc}. "
                 "Ensure log_db is configured in odoo.conf.",
-            }
+            },
+            output_format,
         )
 
     result = {
+        "source": "database",
         "total": len(logs),
+        "cursor": max((entry["id"] for entry in logs), default=cursor),
         "entries": [
             {
+                "id": entry["id"],
                 "timestamp": entry.get("create_date", ""),
                 "level": entry.get("level", ""),
                 "name": entry.get("name", ""),
@@ -58,4 +117,26 @@ def read_log_entries(
             for entry in logs
         ],
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
+
+
+def _search_log_file(
+    log_index: LogFileIndex,
+    level: str,
+    name: str,
+    since: str,
+    until: str,
+    cursor: int,
+    message: str,
+    limit: int,
+) -> list[dict[str, Any]]:
+    log_index.refresh()
+    return log_index.search(
+        level=level,
+        logger=name,
+        since=since,
+        until=until,
+        cursor=cursor,
+        text=message,
+        limit=limit,
+    )
@@ -1,8 +1,9 @@
-"""MCP tool: search_docs – Odoo documentation links by topic/version."""
+"""MCP tool: search_docs – Odoo documentation links plus matching bundled passages."""
 
 from __future__ import annotations
 
-import json
+from odoo_boost.knowledge import get_index
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 # Static map of documentation topics to URLs.
 # This covers the most common Odoo dev doc sections.
@@ -86,17 +87,29 @@ _TOPICS: dict[str, dict[str, str]] = {
     },
 }
 
+# Passages longer than this are cut; search_guidelines returns whole sections.
+_EXCERPT_CHARS = 800
+
 
 def search_docs(
     topic: str = "",
     version: str = "",
+    limit: int = 5,
+    output_format: OutputFormat | None = None,
 ) -> str:
-    """Search Odoo documentation and return relevant links.
+    """Search Odoo documentation: returns doc links and the most relevant bundled passages.
+
+    Passages come from a local full-text index over the Odoo Boost guidelines and
+    skills, so they answer common questions without fetching the linked pages.
 
     Args:
-        topic: Topic keyword (e.g. 'orm', 'views', 'security', 'owl', 'testing').
+        topic: Topic keyword (e.g. 'orm', 'views', 'security', 'owl', 'testing') or a
+               free-text question (e.g. 'record rule domain').
                Leave empty to list all available topics.
         version: Odoo version (e.g. '17.0', '18.0', '19.0'). Defaults to latest.
+        limit: Maximum number of passages to return (default 5).
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     ver = version.replace(".0", "") if version else "18"
 
@@ -106,7 +119,7 @@ def search_docs(
             {"topic": k, "title": v["title"], "description": v["description"]}
             for k, v in _TOPICS.items()
         ]
-        return json.dumps({"available_topics": all_topics}, indent=2)
+        return encode_result({"available_topics": all_topics}, output_format)
 
     # Search by keyword
     matches = []
@@ -127,13 +140,29 @@ def search_docs(
                 }
             )
 
-    if not matches:
-        return json.dumps(
+    passages = [
+        {
+            "id": section.id,
+            "title": section.title,
+            "score": score,
+            "text": _excerpt(section.text),
+        }
+        for score, section in get_index().search(topic, limit=limit, version=ver)
+    ]
+
+    if not matches and not passages:
+        return encode_result(
             {
                 "message": f"No documentation found for '{topic}'.",
                 "available_topics": list(_TOPICS.keys()),
             },
-            indent=2,
+            output_format,
         )
 
-    return json.dumps({"results": matches}, indent=2)
+    return encode_result({"results": matches, "passages": passages}, output_format)
+
+
+def _excerpt(text: str) -> str:
+    if len(text) <= _EXCERPT_CHARS:
+        return text
+    return text[:_EXCERPT_CHARS].rsplit("\n", 1)[0] + "\n…"
@@ -0,0 +1,75 @@
+"""MCP tool: search_guidelines – relevant guideline and skill sections instead of whole files."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from odoo_boost.knowledge import get_index
+from odoo_boost.mcp_server.context import get_context
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+
+_SOURCES = {
+    "all": None,
+    "guidelines": ("guideline", "version"),
+    "skills": ("skill",),
+}
+
+
+def search_guidelines(
+    query: str = "",
+    source: Literal["all", "guidelines", "skills"] = "all",
+    version: str = "",
+    limit: int = 3,
+    section_id: str = "",
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Search the Odoo Boost guidelines and skills and return only the matching sections.
+
+    Sections are split on markdown headings, so a result is a few hundred words
+    on one subject (e.g. record rules, computed fields, OWL hooks) rather than
+    the full guideline document.
+
+    Args:
+        query: What you need guidance on, e.g. 'record rules for multi-company'.
+        source: 'guidelines', 'skills' (step-by-step recipes) or 'all' (default).
+        version: Odoo version (e.g. '17.0'). Defaults to the configured odoo_version;
+            addenda for other versions are skipped.
+        limit: Maximum number of sections to return (default 3).
+        section_id: Return this section (an 'id' from a previous result) instead of searching.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
+    index = get_index()
+
+    if section_id:
+        section = index.get(section_id)
+        if section is None:
+            return encode_result({"error": f"Section '{section_id}' not found."}, output_format)
+        return encode_result(_section_dict(section), output_format)
+
+    if not query:
+        documents = sorted({section.document for section in index.sections})
+        return encode_result({"documents": documents}, output_format)
+
+    version = version or get_context().config.odoo_version or ""
+    major = version.split(".")[0] or None
+    results = index.search(query, limit=limit, sources=_SOURCES[source], version=major)
+
+    result = {
+        "query": query,
+        "total": len(results),
+        "sections": [_section_dict(section, score) for score, section in results],
+    }
+    return encode_result(result, output_format)
+
+
+def _section_dict(section: Any, score: float | None = None) -> dict[str, Any]:
+    data = {
+        "id": section.id,
+        "title": section.title,
+        "source": section.source,
+    }
+    if score is not None:
+        data["score"] = score
+    data["text"] = section.text
+    return data
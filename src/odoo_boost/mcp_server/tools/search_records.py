@@ -5,15 +5,18 @@ from __future__ import annotations
 import json
 
 from odoo_boost.mcp_server.context import get_connection
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
 
 
-def search_records(
+async def search_records(
     model: str,
     domain: str = "[]",
     fields: str = "[]",
     limit: int = 20,
     offset: int = 0,
     order: str = "",
+    exact_count: bool = True,
+    output_format: OutputFormat | None = None,
 ) -> str:
     """Search and read records from any Odoo model with domain filtering and pagination.
 
@@ -24,23 +27,27 @@ def search_records(
         limit: Maximum records to return (default 20).
         offset: Number of records to skip (default 0).
         order: Sort order, e.g. 'name asc, id desc'.
+        exact_count: Count all matches even when the page is full (default true). Set to
+            false to skip the extra count query; total_count is then null when more
+            records may exist.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
     """
     conn = get_connection()
 
     parsed_domain = json.loads(domain) if domain else []
     parsed_fields = json.loads(fields) if fields else []
 
-    records = conn.search_read(
+    records, total = await conn.search_read_with_count(
         model,
         domain=parsed_domain,
         fields=parsed_fields or None,
         limit=limit,
         offset=offset,
         order=order or None,
+        exact_count=exact_count,
     )
 
-    total = conn.search_count(model, domain=parsed_domain)
-
     result = {
         "model": model,
         "total_count": total,
@@ -49,4 +56,4 @@ def search_records(
         "limit": limit,
         "records": records,
     }
-    return json.dumps(result, indent=2, default=str)
+    return encode_result(result, output_format)
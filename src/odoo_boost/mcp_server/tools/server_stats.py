@@ -0,0 +1,56 @@
+"""MCP tool: server_stats – per-tool and per-RPC metrics of this MCP server."""
+
+from __future__ import annotations
+
+from odoo_boost.mcp_server.context import get_connection, get_metadata_cache, get_metrics
+from odoo_boost.mcp_server.encoding import OutputFormat, encode_result
+
+
+def server_stats(
+    limit: int = 20,
+    reset: bool = False,
+    output_format: OutputFormat | None = None,
+) -> str:
+    """Show how many Odoo RPCs each tool call made, how long they took and how much data moved.
+
+    Reports, since the server started (or the last reset), per tool: calls,
+    errors, avg/p50/p95/max latency, RPC count, request/response bytes sent
+    to and received from Odoo and result bytes returned to the agent; per
+    Odoo ``model.method``: calls, errors, latency and bytes; the metadata
+    cache hit rate; and how many read RPCs were saved by sharing identical
+    concurrent calls or reusing a recent result.
+
+    Args:
+        limit: Maximum number of tools and of model.method entries to list, busiest first.
+        reset: Clear the collected statistics, incl. the cache and shared read counters,
+            after returning them.
+        output_format: 'pretty', 'compact' or 'columnar' (record lists as columns + rows).
+            Defaults to the output_format setting.
+    """
+    metrics = get_metrics()
+    cache = get_metadata_cache()
+    conn = get_connection()
+
+    snapshot = metrics.snapshot()
+    lookups = cache.hits + cache.disk_hits + cache.misses
+    result = {
+        "uptime_s": snapshot["uptime_s"],
+        "tools": [{"tool": name, **stats} for name, stats in snapshot["tools"].items()][:limit],
+        "rpcs": [{"call": name, **stats} for name, stats in snapshot["rpcs"].items()][:limit],
+        "cache": {
+            "enabled": cache.enabled,
+            "entries": len(cache),
+            "hits": cache.hits,
+            "disk_hits": cache.disk_hits,
+            "misses": cache.misses,
+            "hit_rate": round((cache.hits + cache.disk_hits) / lookups, 3) if lookups else None,
+        },
+        "shared_reads": {"coalesced": conn.coalesced_reads, "cached": conn.cached_reads},
+    }
+    if metrics.metrics_file is not None:
+        result["metrics_file"] = str(metrics.metrics_file)
+    if reset:
+        metrics.reset()
+        cache.reset_stats()
+        conn.reset_read_stats()
+    return encode_result(result, output_format)
@@ -8,7 +8,17 @@ import pytest
 
 from odoo_boost.config.schema import OdooBoostConfig
 from odoo_boost.config.schema import OdooConnection as OdooConnectionConfig
-from odoo_boost.connection.base import OdooConnection
+from odoo_boost.connection.base import AsyncOdooConnection, OdooConnection
+
+
+def _many2one_id(value: Any) -> Any:
+    """Return the id of a ``[id, display_name]`` many2one value, else the value itself."""
+    return value[0] if isinstance(value, list) and len(value) == 2 else value
+
+
+def _freeze(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
 
 # ---------------------------------------------------------------------------
 # MockOdooConnection — in-memory fake that satisfies the OdooConnection ABC
@@ -52,10 +62,32 @@ class MockOdooConnection(OdooConnection):
     def execute(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
         if method == "search_read":
             domain = args[0] if args else []
-            return self._filter(model, domain, **kwargs)
+            return self.search_read(model, domain, **kwargs)
         if method == "search_count":
             domain = args[0] if args else []
             return len(self._filter(model, domain))
+        if method == "read_group":
+            domain, fields, groupby = args
+            return self._read_group(model, domain, groupby, fields, legacy=True)
+        if method == "get_views":
+            [(view_id, view_type)] = args[0]
+            views = [
+                v
+                for v in self._records.get("ir.ui.view", [])
+                if (
+                    v["id"] == view_id
+                    if view_id
+                    else v["model"] == model and v["type"] == view_type
+                )
+            ]
+            if not views:
+                raise ValueError(f"No default {view_type} view for {model}")
+            view = views[0]
+            return {"views": {view_type: {"arch": view["arch"], "id": view["id"], "model": model}}}
+        if method == "formatted_read_group":
+            return self._read_group(
+                model, args[0], kwargs["groupby"], kwargs["aggregates"], legacy=False
+            )
         # For arbitrary method calls, return a generic response
         return {"method": method, "args": list(args), "kwargs": kwargs}
 
@@ -90,6 +122,41 @@ class MockOdooConnection(OdooConnection):
 
     # -- internal ------------------------------------------------------------
 
+    def _read_group(
+        self,
+        model: str,
+        domain: list[Any],
+        groupby: list[str],
+        specs: list[str],
+        legacy: bool,
+    ) -> list[dict[str, Any]]:
+        """Group like read_group (legacy) / formatted_read_group; dates group by YYYY-MM."""
+        groups: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        for record in self._filter(model, domain):
+            key = tuple(
+                str(record.get(spec.split(":")[0]))[:7] if ":" in spec else record.get(spec)
+                for spec in groupby
+            )
+            groups.setdefault(tuple(map(_freeze, key)), []).append(record)
+        functions = {"sum": sum, "min": min, "max": max, "count": len}
+        rows = []
+        for key, records in groups.items():
+            row: dict[str, Any] = dict(zip(groupby, key, strict=True))
+            row["__count"] = len(records)
+            row["__domain"] = []
+            for spec in specs:
+                if spec == "__count":
+                    continue
+                if legacy:  # "alias:func(field)"
+                    alias, _, rest = spec.partition(":")
+                    func, _, field = rest.rstrip(")").partition("(")
+                else:
+                    field, _, func = spec.partition(":")
+                    alias = spec
+                row[alias] = functions[func]([r.get(field, 0) for r in records])
+            rows.append(row)
+        return rows
+
     def _filter(self, model: str, domain: list[Any], **kwargs: Any) -> list[dict[str, Any]]:
         """Very simple domain filtering — handles common patterns."""
         records = list(self._records.get(model, []))
@@ -104,21 +171,64 @@ class MockOdooConnection(OdooConnection):
             elif op == "ilike":
                 records = [r for r in records if value.lower() in str(r.get(field, "")).lower()]
             elif op == "in":
-                records = [r for r in records if r.get(field) in value]
+                records = [r for r in records if _many2one_id(r.get(field)) in value]
+            elif op == ">":
+                records = [r for r in records if r.get(field) > value]
+            elif op == "<":
+                records = [r for r in records if r.get(field) < value]
+            elif op == ">=":
+                records = [r for r in records if r.get(field) >= value]
+            elif op == "<=":
+                records = [r for r in records if r.get(field) <= value]
         return records
 
 
+class AsyncMockOdooConnection(AsyncOdooConnection):
+    """Async facade over a :class:`MockOdooConnection` sharing its records."""
+
+    def __init__(self, sync: MockOdooConnection) -> None:
+        self.sync = sync
+
+    def seed(self, model: str, records: list[dict[str, Any]]) -> None:
+        self.sync.seed(model, records)
+
+    async def authenticate(self) -> int:
+        return self.sync.authenticate()
+
+    @property
+    def uid(self) -> int:
+        return self.sync.uid
+
+    async def execute(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        return self.sync.execute(model, method, *args, **kwargs)
+
+    async def get_version(self) -> dict[str, Any]:
+        return self.sync.get_version()
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk metadata snapshots out of the user's real cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture()
 def mock_connection() -> MockOdooConnection:
     """Return a fresh MockOdooConnection."""
     return MockOdooConnection()
 
 
+@pytest.fixture()
+def async_connection(mock_connection: MockOdooConnection) -> AsyncMockOdooConnection:
+    """Return an AsyncMockOdooConnection backed by ``mock_connection``."""
+    return AsyncMockOdooConnection(mock_connection)
+
+
 @pytest.fixture()
 def sample_connection_config() -> OdooConnectionConfig:
     """Return a sample OdooConnection config."""
@@ -142,14 +252,18 @@ def sample_config(sample_connection_config: OdooConnectionConfig) -> OdooBoostCo
 
 
 @pytest.fixture()
-def server_context(mock_connection: MockOdooConnection, sample_config: OdooBoostConfig):
+def server_context(
+    mock_connection: MockOdooConnection,
+    async_connection: AsyncMockOdooConnection,
+    sample_config: OdooBoostConfig,
+):
     """Set up the global MCP server context with a mock connection, then tear down."""
     from odoo_boost.mcp_server.context import ServerContext, set_context
 
     mock_connection.authenticate()
     _seed_default_data(mock_connection)
 
-    ctx = ServerContext(connection=mock_connection, config=sample_config)
+    ctx = ServerContext(connection=async_connection, config=sample_config)
     set_context(ctx)
     yield ctx
 
@@ -355,7 +469,7 @@ def _seed_default_data(conn: MockOdooConnection) -> None:
     conn.seed(
         "ir.module.module.dependency",
         [
-            {"id": 1, "name": "base", "auto_install_required": False},
+            {"id": 1, "name": "base", "auto_install_required": False, "module_id": [2, "Sales"]},
         ],
     )
     conn.seed(
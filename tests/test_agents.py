@@ -15,7 +15,7 @@ from odoo_boost.agents.copilot import CopilotAgent
 from odoo_boost.agents.cursor import CursorAgent
 from odoo_boost.agents.gemini_cli import GeminiCliAgent
 from odoo_boost.agents.junie import JunieAgent
-from odoo_boost.config.schema import OdooBoostConfig
+from odoo_boost.config.schema import GuidelinesConfig, OdooBoostConfig
 
 # ---------------------------------------------------------------------------
 # Registry
@@ -222,3 +222,21 @@ class TestConditionalGeneration:
         assert not a.guidelines_path.exists()
         assert not a.mcp_config_path.exists()
         assert not a.skills_dir.exists()
+
+
+class TestGuidelinesBudget:
+    def test_budget_and_profile_applied(self, sample_config, tmp_path):
+        cfg = sample_config.model_copy(update={"guidelines": GuidelinesConfig(token_budget=1000)})
+        a = ClaudeCodeAgent(config=cfg, project_path=tmp_path, installed_modules=["base", "sale"])
+        a.install()
+        content = a.guidelines_path.read_text()
+        assert len(content) // 4 <= 1000
+        assert "JavaScript and OWL" not in content
+
+    def test_cursor_uses_budget(self, sample_config, tmp_path):
+        cfg = sample_config.model_copy(update={"guidelines": GuidelinesConfig(token_budget=500)})
+        a = CursorAgent(config=cfg, project_path=tmp_path)
+        a.install()
+        content = a.guidelines_path.read_text()
+        assert content.startswith("---\n")
+        assert "search_guidelines" in content
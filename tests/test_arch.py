@@ -0,0 +1,58 @@
+"""Tests for odoo_boost.mcp_server.arch (view architecture helpers)."""
+
+from __future__ import annotations
+
+from odoo_boost.mcp_server.arch import inheritance_changes, summarize_arch
+
+INHERITING_ARCH = """
+<data>
+    <xpath expr="//field[@name='partner_id']" position="after">
+        <field name="x_priority"/>
+    </xpath>
+    <!-- hide the note -->
+    <field name="note" position="attributes">
+        <attribute name="invisible">1</attribute>
+    </field>
+    <field name="user_id" position="replace"/>
+</data>
+"""
+
+
+class TestInheritanceChanges:
+    def test_xpath_and_field_specs(self):
+        changes = inheritance_changes(INHERITING_ARCH)
+        assert [(c["target"], c["position"]) for c in changes] == [
+            ("//field[@name='partner_id']", "after"),
+            ("field[@name='note']", "attributes"),
+            ("field[@name='user_id']", "replace"),
+        ]
+
+    def test_content_and_attributes(self):
+        xpath, note, user = inheritance_changes(INHERITING_ARCH)
+        assert xpath["content"].startswith('<field name="x_priority" />')
+        assert note["attributes"] == {"invisible": "1"}
+        assert user["content"] == ""
+
+    def test_single_spec_root(self):
+        changes = inheritance_changes('<form position="inside"><field name="a"/></form>')
+        assert changes == [
+            {"target": "form", "position": "inside", "content": '<field name="a" />'}
+        ]
+
+
+class TestSummarizeArch:
+    def test_primary_view(self):
+        summary = summarize_arch(
+            "<form><sheet><field name='name'/><field name='email'/><field name='name'/></sheet></form>"
+        )
+        assert summary == {"fields": ["name", "email"], "xpath_targets": [], "node_count": 5}
+
+    def test_inheriting_view(self):
+        summary = summarize_arch(INHERITING_ARCH)
+        assert summary["fields"] == ["x_priority"]
+        assert summary["xpath_targets"] == [
+            "//field[@name='partner_id']",
+            "field[@name='note']",
+            "field[@name='user_id']",
+        ]
+        assert summary["node_count"] == 6
@@ -0,0 +1,157 @@
+"""Tests for odoo_boost.bench – fake Odoo server and benchmark runner."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pkgutil
+
+import pytest
+from typer.testing import CliRunner
+
+import odoo_boost.mcp_server.tools as tools_pkg
+from odoo_boost.bench import (
+    BENCH_CALLS,
+    BenchSizes,
+    FakeOdoo,
+    FakeOdooServer,
+    build_dataset,
+    run_benchmark,
+)
+from odoo_boost.cli.app import app
+from odoo_boost.config.schema import OdooConnection
+from odoo_boost.connection.factory import create_async_connection, create_connection
+from odoo_boost.mcp_server.encoding import encode_result, encoding_timer
+
+TINY = BenchSizes(models=3, fields_per_model=5, views_per_model=2, modules=4, records=20)
+
+
+@pytest.fixture
+def fake_server():
+    with FakeOdooServer(FakeOdoo(build_dataset(TINY))) as server:
+        yield server
+
+
+def _conn_config(url: str, protocol: str) -> OdooConnection:
+    return OdooConnection(
+        url=url, database="bench", username="admin", password="admin", protocol=protocol
+    )
+
+
+class TestFakeOdoo:
+    def test_search_read_domain_order_limit(self):
+        odoo = FakeOdoo(build_dataset(TINY))
+        rows = odoo.execute(
+            "res.partner",
+            "search_read",
+            [[["is_company", "=", True]]],
+            {"fields": ["name"], "order": "id desc", "limit": 2},
+        )
+        assert [r["id"] for r in rows] == [20, 16]
+        assert set(rows[0]) == {"id", "name"}
+
+    def test_dotted_domain(self):
+        odoo = FakeOdoo(build_dataset(TINY))
+        count = odoo.execute(
+            "ir.model.fields", "search_count", [[["model_id.model", "=", "x_bench.model_2"]]], {}
+        )
+        assert count == TINY.fields_per_model
+
+    def test_unknown_model_raises(self):
+        from odoo_boost.bench.server import FakeOdooError
+
+        with pytest.raises(FakeOdooError):
+            FakeOdoo(build_dataset(TINY)).execute("no.such.model", "search", [[]], {})
+
+
+class TestFakeOdooServer:
+    @pytest.mark.parametrize("protocol", ["xmlrpc", "jsonrpc"])
+    def test_sync_connection(self, fake_server, protocol):
+        conn = create_connection(_conn_config(fake_server.url, protocol))
+        assert conn.get_version()["server_version"] == "18.0"
+        assert conn.authenticate() == 2
+        assert conn.search_count("res.partner", []) == TINY.records
+        requests, received, sent = fake_server.counters()
+        assert requests == 3 and received > 0 and sent > 0
+
+    @pytest.mark.parametrize("protocol", ["xmlrpc", "jsonrpc"])
+    def test_async_connection(self, fake_server, protocol):
+        conn = create_async_connection(_conn_config(fake_server.url, protocol))
+
+        async def scenario():
+            try:
+                await conn.authenticate()
+                rows = await conn.search_read("ir.module.module", [], fields=["name"], limit=2)
+                assert [r["name"] for r in rows] == ["bench_module_1", "bench_module_2"]
+                with pytest.raises(Exception, match="doesn't exist"):
+                    await conn.search_count("no.such.model", [])
+            finally:
+                await conn.aclose()
+
+        asyncio.run(scenario())
+
+
+class TestRunBenchmark:
+    def test_covers_every_tool(self):
+        modules = {m.name for m in pkgutil.iter_modules(tools_pkg.__path__)}
+        assert modules == set(BENCH_CALLS)
+
+    @pytest.mark.parametrize("protocol", ["xmlrpc", "jsonrpc"])
+    def test_all_tools_run_without_errors(self, protocol):
+        results = run_benchmark(protocol=protocol, iterations=2, sizes=TINY)
+        assert [s.tool for s in results] == list(BENCH_CALLS)
+        for stats in results:
+            assert stats.errors == 0, stats.tool
+            assert stats.calls == 2
+            assert stats.p95_ms >= stats.p50_ms >= 0
+            assert stats.response_bytes > 0
+        by_tool = {s.tool: s for s in results}
+        assert by_tool["search_records"].rpc_count > 0
+        assert by_tool["search_docs"].rpc_count == 0
+
+    def test_cache_reduces_rpcs(self):
+        cached = run_benchmark(iterations=8, sizes=TINY, tools=["list_models"])[0]
+        uncached = run_benchmark(iterations=8, sizes=TINY, tools=["list_models"], cache=False)[0]
+        assert cached.rpc_count < uncached.rpc_count
+
+    def test_unknown_tool(self):
+        with pytest.raises(ValueError, match="nope"):
+            run_benchmark(iterations=1, sizes=TINY, tools=["nope"])
+
+
+class TestEncodingTimer:
+    def test_accumulates_encode_time(self):
+        with encoding_timer() as elapsed:
+            encode_result({"a": 1})
+            encode_result([{"b": 2}])
+        assert elapsed[0] > 0
+
+    def test_inactive_by_default(self):
+        encode_result({"a": 1})  # no timer installed: nothing to record, no error
+
+
+class TestBenchCommand:
+    def test_json_output(self):
+        result = CliRunner().invoke(
+            app,
+            [
+                "bench",
+                "--iterations",
+                "1",
+                "--models",
+                "3",
+                "--records",
+                "10",
+                "--tool",
+                "get_config",
+                "--json",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data[0]["tool"] == "get_config"
+        assert data[0]["errors"] == 0
+
+    def test_bad_protocol(self):
+        result = CliRunner().invoke(app, ["bench", "--protocol", "soap"])
+        assert result.exit_code == 1
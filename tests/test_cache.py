@@ -0,0 +1,186 @@
+"""Tests for odoo_boost.mcp_server.cache (MetadataCache) and its on-disk snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from odoo_boost.mcp_server.cache import MetadataCache
+from odoo_boost.mcp_server.snapshot import SnapshotStore, default_cache_dir
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(mock_connection, async_connection, clock) -> MetadataCache:
+    mock_connection.seed("ir.module.module", [{"id": 1, "write_date": "2024-01-01 00:00:00"}])
+    mock_connection.seed("ir.model.fields", [{"id": 1, "write_date": "2024-01-01 00:00:00"}])
+    return MetadataCache(async_connection, "http://localhost/db", max_entries=2, clock=clock)
+
+
+def load(cache: MetadataCache, key: Any, loader: Any) -> Any:
+    """Call ``cache.get_or_load`` with a sync *loader* and wait for the result."""
+
+    async def aloader() -> Any:
+        return loader()
+
+    return asyncio.run(cache.get_or_load(key, aloader))
+
+
+class TestMetadataCache:
+    def test_hit_skips_loader(self, cache):
+        calls = []
+        assert load(cache, "a", lambda: calls.append(1) or "value") == "value"
+        assert load(cache, "a", lambda: calls.append(1) or "other") == "value"
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction(self, cache):
+        load(cache, "a", lambda: 1)
+        load(cache, "b", lambda: 2)
+        load(cache, "a", lambda: 1)  # refresh "a"
+        load(cache, "c", lambda: 3)  # evicts "b"
+        assert len(cache) == 2
+        assert load(cache, "b", lambda: "reloaded") == "reloaded"
+
+    def test_invalidated_when_write_date_moves(self, cache, mock_connection, clock):
+        load(cache, "a", lambda: "old")
+        mock_connection.seed("ir.model.fields", [{"id": 2, "write_date": "2024-02-01 00:00:00"}])
+        clock.now += 60
+        assert load(cache, "a", lambda: "new") == "new"
+
+    def test_invalidated_when_record_deleted(self, cache, mock_connection, clock):
+        rules = [{"id": n, "write_date": "2024-01-01 00:00:00"} for n in (1, 2)]
+        mock_connection.seed("ir.rule", rules)
+        cache.clear()
+        load(cache, "a", lambda: "old")
+        mock_connection.seed("ir.rule", rules[:1])  # same latest write_date
+        clock.now += 60
+        assert load(cache, "a", lambda: "new") == "new"
+
+    def test_fingerprint_checked_at_most_every_interval(self, cache, mock_connection, clock):
+        load(cache, "a", lambda: "old")
+        mock_connection.seed("ir.model.fields", [{"id": 2, "write_date": "2024-02-01 00:00:00"}])
+        clock.now += 5
+        assert load(cache, "a", lambda: "new") == "old"
+
+    def test_clear(self, cache):
+        load(cache, "a", lambda: "old")
+        cache.clear()
+        assert load(cache, "a", lambda: "new") == "new"
+
+    def test_disabled_always_loads(self, async_connection):
+        cache = MetadataCache(async_connection, "ns", max_entries=0)
+        assert not cache.enabled
+        assert load(cache, "a", lambda: 1) == 1
+        assert load(cache, "a", lambda: 2) == 2
+        assert len(cache) == 0
+
+
+class TestSnapshotStore:
+    def test_roundtrip(self, tmp_path):
+        store = SnapshotStore(tmp_path / "snap.sqlite")
+        assert store.get(["database_schema", "res.partner"]) is None
+        store.put(["database_schema", "res.partner"], {"model": "res.partner"})
+        store.close()
+        reopened = SnapshotStore(tmp_path / "snap.sqlite")
+        assert reopened.get(["database_schema", "res.partner"]) == {"model": "res.partner"}
+
+    def test_keyed_by_namespace_and_fingerprint(self, tmp_path):
+        a = SnapshotStore.for_fingerprint(tmp_path, "http://odoo/db1", ("2024-01-01",))
+        b = SnapshotStore.for_fingerprint(tmp_path, "http://odoo/db2", ("2024-01-01",))
+        assert a.path != b.path
+        assert a.path.parent == tmp_path
+
+    def test_stale_fingerprint_files_removed(self, tmp_path):
+        old = SnapshotStore.for_fingerprint(tmp_path, "http://odoo/db", ("2024-01-01",))
+        old.put("k", 1)
+        old.close()
+        other = SnapshotStore.for_fingerprint(tmp_path, "http://odoo/other", ("2024-01-01",))
+        other.put("k", 1)
+        other.close()
+        SnapshotStore.for_fingerprint(tmp_path, "http://odoo/db", ("2024-02-01",))
+        assert not old.path.exists()
+        assert other.path.exists()
+
+    def test_default_cache_dir_honours_xdg(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "odoo-boost"
+
+
+class TestPersistentCache:
+    def _make_cache(self, conn, tmp_path) -> MetadataCache:
+        return MetadataCache(conn, "http://localhost/db", snapshot_dir=tmp_path)
+
+    def test_survives_restart(self, async_connection, tmp_path):
+        load(self._make_cache(async_connection, tmp_path), ("k",), lambda: {"a": 1})
+        restarted = self._make_cache(async_connection, tmp_path)
+        assert load(restarted, ("k",), lambda: pytest.fail("loader called")) == {"a": 1}
+        assert restarted.disk_hits == 1
+
+    def test_new_fingerprint_starts_empty(self, mock_connection, async_connection, tmp_path):
+        load(self._make_cache(async_connection, tmp_path), ("k",), lambda: "old")
+        mock_connection.seed("ir.ui.view", [{"id": 9, "write_date": "2030-01-01 00:00:00"}])
+        restarted = self._make_cache(async_connection, tmp_path)
+        assert load(restarted, ("k",), lambda: "new") == "new"
+
+    def test_deleted_menu_starts_empty(self, mock_connection, async_connection, tmp_path):
+        menus = [{"id": n, "write_date": "2024-01-01 00:00:00"} for n in (1, 2)]
+        mock_connection.seed("ir.ui.menu", menus)
+        load(self._make_cache(async_connection, tmp_path), ("k",), lambda: "old")
+        mock_connection.seed("ir.ui.menu", menus[1:])
+        restarted = self._make_cache(async_connection, tmp_path)
+        assert load(restarted, ("k",), lambda: "new") == "new"
+
+
+class TestCachedTools:
+    def test_database_schema_served_from_cache(self, server_context, mock_connection):
+        from odoo_boost.mcp_server.tools.database_schema import database_schema
+
+        first = json.loads(asyncio.run(database_schema("res.partner")))
+        mock_connection.seed("ir.model", [])  # would be "not found" if re-queried
+        assert json.loads(asyncio.run(database_schema("res.partner"))) == first
+        assert server_context.cache.hits == 1
+
+    def test_snapshot_written_to_configured_directory(
+        self, async_connection, sample_config, tmp_path
+    ):
+        from odoo_boost.mcp_server.context import ServerContext
+
+        sample_config.cache.directory = str(tmp_path / "snapshots")
+        ctx = ServerContext(connection=async_connection, config=sample_config)
+        load(ctx.cache, ("k",), lambda: 1)
+        assert list((tmp_path / "snapshots").glob("*.sqlite"))
+
+    def test_snapshot_per_user(self, async_connection, sample_config, tmp_path):
+        from odoo_boost.mcp_server.context import ServerContext
+
+        sample_config.cache.directory = str(tmp_path / "snapshots")
+        admin = ServerContext(connection=async_connection, config=sample_config)
+        load(admin.cache, ("k",), lambda: "admin")
+        other = sample_config.model_copy(deep=True)
+        other.connection.username = "demo"
+        demo = ServerContext(connection=async_connection, config=other)
+        assert load(demo.cache, ("k",), lambda: "demo") == "demo"
+        assert len(list((tmp_path / "snapshots").glob("*.sqlite"))) == 2
+
+    def test_cache_disabled_by_config(self, async_connection, sample_config):
+        from odoo_boost.mcp_server.context import ServerContext
+
+        sample_config.cache.enabled = False
+        ctx = ServerContext(connection=async_connection, config=sample_config)
+        assert not ctx.cache.enabled
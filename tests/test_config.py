@@ -34,6 +34,30 @@ class TestOdooConnectionConfig:
         assert cfg.url == "https://odoo.example.com"
         assert cfg.database == "prod"
 
+    def test_jsonrpc_protocol(self):
+        cfg = OdooConnectionConfig(url="http://localhost:8069", database="mydb", protocol="jsonrpc")
+        assert cfg.protocol == "jsonrpc"
+
+    def test_unknown_protocol_raises(self):
+        with pytest.raises(ValidationError):
+            OdooConnectionConfig(url="http://localhost:8069", database="mydb", protocol="soap")
+
+    def test_pool_defaults(self):
+        cfg = OdooConnectionConfig(url="http://localhost:8069", database="mydb")
+        assert cfg.pool_size == 10
+        assert cfg.pool_idle_timeout == 60.0
+
+    def test_shared_read_defaults(self):
+        cfg = OdooConnectionConfig(url="http://localhost:8069", database="mydb")
+        assert cfg.coalesce_reads is True
+        assert cfg.read_cache_ttl == 2.0
+        with pytest.raises(ValidationError):
+            OdooConnectionConfig(url="http://localhost:8069", database="mydb", read_cache_ttl=-1)
+
+    def test_invalid_pool_size_raises(self):
+        with pytest.raises(ValidationError):
+            OdooConnectionConfig(url="http://localhost:8069", database="mydb", pool_size=0)
+
     def test_missing_url_raises(self):
         with pytest.raises(ValidationError):
             OdooConnectionConfig(database="mydb")  # type: ignore[call-arg]
@@ -105,6 +129,35 @@ class TestOdooBoostConfig:
         cfg = OdooBoostConfig.model_validate(data)
         assert cfg.connection.url == sample_connection_config.url
 
+    def test_output_format(self, sample_connection_config):
+        cfg = OdooBoostConfig(connection=sample_connection_config)
+        assert cfg.output_format == "compact"
+        cfg = OdooBoostConfig(connection=sample_connection_config, output_format="columnar")
+        assert cfg.output_format == "columnar"
+        with pytest.raises(ValidationError):
+            OdooBoostConfig(connection=sample_connection_config, output_format="yaml")
+
+    def test_guidelines_token_budget(self, sample_connection_config):
+        cfg = OdooBoostConfig(connection=sample_connection_config)
+        assert cfg.guidelines.token_budget == 0
+        with pytest.raises(ValidationError):
+            OdooBoostConfig(connection=sample_connection_config, guidelines={"token_budget": -1})
+
+    def test_server_defaults(self, sample_connection_config):
+        cfg = OdooBoostConfig(connection=sample_connection_config)
+        assert cfg.server.daemon is True
+        assert cfg.server.idle_timeout == 900.0
+        assert (cfg.server.transport, cfg.server.host, cfg.server.port) == (
+            "stdio",
+            "127.0.0.1",
+            8000,
+        )
+        assert cfg.server.max_concurrency == 16
+        with pytest.raises(ValidationError):
+            OdooBoostConfig(connection=sample_connection_config, server={"idle_timeout": -1})
+        with pytest.raises(ValidationError):
+            OdooBoostConfig(connection=sample_connection_config, server={"transport": "grpc"})
+
 
 # ---------------------------------------------------------------------------
 # Settings (find / load / save)
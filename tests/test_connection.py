@@ -1,15 +1,24 @@
-"""Tests for odoo_boost.connection (ABC, XmlRpcConnection, factory)."""
+"""Tests for odoo_boost.connection (ABCs, XML-RPC/JSON-RPC connections, factory)."""
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+import json
+import sys
+import time
+import xmlrpc.client
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
+import odoo_boost.connection.base as base_mod
 from odoo_boost.config.schema import OdooConnection as OdooConnectionConfig
-from odoo_boost.connection.base import OdooConnection
-from odoo_boost.connection.factory import create_connection
-from odoo_boost.connection.xmlrpc import XmlRpcConnection
+from odoo_boost.connection.base import AsyncOdooConnection, OdooConnection, RpcCall
+from odoo_boost.connection.factory import create_async_connection, create_connection
+from odoo_boost.connection.jsonrpc import AsyncJsonRpcConnection, JsonRpcConnection, JsonRpcError
+from odoo_boost.connection.transport import HttpxTransport
+from odoo_boost.connection.xmlrpc import AsyncXmlRpcConnection, XmlRpcConnection
 
 
 class TestXmlRpcConnection:
@@ -80,12 +89,569 @@ class TestXmlRpcConnection:
         conn = XmlRpcConnection("http://localhost:8069/", "testdb", "admin", "admin")
         assert conn._url == "http://localhost:8069"
 
+    def test_proxies_share_pooled_transport(self):
+        conn = self._make_conn()
+        assert isinstance(conn._shared_transport, HttpxTransport)
+        assert conn._common_proxy._ServerProxy__transport is conn._shared_transport  # type: ignore[attr-defined]
+        assert conn._object_proxy._ServerProxy__transport is conn._shared_transport  # type: ignore[attr-defined]
+
+
+class TestHttpxTransport:
+    def _make_conn(self, handler) -> tuple[XmlRpcConnection, list[httpx.Request]]:
+        """Build an XML-RPC connection whose pooled client answers through *handler*."""
+        requests: list[httpx.Request] = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            params, method = xmlrpc.client.loads(request.content)
+            return handler(method, params)
+
+        client = httpx.Client(transport=httpx.MockTransport(transport))
+        conn = XmlRpcConnection("https://odoo.example.com", "testdb", "admin", "admin", client)
+        return conn, requests
+
+    @staticmethod
+    def _ok(value) -> httpx.Response:
+        body = xmlrpc.client.dumps((value,), methodresponse=True, allow_none=True)
+        return httpx.Response(200, content=body.encode())
+
+    def test_calls_go_through_one_client(self):
+        def handler(method, params):
+            if method == "authenticate":
+                return self._ok(2)
+            if method == "version":
+                return self._ok({"server_version": "18.0"})
+            return self._ok([{"id": 1, "name": "Test"}])
+
+        conn, requests = self._make_conn(handler)
+        assert conn.authenticate() == 2
+        assert conn.get_version()["server_version"] == "18.0"
+        assert conn.search_read("res.partner", fields=["name"]) == [{"id": 1, "name": "Test"}]
+        assert [str(r.url) for r in requests] == [
+            "https://odoo.example.com/xmlrpc/2/common",
+            "https://odoo.example.com/xmlrpc/2/common",
+            "https://odoo.example.com/xmlrpc/2/object",
+        ]
+
+    def test_fault_is_raised(self):
+        def handler(method, params):
+            fault = xmlrpc.client.Fault(1, "Access Denied")
+            return httpx.Response(200, content=xmlrpc.client.dumps(fault).encode())
+
+        conn, _ = self._make_conn(handler)
+        with pytest.raises(xmlrpc.client.Fault, match="Access Denied"):
+            conn.get_version()
+
+    def test_http_error_raises_protocol_error(self):
+        conn, _ = self._make_conn(lambda method, params: httpx.Response(502))
+        with pytest.raises(xmlrpc.client.ProtocolError):
+            conn.get_version()
+
+
+class TestJsonRpcConnection:
+    def _make_conn(self, handler) -> tuple[JsonRpcConnection, list[dict]]:
+        """Build a connection whose HTTP client answers through *handler*."""
+        requests: list[dict] = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": payload["id"], **handler(payload)}
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(transport))
+        conn = JsonRpcConnection(
+            "http://localhost:8069/", "testdb", "admin", "admin", client=client
+        )
+        return conn, requests
+
+    def test_authenticate_success(self):
+        conn, requests = self._make_conn(lambda p: {"result": 2})
+        assert conn.authenticate() == 2
+        assert conn.uid == 2
+        params = requests[0]["params"]
+        assert params["service"] == "common"
+        assert params["method"] == "authenticate"
+        assert params["args"] == ["testdb", "admin", "admin", {}]
+
+    def test_authenticate_failure(self):
+        conn, _ = self._make_conn(lambda p: {"result": False})
+        with pytest.raises(ConnectionError, match="Authentication failed"):
+            conn.authenticate()
+
+    def test_uid_before_auth_raises(self):
+        conn, _ = self._make_conn(lambda p: {"result": None})
+        with pytest.raises(RuntimeError, match="Not authenticated"):
+            _ = conn.uid
+
+    def test_execute(self):
+        conn, requests = self._make_conn(lambda p: {"result": [{"id": 1}]})
+        conn._uid = 2
+        result = conn.execute("res.partner", "read", [1], fields=["name"])
+        assert result == [{"id": 1}]
+        params = requests[0]["params"]
+        assert params["service"] == "object"
+        assert params["args"][:3] == ["testdb", 2, "admin"]
+        assert params["args"][3:] == ["res.partner", "read", [[1]], {"fields": ["name"]}]
+
+    def test_search_read_and_count(self):
+        def handler(payload):
+            method = payload["params"]["args"][4]
+            return {"result": 42 if method == "search_count" else [{"id": 1, "name": "Test"}]}
+
+        conn, requests = self._make_conn(handler)
+        conn._uid = 2
+        assert conn.search_read("res.partner", fields=["name"], limit=5) == [
+            {"id": 1, "name": "Test"}
+        ]
+        assert conn.search_count("res.partner", [["is_company", "=", True]]) == 42
+        assert requests[0]["params"]["args"][6] == {"offset": 0, "fields": ["name"], "limit": 5}
+
+    def test_error_response_raises(self):
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "Access Denied"}}
+        conn, _ = self._make_conn(lambda p: {"error": error})
+        conn._uid = 2
+        with pytest.raises(JsonRpcError, match="Access Denied"):
+            conn.execute("res.partner", "read", [1])
+
+    def test_get_version(self):
+        conn, _ = self._make_conn(lambda p: {"result": {"server_version": "18.0"}})
+        assert conn.get_version()["server_version"] == "18.0"
+
+    def test_reuses_single_client(self):
+        conn, requests = self._make_conn(lambda p: {"result": 2})
+        client = conn._http
+        conn.authenticate()
+        conn.get_version()
+        assert conn._http is client
+        assert [r["id"] for r in requests] == [1, 2]
+
+    def test_url_trailing_slash_stripped(self):
+        conn, _ = self._make_conn(lambda p: {"result": None})
+        assert conn._url == "http://localhost:8069"
+
+
+class TestAsyncJsonRpcConnection:
+    def _make_conn(self, handler) -> tuple[AsyncJsonRpcConnection, list[dict]]:
+        requests: list[dict] = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": payload["id"], **handler(payload)}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        conn = AsyncJsonRpcConnection(
+            "http://localhost:8069", "testdb", "admin", "admin", client=client
+        )
+        return conn, requests
+
+    def test_authenticate_and_execute(self):
+        conn, requests = self._make_conn(lambda p: {"result": 2})
+        assert asyncio.run(conn.authenticate()) == 2
+        assert asyncio.run(conn.execute("res.partner", "search_count", [])) == 2
+        assert requests[1]["params"]["args"][:5] == [
+            "testdb",
+            2,
+            "admin",
+            "res.partner",
+            "search_count",
+        ]
+
+    def test_search_read_with_count(self):
+        def handler(payload):
+            method = payload["params"]["args"][4]
+            return {"result": 7 if method == "search_count" else [{"id": 1}]}
+
+        conn, requests = self._make_conn(handler)
+        conn._uid = 2
+        records, total = asyncio.run(conn.search_read_with_count("res.partner", limit=1))
+        assert (records, total) == ([{"id": 1}], 7)
+        assert len(requests) == 2
+
+    def test_error_response_raises(self):
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "Access Denied"}}
+        conn, _ = self._make_conn(lambda p: {"error": error})
+        conn._uid = 2
+        with pytest.raises(JsonRpcError, match="Access Denied"):
+            asyncio.run(conn.execute("res.partner", "read", [1]))
+
+    def test_aclose_drops_client(self):
+        conn = AsyncJsonRpcConnection("http://localhost:8069", "testdb", "admin", "admin")
+        assert conn._http is conn._http
+        asyncio.run(conn.aclose())
+        assert conn._client is None
+
+    def test_observer_reports_calls(self):
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "Denied"}}
+        conn, _ = self._make_conn(
+            lambda p: {"error": error} if p["params"]["args"][4] == "unlink" else {"result": 3}
+        )
+        conn._uid = 2
+        calls: list[RpcCall] = []
+        conn.set_observer(calls.append)
+        asyncio.run(conn.execute("res.partner", "search_count", []))
+        with pytest.raises(JsonRpcError):
+            asyncio.run(conn.execute("res.partner", "unlink", [1]))
+        ok, failed = calls
+        assert (ok.model, ok.orm_method, ok.error) == ("res.partner", "search_count", None)
+        assert ok.request_bytes > 0 and ok.response_bytes > 0 and ok.seconds >= 0
+        assert (failed.orm_method, failed.error) == ("unlink", "JsonRpcError")
+
+
+class TestAsyncXmlRpcConnection:
+    def _make_conn(self, handler) -> tuple[AsyncXmlRpcConnection, list[httpx.Request]]:
+        requests: list[httpx.Request] = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            params, method = xmlrpc.client.loads(request.content)
+            return handler(method, params)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        conn = AsyncXmlRpcConnection(
+            "http://localhost:8069", "testdb", "admin", "admin", client=client
+        )
+        return conn, requests
+
+    @staticmethod
+    def _ok(value) -> httpx.Response:
+        return httpx.Response(200, content=xmlrpc.client.dumps((value,), methodresponse=True))
+
+    def test_authenticate_and_search_read(self):
+        def handler(method, params):
+            if method == "authenticate":
+                return self._ok(2)
+            return self._ok([{"id": 1, "name": "Test"}])
+
+        conn, requests = self._make_conn(handler)
+        assert asyncio.run(conn.authenticate()) == 2
+        result = asyncio.run(conn.search_read("res.partner", fields=["name"]))
+        assert result == [{"id": 1, "name": "Test"}]
+        assert [r.url.path for r in requests] == ["/xmlrpc/2/common", "/xmlrpc/2/object"]
+
+    def test_fault_is_raised(self):
+        def handler(method, params):
+            return httpx.Response(200, content=xmlrpc.client.dumps(xmlrpc.client.Fault(1, "boom")))
+
+        conn, _ = self._make_conn(handler)
+        conn._uid = 2
+        with pytest.raises(xmlrpc.client.Fault):
+            asyncio.run(conn.execute("res.partner", "read", [1]))
+
+    def test_http_error_raises_protocol_error(self):
+        conn, _ = self._make_conn(lambda method, params: httpx.Response(502))
+        with pytest.raises(xmlrpc.client.ProtocolError):
+            asyncio.run(conn.get_version())
+
+    def test_observer_reports_calls(self):
+        conn, requests = self._make_conn(
+            lambda method, params: self._ok({"server_version": "18.0"})
+        )
+        calls: list[RpcCall] = []
+        conn.set_observer(calls.append)
+        asyncio.run(conn.get_version())
+        (call,) = calls
+        assert (call.service, call.method, call.model) == ("common", "version", None)
+        assert call.request_bytes == len(requests[0].content)
+        assert call.response_bytes > 0
+
+
+class TestSharedReads:
+    def _make_conn(self, handler=None, **kwargs) -> tuple[AsyncJsonRpcConnection, list[dict]]:
+        requests: list[dict] = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            body = handler(payload) if handler else {"result": [{"id": len(requests)}]}
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": payload["id"], **body})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        conn = AsyncJsonRpcConnection(
+            "http://localhost:8069", "testdb", "admin", "admin", client=client, **kwargs
+        )
+        conn._uid = 2
+        return conn, requests
+
+    def test_identical_concurrent_reads_share_one_request(self):
+        conn, requests = self._make_conn(read_cache_ttl=0)
+
+        async def scenario():
+            return await conn.gather(
+                conn.search_read("ir.model", [("model", "=", "res.partner")]),
+                conn.search_read("ir.model", [("model", "=", "res.partner")]),
+                conn.search_read("ir.model", [("model", "=", "sale.order")]),
+            )
+
+        first, second, other = asyncio.run(scenario())
+        assert len(requests) == 2
+        assert first is second and other != first
+        assert conn.coalesced_reads == 1
+
+    def test_recent_result_reused_within_ttl(self, monkeypatch):
+        conn, requests = self._make_conn()
+        asyncio.run(conn.execute("res.partner", "read", [1], fields=["name"]))
+        asyncio.run(conn.execute("res.partner", "read", [1], fields=["name"]))
+        assert len(requests) == 1 and conn.cached_reads == 1
+
+        later = time.monotonic() + 60
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        asyncio.run(conn.execute("res.partner", "read", [1], fields=["name"]))
+        assert len(requests) == 2
+
+    def test_write_clears_recent_results(self):
+        conn, requests = self._make_conn()
+        asyncio.run(conn.execute("res.partner", "read", [1]))
+        asyncio.run(conn.execute("res.partner", "write", [1], {"name": "New"}))
+        asyncio.run(conn.execute("res.partner", "read", [1]))
+        assert [r["params"]["args"][4] for r in requests] == ["read", "write", "read"]
+
+    def test_read_after_write_does_not_join_older_read(self):
+        name = "Old"
+        release = asyncio.Event()
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            nonlocal name
+            payload = json.loads(request.content)
+            method = payload["params"]["args"][4]
+            if method == "write":
+                name = "New"
+                result = True
+            else:
+                result = [{"id": 1, "name": name}]
+                if name == "Old":
+                    await release.wait()  # keep the first read in flight
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": payload["id"], "result": result}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        conn = AsyncJsonRpcConnection(
+            "http://localhost:8069", "testdb", "admin", "admin", client=client
+        )
+        conn._uid = 2
+
+        async def scenario():
+            before = asyncio.ensure_future(conn.execute("res.partner", "read", [1]))
+            await asyncio.sleep(0.01)
+            await conn.execute("res.partner", "write", [1], {"name": "New"})
+            after = asyncio.ensure_future(conn.execute("res.partner", "read", [1]))
+            await asyncio.sleep(0.01)
+            release.set()
+            return await before, await after
+
+        before, after = asyncio.run(scenario())
+        assert before[0]["name"] == "Old"
+        assert after[0]["name"] == "New"
+        assert conn.coalesced_reads == 0
+
+    def test_writes_never_coalesced(self):
+        conn, requests = self._make_conn()
+
+        async def scenario():
+            call = ("res.partner", "action_archive", [1])
+            await conn.gather(conn.execute(*call), conn.execute(*call))
+
+        asyncio.run(scenario())
+        assert len(requests) == 2
+
+    @staticmethod
+    def _rows_handler(count):
+        def handler(payload):
+            offset = payload["params"]["args"][6].get("offset", 0)
+            return {"result": [{"id": offset + n, "name": "x" * 100} for n in range(count)]}
+
+        return handler
+
+    def test_expired_results_released(self, monkeypatch):
+        conn, requests = self._make_conn(self._rows_handler(100))
+        pages = [
+            asyncio.run(conn.search_read("res.partner", [], limit=100, offset=n * 100))
+            for n in range(50)
+        ]
+        assert len(conn._read_cache) == 50 and conn._read_cache_rows == 5000
+        first = pages[0]
+        del pages
+        held = sys.getrefcount(first)
+
+        later = time.monotonic() + 60
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        asyncio.run(conn.search_read("res.partner", [], limit=1))
+        assert len(conn._read_cache) == 1 and conn._read_cache_rows == 100
+        assert sys.getrefcount(first) == held - 1  # the cache let go of it
+
+    def test_large_results_not_cached(self):
+        conn, requests = self._make_conn(self._rows_handler(1001))
+        for _ in range(2):
+            asyncio.run(conn.search_read("res.partner", [], limit=2000))
+        assert len(requests) == 2 and conn._read_cache == {}
+
+    def test_row_budget_evicts_oldest(self, monkeypatch):
+        monkeypatch.setattr(base_mod, "_READ_CACHE_MAX_ROWS", 10)
+        conn, requests = self._make_conn(self._rows_handler(4))
+        for offset in (0, 4, 8):
+            asyncio.run(conn.search_read("res.partner", [], limit=4, offset=offset))
+        assert conn._read_cache_rows == 8
+        asyncio.run(conn.search_read("res.partner", [], limit=4, offset=0))
+        assert len(requests) == 4  # the oldest page was evicted
+
+    def test_bypass_read_cache(self):
+        conn, requests = self._make_conn()
+
+        async def scenario():
+            with conn.bypass_read_cache():
+                await conn.gather(conn.read_ids(), conn.read_ids())
+                await asyncio.ensure_future(conn.read_ids())
+
+        conn.read_ids = lambda: conn.execute("res.partner", "read", [1])
+        asyncio.run(scenario())
+        assert len(requests) == 3 and conn._read_cache == {}
+        asyncio.run(conn.read_ids())
+        assert conn._read_cache
+
+    def test_errors_shared_but_not_cached(self):
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "Denied"}}
+        conn, requests = self._make_conn(lambda p: {"error": error})
+
+        async def scenario():
+            return await conn.gather(
+                conn.search_count("res.partner", []),
+                conn.search_count("res.partner", []),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, JsonRpcError) for r in asyncio.run(scenario()))
+        assert len(requests) == 1
+        with pytest.raises(JsonRpcError):
+            asyncio.run(conn.search_count("res.partner", []))
+        assert len(requests) == 2
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        conn, requests = self._make_conn(read_cache_ttl=0)
+
+        async def scenario():
+            first = asyncio.ensure_future(conn.search_count("res.partner", []))
+            second = asyncio.ensure_future(conn.search_count("res.partner", []))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(scenario()) == [{"id": 1}]
+        assert len(requests) == 1
+
+    def test_disabled(self):
+        conn, requests = self._make_conn(coalesce_reads=False, read_cache_ttl=0)
+
+        async def scenario():
+            await conn.gather(
+                conn.search_count("res.partner", []), conn.search_count("res.partner", [])
+            )
+
+        asyncio.run(scenario())
+        asyncio.run(conn.search_count("res.partner", []))
+        assert len(requests) == 3
+
+
+class TestAsyncGather:
+    def test_awaits_concurrently(self, async_connection):
+        async def main():
+            event = asyncio.Event()
+
+            async def wait():
+                await event.wait()
+                return "waited"
+
+            async def release():
+                event.set()
+                return "released"
+
+            return await async_connection.gather(wait(), release())
+
+        assert asyncio.run(main()) == ["waited", "released"]
+
+    def test_return_exceptions(self, async_connection):
+        async def boom():
+            raise ValueError("boom")
+
+        async def main():
+            return await async_connection.gather(boom(), return_exceptions=True)
+
+        (err,) = asyncio.run(main())
+        assert isinstance(err, ValueError)
+
+
+class TestReadGroup:
+    @pytest.fixture()
+    def calls(self, async_connection, monkeypatch):
+        calls: list[tuple] = []
+
+        async def execute(model, method, *args, **kwargs):
+            calls.append((method, args, kwargs))
+            if method == "read_group":
+                return [{"user_id": [2, "Admin"], "amount__sum": 3.0, "__count": 2, "__domain": []}]
+            return [
+                {"user_id": [2, "Admin"], "amount:sum": 3.0, "__count": 2, "__extra_domain": []}
+            ]
+
+        monkeypatch.setattr(async_connection, "execute", execute)
+        return calls
+
+    def test_legacy_read_group(self, async_connection, calls):
+        rows = asyncio.run(
+            async_connection.read_group("sale.order", [], ["user_id"], ["amount:sum"], limit=5)
+        )
+        assert rows == [{"user_id": [2, "Admin"], "amount:sum": 3.0, "__count": 2}]
+        method, args, kwargs = calls[0]
+        assert method == "read_group"
+        assert args == ([], ["amount__sum:sum(amount)"], ["user_id"])
+        assert kwargs == {"lazy": False, "offset": 0, "limit": 5}
+
+    def test_formatted_read_group_on_19(self, async_connection, mock_connection, calls):
+        mock_connection._version["server_serie"] = "saas~19.1"
+        rows = asyncio.run(
+            async_connection.read_group(
+                "sale.order", [], ["user_id"], ["amount:sum"], order="user_id"
+            )
+        )
+        assert rows == [{"user_id": [2, "Admin"], "amount:sum": 3.0, "__count": 2}]
+        method, _, kwargs = calls[0]
+        assert method == "formatted_read_group"
+        assert kwargs["aggregates"] == ["amount:sum", "__count"]
+        assert kwargs["order"] == "user_id"
+
+    def test_version_fetched_once(self, async_connection, calls):
+        async_connection.sync.get_version = MagicMock(wraps=async_connection.sync.get_version)
+        asyncio.run(async_connection.read_group("sale.order", [], ["user_id"]))
+        asyncio.run(async_connection.read_group("sale.order", [], ["user_id"]))
+        assert async_connection.sync.get_version.call_count == 1
+
 
 class TestConnectionFactory:
     def test_create_xmlrpc(self, sample_connection_config):
         conn = create_connection(sample_connection_config)
         assert isinstance(conn, XmlRpcConnection)
 
+    def test_create_jsonrpc(self, sample_connection_config):
+        cfg = sample_connection_config.model_copy(update={"protocol": "jsonrpc"})
+        conn = create_connection(cfg)
+        assert isinstance(conn, JsonRpcConnection)
+
+    def test_create_async(self, sample_connection_config):
+        assert isinstance(create_async_connection(sample_connection_config), AsyncXmlRpcConnection)
+        cfg = sample_connection_config.model_copy(update={"protocol": "jsonrpc"})
+        assert isinstance(create_async_connection(cfg), AsyncJsonRpcConnection)
+
+    def test_create_async_passes_shared_read_settings(self, sample_connection_config):
+        cfg = sample_connection_config.model_copy(
+            update={"coalesce_reads": False, "read_cache_ttl": 0.5}
+        )
+        conn = create_async_connection(cfg)
+        assert (conn._coalesce_reads, conn._read_cache_ttl) == (False, 0.5)
+
     def test_unsupported_protocol_raises(self):
         # Pydantic Literal won't allow other values normally, so we
         # use model_construct to bypass validation for this edge case
@@ -94,7 +660,7 @@ class TestConnectionFactory:
             database="db",
             username="admin",
             password="admin",
-            protocol="jsonrpc",
+            protocol="grpc",
         )
         with pytest.raises(ValueError, match="Unsupported protocol"):
             create_connection(cfg)
@@ -104,3 +670,46 @@ class TestOdooConnectionABC:
     def test_cannot_instantiate(self):
         with pytest.raises(TypeError):
             OdooConnection()  # type: ignore[abstract]
+
+    def test_async_cannot_instantiate(self):
+        with pytest.raises(TypeError):
+            AsyncOdooConnection()  # type: ignore[abstract]
+
+
+class TestSearchReadWithCount:
+    @pytest.fixture()
+    def conn(self, async_connection):
+        async_connection.seed("res.partner", [{"id": i, "name": f"P{i}"} for i in range(1, 6)])
+        async_connection.search_count = AsyncMock(wraps=async_connection.search_count)
+        return async_connection
+
+    def test_short_page_derives_count(self, conn):
+        records, total = asyncio.run(conn.search_read_with_count("res.partner", limit=10))
+        assert len(records) == 5
+        assert total == 5
+        conn.search_count.assert_not_called()
+
+    def test_short_page_with_offset_derives_count(self, conn):
+        records, total = asyncio.run(conn.search_read_with_count("res.partner", limit=3, offset=3))
+        assert [r["id"] for r in records] == [4, 5]
+        assert total == 5
+        conn.search_count.assert_not_called()
+
+    def test_full_page_counts(self, conn):
+        records, total = asyncio.run(conn.search_read_with_count("res.partner", limit=2))
+        assert len(records) == 2
+        assert total == 5
+        conn.search_count.assert_called_once()
+
+    def test_full_page_without_exact_count(self, conn):
+        records, total = asyncio.run(
+            conn.search_read_with_count("res.partner", limit=2, exact_count=False)
+        )
+        assert len(records) == 2
+        assert total is None
+        conn.search_count.assert_not_called()
+
+    def test_empty_page_past_the_end_counts(self, conn):
+        records, total = asyncio.run(conn.search_read_with_count("res.partner", limit=2, offset=10))
+        assert records == []
+        assert total == 5
@@ -0,0 +1,203 @@
+"""Tests for odoo_boost.mcp_server.daemon – shared MCP daemon and stdio bridge."""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from odoo_boost.bench import BenchSizes, FakeOdoo, FakeOdooServer, build_dataset
+from odoo_boost.cli.app import app
+from odoo_boost.config.schema import CacheConfig, OdooBoostConfig, OdooConnection
+from odoo_boost.mcp_server.daemon import (
+    DaemonError,
+    bridge,
+    daemon_paths,
+    daemon_pid,
+    serve_daemon,
+    supports_daemon,
+)
+
+pytestmark = pytest.mark.skipif(not supports_daemon(), reason="needs Unix domain sockets")
+
+SIZES = BenchSizes(models=2, fields_per_model=3, views_per_model=1, modules=2, records=5)
+
+_INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    # Unix socket paths are limited to ~100 bytes, pytest's tmp_path can be longer
+    path = Path(tempfile.mkdtemp(prefix="ob-"))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(path))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def fake_server():
+    with FakeOdooServer(FakeOdoo(build_dataset(SIZES))) as server:
+        yield server
+
+
+def _config(url: str = "http://localhost:8069") -> OdooBoostConfig:
+    return OdooBoostConfig(
+        connection=OdooConnection(url=url, database="bench", protocol="jsonrpc"),
+        cache=CacheConfig(persist=False),
+    )
+
+
+def _start_daemon(config: OdooBoostConfig, config_path: Path, idle_timeout: float):
+    from odoo_boost.mcp_server.server import create_mcp_server
+
+    paths = daemon_paths(config_path, config)
+    server = create_mcp_server(config)
+    thread = threading.Thread(target=serve_daemon, args=(server, paths, idle_timeout))
+    thread.start()
+    deadline = time.monotonic() + 10
+    while daemon_pid(paths) is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+    return paths, thread
+
+
+class _Client:
+    def __init__(self, path: Path) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(path))
+        self.reader = self.sock.makefile("rb")
+
+    def send(self, message: dict) -> None:
+        self.sock.sendall(json.dumps(message).encode() + b"\n")
+
+    def receive(self) -> dict:
+        return json.loads(self.reader.readline())
+
+    def handshake(self) -> dict:
+        self.send(_INITIALIZE)
+        result = self.receive()
+        self.send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return result
+
+    def call(self, request_id: int, method: str, params: dict | None = None) -> dict:
+        self.send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        return self.receive()
+
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+
+class TestDaemonPaths:
+    def test_keyed_by_config_path_and_content(self, runtime, tmp_path):
+        config_path = tmp_path / "odoo-boost.json"
+        paths = daemon_paths(config_path, _config())
+        assert paths == daemon_paths(config_path, _config())
+        assert paths.socket.parent == runtime / "odoo-boost"
+        assert paths.socket.suffix == ".sock"
+        assert paths != daemon_paths(config_path, _config("http://other:8069"))
+        assert paths != daemon_paths(tmp_path / "other.json", _config())
+
+    def test_runtime_dir_is_private(self, runtime, tmp_path):
+        daemon_paths(tmp_path / "odoo-boost.json", _config())
+        assert (runtime / "odoo-boost").stat().st_mode & 0o777 == 0o700
+
+    def test_not_running(self, runtime, tmp_path):
+        assert daemon_pid(daemon_paths(tmp_path / "odoo-boost.json", _config())) is None
+
+
+class TestServeDaemon:
+    def test_sessions_share_one_server(self, runtime, tmp_path, fake_server):
+        config = _config(fake_server.url)
+        paths, thread = _start_daemon(config, tmp_path / "odoo-boost.json", idle_timeout=0.2)
+        try:
+            first, second = _Client(paths.socket), _Client(paths.socket)
+            assert first.handshake()["result"]["serverInfo"]["name"] == "odoo-boost"
+            second.handshake()
+            tools = first.call(2, "tools/list")["result"]["tools"]
+            assert len(tools) == 20
+
+            first.call(3, "tools/call", {"name": "get_config", "arguments": {"key": "bench"}})
+            reply = second.call(3, "tools/call", {"name": "server_stats", "arguments": {}})
+            stats = json.loads(reply["result"]["content"][0]["text"])
+            assert "get_config" in {t["tool"] for t in stats["tools"]}
+            first.close()
+            second.close()
+        finally:
+            thread.join(timeout=10)
+        assert not thread.is_alive(), "daemon did not exit when idle"
+        assert not paths.socket.exists() and not paths.pid.exists()
+
+    def test_invalid_message_keeps_session(self, runtime, tmp_path, fake_server):
+        paths, thread = _start_daemon(
+            _config(fake_server.url), tmp_path / "odoo-boost.json", idle_timeout=0.2
+        )
+        try:
+            client = _Client(paths.socket)
+            client.sock.sendall(b"not json\n")
+            assert client.handshake()["id"] == 1
+            client.close()
+        finally:
+            thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    def test_refuses_second_daemon(self, runtime, tmp_path, fake_server):
+        from odoo_boost.mcp_server.server import create_mcp_server
+
+        config = _config(fake_server.url)
+        config_path = tmp_path / "odoo-boost.json"
+        paths, thread = _start_daemon(config, config_path, idle_timeout=0.5)
+        try:
+            with pytest.raises(DaemonError, match="already"):
+                serve_daemon(create_mcp_server(config), paths, 0.5)
+            assert paths.socket.exists()
+        finally:
+            thread.join(timeout=10)
+
+
+class TestBridge:
+    def test_copies_both_directions(self):
+        shim, daemon = socket.socketpair()
+        stdin = io.BufferedReader(io.BytesIO(b'{"id":1}\n'))
+        stdout = io.BytesIO()
+
+        def echo() -> None:
+            with daemon:
+                daemon.sendall(daemon.recv(1024).upper())
+
+        thread = threading.Thread(target=echo)
+        thread.start()
+        bridge(shim, stdin, stdout)
+        thread.join()
+        assert stdout.getvalue() == b'{"ID":1}\n'
+
+
+class TestMcpCommand:
+    def test_no_daemon_without_config(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["mcp", "--no-daemon"])
+        assert result.exit_code == 1
+
+    def test_daemon_status(self, runtime, tmp_path):
+        config_path = tmp_path / "odoo-boost.json"
+        config_path.write_text(_config().model_dump_json())
+        result = CliRunner().invoke(app, ["daemon", "--config", str(config_path), "--status"])
+        assert result.exit_code == 0
+        assert "not running" in result.output
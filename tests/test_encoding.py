@@ -0,0 +1,72 @@
+"""Tests for odoo_boost.mcp_server.encoding (tool response encoding)."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+
+import pytest
+
+from odoo_boost.mcp_server import encoding
+from odoo_boost.mcp_server.encoding import encode_result, to_columnar
+
+RECORDS = [{"id": 1, "name": "Azure"}, {"id": 2, "email": "joel@example.com"}]
+
+
+class TestToColumnar:
+    def test_record_list_becomes_table(self):
+        assert to_columnar(RECORDS) == {
+            "columns": ["id", "name", "email"],
+            "rows": [[1, "Azure", None], [2, None, "joel@example.com"]],
+        }
+
+    def test_nested_lists_converted(self):
+        result = to_columnar({"total": 2, "records": RECORDS})
+        assert result["total"] == 2
+        assert result["records"]["columns"] == ["id", "name", "email"]
+
+    def test_plain_lists_untouched(self):
+        assert to_columnar({"ids": [1, 2], "empty": [], "m2o": [1, "Azure"]}) == {
+            "ids": [1, 2],
+            "empty": [],
+            "m2o": [1, "Azure"],
+        }
+
+
+class TestEncodeResult:
+    def test_pretty_is_indented(self):
+        assert encode_result({"a": 1}, "pretty") == '{\n  "a": 1\n}'
+
+    def test_compact_has_no_whitespace(self):
+        assert encode_result({"a": [1, 2]}, "compact") == '{"a":[1,2]}'
+
+    def test_columnar(self):
+        decoded = json.loads(encode_result({"records": RECORDS}, "columnar"))
+        assert decoded["records"]["rows"][0] == [1, "Azure", None]
+
+    def test_non_json_values_use_str(self):
+        value = {"date": datetime.datetime(2024, 1, 2, 3, 4, 5)}
+        assert json.loads(encode_result(value, "compact")) == {"date": "2024-01-02 03:04:05"}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(encoding, "orjson", None)
+        assert encode_result({"a": [1, 2]}, "compact") == '{"a":[1,2]}'
+        assert encode_result({"a": 1}, "pretty") == '{\n  "a": 1\n}'
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unknown output format"):
+            encode_result({}, "yaml")  # type: ignore[arg-type]
+
+    def test_default_from_config(self, server_context):
+        server_context.config.output_format = "pretty"
+        assert encode_result({"a": 1}) == '{\n  "a": 1\n}'
+        server_context.config.output_format = "compact"
+        assert encode_result({"a": 1}) == '{"a":1}'
+
+    def test_tool_override(self, server_context):
+        from odoo_boost.mcp_server.tools.search_records import search_records
+
+        result = json.loads(asyncio.run(search_records("res.partner", output_format="columnar")))
+        assert result["records"]["columns"][0] == "id"
+        assert len(result["records"]["rows"]) == 2
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from odoo_boost.guidelines.budget import (
+    compose_budgeted_guidelines,
+    estimate_tokens,
+    module_profile,
+)
 from odoo_boost.guidelines.composer import _CORE_FILES, compose_guidelines
 
 
@@ -47,3 +52,42 @@ class TestComposeGuidelines:
 
     def test_core_files_list_not_empty(self):
         assert len(_CORE_FILES) == 9
+
+
+class TestComposeBudgetedGuidelines:
+    def test_large_budget_keeps_everything(self):
+        result = compose_budgeted_guidelines("18.0", 100_000)
+        assert "## JavaScript and OWL" in result
+        assert "## Odoo 18 Specific Notes" in result
+        assert "search_guidelines" not in result
+
+    def test_fits_budget(self):
+        for budget in (2000, 1000, 500):
+            result = compose_budgeted_guidelines("18.0", budget)
+            assert estimate_tokens(result) <= budget
+            assert result.startswith("# Odoo Development Guidelines")
+
+    def test_tight_budget_condenses_and_points_to_search(self):
+        result = compose_budgeted_guidelines("18.0", 1000)
+        assert "search_guidelines" in result
+        assert "## Security" in result
+        assert "```" not in result
+
+    def test_backend_profile_skips_frontend_sections(self):
+        result = compose_budgeted_guidelines("18.0", 100_000, ["base", "sale", "web"])
+        assert "JavaScript and OWL" not in result
+        assert "## Controllers" not in result
+        assert "### JavaScript" not in result
+        assert "## ORM Best Practices" in result
+
+    def test_website_profile_keeps_frontend_sections(self):
+        result = compose_budgeted_guidelines("18.0", 100_000, ["base", "website_sale"])
+        assert "## JavaScript and OWL" in result
+
+    def test_module_profile(self):
+        assert module_profile(["base", "sale"]) == frozenset()
+        assert module_profile(["portal"]) == {"frontend"}
+
+    def test_cached_by_profile(self):
+        first = compose_budgeted_guidelines("18.0", 800, ["base", "sale"])
+        assert compose_budgeted_guidelines("18.0", 800, ["base", "stock"]) is first
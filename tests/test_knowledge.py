@@ -0,0 +1,108 @@
+"""Tests for odoo_boost.knowledge (section splitting and BM25 search)."""
+
+from __future__ import annotations
+
+from odoo_boost.knowledge import (
+    SearchIndex,
+    get_index,
+    guideline_sections,
+    split_sections,
+    tokenize,
+)
+
+DOC = """---
+name: Example
+---
+
+# Example
+
+Intro text.
+
+## Models
+
+Define `_name` on every model.
+
+```python
+# not a heading
+class Foo(models.Model):
+    pass
+```
+
+## Models
+
+Second section with the same heading.
+
+## Empty
+"""
+
+
+class TestSplitSections:
+    def test_split_on_headings(self):
+        sections = split_sections(DOC, "skill", "skills/example")
+        assert [s.title for s in sections] == [
+            "Example",
+            "Example > Models",
+            "Example > Models",
+        ]
+
+    def test_code_fence_comment_is_not_a_heading(self):
+        models = split_sections(DOC, "skill", "skills/example")[1]
+        assert "# not a heading" in models.text
+
+    def test_unique_ids(self):
+        ids = [s.id for s in split_sections(DOC, "skill", "skills/example")]
+        assert ids == ["skills/example#example", "skills/example#models", "skills/example#models-2"]
+
+    def test_front_matter_dropped(self):
+        assert all("name: Example" not in s.text for s in split_sections(DOC, "skill", "x"))
+
+
+class TestGuidelineSections:
+    def test_core_plus_requested_version(self):
+        documents = {s.document for s in guideline_sections("18.0")}
+        assert "guidelines/orm_best_practices" in documents
+        assert {d for d in documents if "/versions/" in d} == {"guidelines/versions/v18"}
+
+    def test_unknown_version_has_no_addendum(self):
+        assert all(s.source == "guideline" for s in guideline_sections("9.0"))
+
+
+class TestTokenize:
+    def test_stopwords_and_plurals(self):
+        assert tokenize("How to write the Record Rules for policies") == [
+            "write",
+            "record",
+            "rule",
+            "policy",
+        ]
+
+
+class TestSearchIndex:
+    def test_bundled_corpus(self):
+        index = get_index()
+        sources = {s.source for s in index.sections}
+        assert sources == {"guideline", "version", "skill"}
+        assert get_index() is index
+
+    def test_ranks_relevant_section_first(self):
+        (score, section), *_ = get_index().search("record rules")
+        assert score > 0
+        assert "Record Rules" in section.title
+
+    def test_source_filter(self):
+        results = get_index().search("record rules", sources=["skill"], limit=10)
+        assert results
+        assert all(section.source == "skill" for _, section in results)
+
+    def test_version_filter(self):
+        index = get_index()
+        for _, section in index.search("odoo version changes", version="17", limit=50):
+            assert section.version in (None, "17")
+
+    def test_no_match(self):
+        assert get_index().search("xyznonexistent") == []
+
+    def test_get_by_id(self):
+        index = SearchIndex(split_sections(DOC, "skill", "skills/example"))
+        assert index.get("skills/example#models-2").text.startswith("Second")
+        assert index.get("missing") is None
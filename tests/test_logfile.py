@@ -0,0 +1,139 @@
+"""Tests for the indexed local log-file reader."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import odoo_boost.mcp_server.logfile as logfile
+from odoo_boost.mcp_server.logfile import LogFileIndex
+
+LINES = [
+    "2025-01-15 10:00:00,001 100 INFO mydb odoo.modules.loading: loading 42 modules",
+    "2025-01-15 10:01:00,002 100 WARNING mydb odoo.addons.sale.models.sale_order: slow",
+    "2025-01-15 10:02:00,003 100 ERROR mydb odoo.http: Exception during request",
+    "Traceback (most recent call last):",
+    '  File "odoo/http.py", line 1, in dispatch',
+    "ValueError: boom",
+    "2025-01-15 10:03:00,004 101 INFO ? odoo.service.server: HTTP service running",
+]
+
+
+@pytest.fixture()
+def log_path(tmp_path):
+    path = tmp_path / "odoo.log"
+    path.write_text("\n".join(LINES) + "\n")
+    return path
+
+
+@pytest.fixture()
+def index(tmp_path, log_path):
+    idx = LogFileIndex(str(tmp_path / "odoo.log*"), tmp_path / "index" / "logs.sqlite")
+    yield idx
+    idx.close()
+
+
+def _append(path, *lines: str) -> None:
+    with path.open("a") as fh:
+        fh.write("".join(f"{line}\n" for line in lines))
+
+
+class TestLogFileIndex:
+    def test_parses_records(self, index):
+        assert index.refresh() == 4
+        entries = index.search()
+        assert [e["level"] for e in entries] == ["INFO", "ERROR", "WARNING", "INFO"]
+        assert entries[0]["name"] == "odoo.service.server"
+        assert entries[0]["pid"] == 101
+
+    def test_traceback_belongs_to_record(self, index):
+        index.refresh()
+        (error,) = index.search(level="error")
+        assert error["message"].startswith("Exception during request\nTraceback")
+        assert error["message"].endswith("ValueError: boom")
+
+    def test_filters(self, index):
+        index.refresh()
+        assert len(index.search(logger="sale")) == 1
+        assert len(index.search(since="2025-01-15 10:01:00", until="2025-01-15 10:02:00")) == 2
+        assert [e["level"] for e in index.search(text="SERVICE")] == ["INFO"]
+        assert len(index.search(limit=2)) == 2
+
+    def test_incremental_refresh_and_cursor(self, index, log_path):
+        index.refresh()
+        cursor = max(e["id"] for e in index.search())
+        _append(
+            log_path,
+            "  continued line",
+            "2025-01-15 10:04:00,005 101 ERROR mydb odoo.sql_db: bad query",
+        )
+        assert index.refresh() == 1
+        new = index.search(cursor=cursor)
+        assert [e["name"] for e in new] == ["odoo.sql_db"]
+        assert index.search(level="INFO")[0]["message"].endswith("running\n  continued line")
+
+    def test_partial_line_waits(self, index, log_path):
+        index.refresh()
+        with log_path.open("a") as fh:
+            fh.write("2025-01-15 10:05:00,006 101 INFO mydb odoo.http: half")
+        assert index.refresh() == 0
+        _append(log_path, " written")
+        assert index.refresh() == 1
+        assert index.search(limit=1)[0]["message"] == "half written"
+
+    def test_rotation_keeps_entries(self, index, log_path):
+        index.refresh()
+        os.rename(log_path, log_path.with_name("odoo.log.1"))
+        log_path.write_text("2025-01-15 11:00:00,000 102 INFO mydb odoo.http: after rotation\n")
+        assert index.refresh() == 1
+        entries = index.search()
+        assert len(entries) == 5
+        assert entries[0]["message"] == "after rotation"
+
+    def test_truncation_reindexes(self, index, log_path):
+        index.refresh()
+        log_path.write_text("2025-01-15 12:00:00,000 103 INFO mydb odoo.http: fresh\n")
+        index.refresh()
+        assert [e["message"] for e in index.search()] == ["fresh"]
+
+    def test_deleted_file_is_dropped(self, index, log_path):
+        index.refresh()
+        log_path.unlink()
+        index.refresh()
+        assert index.search() == []
+
+
+class TestChunkedIndexing:
+    def test_chunks_match_single_pass(self, index, monkeypatch):
+        monkeypatch.setattr(logfile, "_INDEX_CHUNK", 1)
+        assert index.refresh() == 4
+        (error,) = index.search(level="error")
+        assert error["message"].endswith("ValueError: boom")
+        assert len(index.search()) == 4
+
+    def test_interrupted_pass_keeps_progress(self, tmp_path, log_path, monkeypatch):
+        monkeypatch.setattr(logfile, "_INDEX_CHUNK", 1)
+        store = LogFileIndex._store
+        calls = []
+
+        def failing_store(db, key, records, end):
+            calls.append(end)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            return store(db, key, records, end)
+
+        monkeypatch.setattr(LogFileIndex, "_store", staticmethod(failing_store))
+        index_path = tmp_path / "index" / "logs.sqlite"
+        first = LogFileIndex(str(log_path), index_path)
+        with pytest.raises(OSError):
+            first.refresh()
+        first.close()
+
+        monkeypatch.setattr(LogFileIndex, "_store", staticmethod(store))
+        second = LogFileIndex(str(log_path), index_path)
+        try:
+            assert second.refresh() == 2  # the first two records were committed
+            assert [e["level"] for e in second.search()] == ["INFO", "ERROR", "WARNING", "INFO"]
+        finally:
+            second.close()
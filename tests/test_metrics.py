@@ -0,0 +1,153 @@
+"""Tests for odoo_boost.mcp_server.metrics – tool and RPC statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+
+import pytest
+
+from odoo_boost.connection.base import RpcCall
+from odoo_boost.mcp_server.metrics import ServerMetrics
+
+
+def _rpc(model: str = "res.partner", method: str = "search_read", error: str | None = None):
+    return RpcCall(
+        service="object",
+        method="execute_kw",
+        model=model,
+        orm_method=method,
+        seconds=0.01,
+        request_bytes=100,
+        response_bytes=1000,
+        error=error,
+    )
+
+
+class TestServerMetrics:
+    def test_rpcs_attributed_to_tool(self):
+        metrics = ServerMetrics()
+
+        async def tool(count: int = 2) -> str:
+            """Doc line."""
+            for _ in range(count):
+                metrics.observe_rpc(_rpc())
+            return '{"ok":true}'
+
+        wrapped = metrics.instrument(tool)
+        assert asyncio.run(wrapped(count=3)) == '{"ok":true}'
+        metrics.observe_rpc(_rpc("ir.model"))  # outside a tool call
+
+        snapshot = metrics.snapshot()
+        stats = snapshot["tools"]["tool"]
+        assert (stats["calls"], stats["rpc_count"]) == (1, 3)
+        assert (stats["request_bytes"], stats["response_bytes"]) == (300, 3000)
+        assert stats["result_bytes"] == len('{"ok":true}')
+        assert snapshot["rpcs"]["res.partner.search_read"]["calls"] == 3
+        assert snapshot["rpcs"]["ir.model.search_read"]["calls"] == 1
+
+    def test_gathered_tasks_attributed(self):
+        metrics = ServerMetrics()
+
+        async def one() -> None:
+            await asyncio.sleep(0)
+            metrics.observe_rpc(_rpc())
+
+        async def tool() -> str:
+            await asyncio.gather(one(), one())
+            return "{}"
+
+        asyncio.run(metrics.instrument(tool)())
+        assert metrics.snapshot()["tools"]["tool"]["rpc_count"] == 2
+
+    def test_instrument_keeps_signature_and_sync(self):
+        metrics = ServerMetrics()
+
+        def tool(query: str, limit: int = 3) -> str:
+            """Search something."""
+            return "{}"
+
+        wrapped = metrics.instrument(tool)
+        assert not inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "tool" and wrapped.__doc__ == "Search something."
+        assert list(inspect.signature(wrapped).parameters) == ["query", "limit"]
+        assert wrapped("x") == "{}"
+
+    def test_errors_counted(self):
+        metrics = ServerMetrics()
+
+        def failing() -> str:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            metrics.instrument(failing)()
+        metrics.instrument(lambda: '{\n  "error": "Model not found."\n}')()
+        metrics.observe_rpc(_rpc(error="Fault"))
+        snapshot = metrics.snapshot()
+        assert snapshot["tools"]["failing"]["errors"] == 1
+        assert snapshot["tools"]["<lambda>"]["errors"] == 1
+        assert snapshot["rpcs"]["res.partner.search_read"]["errors"] == 1
+
+    def test_metrics_file(self, tmp_path):
+        path = tmp_path / "metrics" / "calls.jsonl"
+        metrics = ServerMetrics(path)
+
+        def tool() -> str:
+            metrics.observe_rpc(_rpc())
+            return "{}"
+
+        metrics.instrument(tool)()
+        metrics.instrument(tool)()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 2
+        assert lines[0]["tool"] == "tool" and lines[0]["rpc_count"] == 1
+        assert lines[0]["rpcs"][0] == {
+            "model": "res.partner",
+            "method": "search_read",
+            "ms": 10.0,
+            "request_bytes": 100,
+            "response_bytes": 1000,
+            "error": None,
+        }
+
+    def test_percentiles_and_reset(self):
+        metrics = ServerMetrics()
+        for _ in range(20):
+            metrics.observe_rpc(_rpc())
+        stats = metrics.snapshot()["rpcs"]["res.partner.search_read"]
+        assert stats["p50_ms"] == stats["p95_ms"] == stats["max_ms"] == 10.0
+        metrics.reset()
+        assert metrics.snapshot()["rpcs"] == {}
+
+
+class TestInstrumentedServer:
+    def test_tools_registered_and_counted(self, tmp_path):
+        from odoo_boost.bench import BenchSizes, FakeOdoo, FakeOdooServer, build_dataset
+        from odoo_boost.config.schema import CacheConfig, OdooBoostConfig, OdooConnection
+        from odoo_boost.mcp_server.server import create_mcp_server
+
+        sizes = BenchSizes(models=2, fields_per_model=3, views_per_model=1, modules=2, records=5)
+        with FakeOdooServer(FakeOdoo(build_dataset(sizes))) as server:
+            config = OdooBoostConfig(
+                connection=OdooConnection(url=server.url, database="bench", protocol="jsonrpc"),
+                cache=CacheConfig(persist=False),
+                metrics_file=str(tmp_path / "calls.jsonl"),
+            )
+            mcp = create_mcp_server(config)
+
+            async def scenario():
+                tools = {tool.name: tool for tool in await mcp.list_tools()}
+                assert len(tools) == 20
+                assert "model_name" in tools["database_schema"].inputSchema["properties"]
+                await mcp.call_tool("get_config", {"key": "bench"})
+                content, _ = await mcp.call_tool("server_stats", {})
+                return json.loads(content[0].text)
+
+            result = asyncio.run(scenario())
+
+        (get_config,) = [t for t in result["tools"] if t["tool"] == "get_config"]
+        assert get_config["calls"] == 1 and get_config["rpc_count"] == 1
+        assert get_config["response_bytes"] > 0
+        assert "ir.config_parameter.search_read" in {r["call"] for r in result["rpcs"]}
+        assert (tmp_path / "calls.jsonl").read_text().count("\n") == 2  # incl. server_stats
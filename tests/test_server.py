@@ -0,0 +1,139 @@
+"""Tests for odoo_boost.mcp_server.server – HTTP transport and concurrency limit."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from odoo_boost.bench import BenchSizes, FakeOdoo, FakeOdooServer, build_dataset
+from odoo_boost.cli.app import app
+from odoo_boost.config.schema import CacheConfig, OdooBoostConfig, OdooConnection, ServerConfig
+from odoo_boost.mcp_server.server import _limit_concurrency, create_mcp_server
+
+SIZES = BenchSizes(models=2, fields_per_model=3, views_per_model=1, modules=2, records=5)
+
+
+@pytest.fixture
+def fake_server():
+    with FakeOdooServer(FakeOdoo(build_dataset(SIZES))) as server:
+        yield server
+
+
+def _config(url: str, **server) -> OdooBoostConfig:
+    return OdooBoostConfig(
+        connection=OdooConnection(url=url, database="bench", protocol="jsonrpc"),
+        cache=CacheConfig(persist=False),
+        server=ServerConfig(**server),
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestLimitConcurrency:
+    def test_caps_parallel_calls(self):
+        running = peak = 0
+
+        async def tool(n: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return n
+
+        async def scenario():
+            limited = _limit_concurrency(tool, asyncio.Semaphore(2))
+            return await asyncio.gather(*(limited(n) for n in range(6)))
+
+        assert asyncio.run(scenario()) == list(range(6))
+        assert peak == 2
+
+    def test_sync_tools_unchanged(self):
+        def tool() -> str:
+            return "{}"
+
+        assert _limit_concurrency(tool, asyncio.Semaphore(1)) is tool
+
+
+class TestHttpTransport:
+    def test_settings_applied(self, fake_server):
+        mcp = create_mcp_server(_config(fake_server.url, host="0.0.0.0", port=9123))
+        assert (mcp.settings.host, mcp.settings.port) == ("0.0.0.0", 9123)
+
+    def test_serves_concurrent_clients(self, fake_server):
+        import uvicorn
+        from mcp import ClientSession
+        from mcp.client.streamable_http import streamable_http_client
+
+        port = _free_port()
+        mcp = create_mcp_server(_config(fake_server.url, port=port, max_concurrency=4))
+        server = uvicorn.Server(
+            uvicorn.Config(mcp.streamable_http_app(), port=port, log_level="warning")
+        )
+        thread = threading.Thread(target=server.run)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while not server.started:
+                assert time.monotonic() < deadline, "server did not start"
+                time.sleep(0.02)
+
+            async def client(key: str) -> dict:
+                url = f"http://127.0.0.1:{port}/mcp"
+                async with (
+                    streamable_http_client(url) as (read, write, _),
+                    ClientSession(read, write) as session,
+                ):
+                    await session.initialize()
+                    result = await session.call_tool("get_config", {"key": key})
+                    return json.loads(result.content[0].text)
+
+            async def scenario():
+                return await asyncio.gather(*(client(f"key_{n}") for n in range(5)))
+
+            results = asyncio.run(scenario())
+        finally:
+            server.should_exit = True
+            thread.join(timeout=10)
+        assert len(results) == 5
+        assert all("error" not in result for result in results)
+
+
+class TestMcpCommand:
+    def test_unknown_transport(self, tmp_path):
+        config_path = tmp_path / "odoo-boost.json"
+        config_path.write_text(_config("http://localhost:8069").model_dump_json())
+        result = CliRunner().invoke(
+            app, ["mcp", "--config", str(config_path), "--transport", "grpc"]
+        )
+        assert result.exit_code == 1
+
+    def test_stdio_override_uses_saved_config_for_daemon(self, tmp_path, monkeypatch):
+        import odoo_boost.mcp_server.daemon as daemon_mod
+
+        saved = _config("http://localhost:8069", transport="http", port=9001)
+        config_path = tmp_path / "odoo-boost.json"
+        config_path.write_text(saved.model_dump_json())
+        connected = []
+        monkeypatch.setattr(daemon_mod, "supports_daemon", lambda: True)
+        monkeypatch.setattr(
+            daemon_mod, "connect_daemon", lambda path, cfg: connected.append(cfg) or object()
+        )
+        monkeypatch.setattr(daemon_mod, "bridge", lambda sock, stdin, stdout: None)
+
+        result = CliRunner().invoke(
+            app, ["mcp", "--config", str(config_path), "--transport", "stdio"]
+        )
+        assert result.exit_code == 0, result.output
+        # Same config as the spawned 'odoo-boost daemon --config' loads, so same socket
+        assert connected == [saved]
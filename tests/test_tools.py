@@ -1,8 +1,12 @@
-"""Tests for all 15 MCP tools using MockOdooConnection."""
+"""Tests for all 20 MCP tools using MockOdooConnection."""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import csv
 import json
+from typing import Any
 
 import pytest
 
@@ -10,8 +14,11 @@ from odoo_boost.mcp_server.tools.application_info import application_info
 from odoo_boost.mcp_server.tools.database_query import database_query
 from odoo_boost.mcp_server.tools.database_schema import database_schema
 from odoo_boost.mcp_server.tools.execute_method import execute_method
+from odoo_boost.mcp_server.tools.export_records import export_records
 from odoo_boost.mcp_server.tools.get_config import get_config
 from odoo_boost.mcp_server.tools.get_module_info import get_module_info
+from odoo_boost.mcp_server.tools.get_view_arch import get_view_arch
+from odoo_boost.mcp_server.tools.group_records import group_records
 from odoo_boost.mcp_server.tools.list_access_rights import list_access_rights
 from odoo_boost.mcp_server.tools.list_menus import list_menus
 from odoo_boost.mcp_server.tools.list_models import list_models
@@ -20,11 +27,18 @@ from odoo_boost.mcp_server.tools.list_views import list_views
 from odoo_boost.mcp_server.tools.list_workflows import list_workflows
 from odoo_boost.mcp_server.tools.read_log_entries import read_log_entries
 from odoo_boost.mcp_server.tools.search_docs import search_docs
+from odoo_boost.mcp_server.tools.search_guidelines import search_guidelines
 from odoo_boost.mcp_server.tools.search_records import search_records
+from odoo_boost.mcp_server.tools.server_stats import server_stats
 
 pytestmark = pytest.mark.usefixtures("server_context")
 
 
+def run(coro: Any) -> Any:
+    """Run an async tool to completion and decode its JSON result."""
+    return json.loads(asyncio.run(coro))
+
+
 # ---------------------------------------------------------------------------
 # application_info
 # ---------------------------------------------------------------------------
@@ -32,12 +46,12 @@ pytestmark = pytest.mark.usefixtures("server_context")
 
 class TestApplicationInfo:
     def test_returns_json(self):
-        result = json.loads(application_info())
+        result = run(application_info())
         assert "server_version" in result
         assert result["server_version"] == "18.0"
 
     def test_installed_modules(self):
-        result = json.loads(application_info())
+        result = run(application_info())
         assert result["installed_modules_count"] == 2  # base + sale (installed)
         names = [m["name"] for m in result["installed_modules"]]
         assert "base" in names
@@ -51,16 +65,16 @@ class TestApplicationInfo:
 
 class TestDatabaseSchema:
     def test_known_model(self):
-        result = json.loads(database_schema("res.partner"))
+        result = run(database_schema("res.partner"))
         assert result["model"] == "res.partner"
         assert result["field_count"] == 3
 
     def test_unknown_model(self):
-        result = json.loads(database_schema("nonexistent.model"))
+        result = run(database_schema("nonexistent.model"))
         assert "error" in result
 
     def test_fields_have_type(self):
-        result = json.loads(database_schema("res.partner"))
+        result = run(database_schema("res.partner"))
         types = {f["name"]: f["type"] for f in result["fields"]}
         assert types["name"] == "char"
         assert types["company_id"] == "many2one"
@@ -73,23 +87,29 @@ class TestDatabaseSchema:
 
 class TestDatabaseQuery:
     def test_basic_query(self):
-        result = json.loads(database_query("res.partner"))
+        result = run(database_query("res.partner"))
         assert result["model"] == "res.partner"
         assert result["total_count"] == 2
         assert result["returned_count"] == 2
 
     def test_domain_filter(self):
-        result = json.loads(database_query("res.partner", domain='[["is_company", "=", true]]'))
+        result = run(database_query("res.partner", domain='[["is_company", "=", true]]'))
         assert result["total_count"] == 1
 
     def test_fields_filter(self):
-        result = json.loads(database_query("res.partner", fields='["name"]'))
+        result = run(database_query("res.partner", fields='["name"]'))
         for rec in result["records"]:
             assert "name" in rec
 
     def test_limit(self):
-        result = json.loads(database_query("res.partner", limit=1))
+        result = run(database_query("res.partner", limit=1))
+        assert result["returned_count"] == 1
+        assert result["total_count"] == 2
+
+    def test_skip_exact_count(self):
+        result = run(database_query("res.partner", limit=1, exact_count=False))
         assert result["returned_count"] == 1
+        assert result["total_count"] is None
 
 
 # ---------------------------------------------------------------------------
@@ -99,19 +119,24 @@ class TestDatabaseQuery:
 
 class TestListModels:
     def test_returns_models(self):
-        result = json.loads(list_models())
+        result = run(list_models())
         assert result["total"] == 2
 
     def test_filter_by_name(self):
-        result = json.loads(list_models(filter_name="partner"))
+        result = run(list_models(filter_name="partner"))
         assert result["total"] == 1
         assert result["models"][0]["model"] == "res.partner"
 
     def test_field_count(self):
-        result = json.loads(list_models())
+        result = run(list_models())
         partner = [m for m in result["models"] if m["model"] == "res.partner"][0]
         assert partner["field_count"] == 3
 
+    def test_field_count_is_grouped_on_fields(self):
+        # sale.order lists field ids [4, 5] but has no ir.model.fields rows seeded
+        result = run(list_models(filter_name="sale"))
+        assert result["models"][0]["field_count"] == 0
+
 
 # ---------------------------------------------------------------------------
 # list_views
@@ -120,18 +145,115 @@ class TestListModels:
 
 class TestListViews:
     def test_all_views(self):
-        result = json.loads(list_views())
+        result = run(list_views())
         assert result["total"] == 2
 
     def test_filter_by_model(self):
-        result = json.loads(list_views(model_name="res.partner"))
+        result = run(list_views(model_name="res.partner"))
         assert result["total"] == 2
 
     def test_filter_by_type(self):
-        result = json.loads(list_views(view_type="form"))
+        result = run(list_views(view_type="form"))
         assert result["total"] == 1
         assert result["views"][0]["type"] == "form"
 
+    def test_arch_off_by_default(self):
+        result = run(list_views())
+        assert all("arch" not in v for v in result["views"])
+
+    def test_fetch_by_ids_with_arch(self):
+        result = run(list_views(view_ids="[2]", include_arch=True))
+        assert [v["id"] for v in result["views"]] == [2]
+        assert result["views"][0]["arch"] == "<tree><field name='name'/></tree>"
+
+    def test_summary(self):
+        result = run(list_views(view_type="form", summarize=True))
+        view = result["views"][0]
+        assert view["summary"] == {"fields": ["name"], "xpath_targets": [], "node_count": 2}
+        assert "arch" not in view
+
+
+# ---------------------------------------------------------------------------
+# get_view_arch
+# ---------------------------------------------------------------------------
+
+
+class TestGetViewArch:
+    def test_combined_form(self):
+        result = run(get_view_arch("res.partner"))
+        assert result["view_id"] == 1
+        assert result["arch"] == "<form><field name='name'/></form>"
+
+    def test_list_type_follows_version(self, mock_connection):
+        mock_connection._version["server_serie"] = "17.0"
+        result = run(get_view_arch("res.partner", "list"))
+        assert result["view_type"] == "tree"
+        assert result["view_id"] == 2
+
+    def test_error_not_cached(self, server_context):
+        assert "error" in run(get_view_arch("sale.order"))
+        server_context.connection.seed(
+            "ir.ui.view",
+            [
+                {
+                    "id": 3,
+                    "name": "so.form",
+                    "model": "sale.order",
+                    "type": "form",
+                    "arch": "<form/>",
+                }
+            ],
+        )
+        assert run(get_view_arch("sale.order"))["arch"] == "<form/>"
+
+    def test_only_changes(self, server_context):
+        server_context.connection.seed(
+            "ir.ui.view",
+            [
+                {
+                    "id": 7,
+                    "name": "res.partner.form.inherit",
+                    "model": "res.partner",
+                    "type": "form",
+                    "arch": "<field name='name' position='after'><field name='email'/></field>",
+                    "inherit_id": [1, "res.partner.form"],
+                },
+            ],
+        )
+        result = run(get_view_arch("res.partner", view_id=7, only_changes=True))
+        assert result["changes"] == [
+            {
+                "target": "field[@name='name']",
+                "position": "after",
+                "content": '<field name="email" />',
+            }
+        ]
+
+    def test_only_changes_needs_inheriting_view(self):
+        assert "error" in run(get_view_arch("res.partner", only_changes=True))
+        assert (
+            "does not inherit"
+            in run(get_view_arch("res.partner", view_id=1, only_changes=True))["error"]
+        )
+
+    @pytest.mark.parametrize("arch", ["<field name='name' position='after'>", False])
+    def test_only_changes_unparsable_arch(self, server_context, arch):
+        server_context.connection.seed(
+            "ir.ui.view",
+            [
+                {
+                    "id": 7,
+                    "name": "res.partner.form.inherit",
+                    "model": "res.partner",
+                    "type": "form",
+                    "arch": arch,
+                    "inherit_id": [1, "res.partner.form"],
+                },
+            ],
+        )
+        result = run(get_view_arch("res.partner", view_id=7, only_changes=True))
+        assert "Cannot parse arch" in result["error"]
+
 
 # ---------------------------------------------------------------------------
 # list_menus
@@ -140,14 +262,36 @@ class TestListViews:
 
 class TestListMenus:
     def test_root_menus(self):
-        result = json.loads(list_menus(parent_id=0))
+        result = run(list_menus(parent_id=0))
         assert result["total"] == 1
         assert result["menus"][0]["name"] == "Sales"
 
     def test_all_menus(self):
-        result = json.loads(list_menus(parent_id=-1))
+        result = run(list_menus(parent_id=-1))
         assert result["total"] == 2
 
+    def test_child_level(self):
+        result = run(list_menus(parent_id=1))
+        assert result["menus"][0]["complete_name"] == "Sales / Orders"
+        assert result["menus"][0]["parent_id"] == 1
+
+    def test_tree(self):
+        result = run(list_menus(tree=True))
+        assert result["total"] == 2
+        sales = result["menus"][0]
+        assert sales["child_count"] == 1
+        assert sales["children"][0]["name"] == "Orders"
+
+    def test_tree_max_depth_and_subtree(self):
+        result = run(list_menus(tree=True, max_depth=1))
+        assert result["total"] == 1
+        assert "children" not in result["menus"][0]
+        result = run(list_menus(parent_id=2, tree=True))
+        assert [m["name"] for m in result["menus"]] == ["Orders"]
+
+    def test_unknown_parent(self):
+        assert "error" in run(list_menus(parent_id=99, tree=True))
+
 
 # ---------------------------------------------------------------------------
 # list_routes
@@ -158,10 +302,25 @@ class TestListRoutes:
     def test_returns_result(self):
         # No website.page / website.rewrite seeded, so routes should be empty
         # (the tool catches exceptions silently)
-        result = json.loads(list_routes())
+        result = run(list_routes())
         assert "total" in result
         assert "routes" in result
 
+    def test_missing_model_does_not_hide_other(self, server_context, monkeypatch):
+        conn = server_context.connection
+        conn.seed("website.rewrite", [{"id": 1, "name": "Old", "url_from": "/a", "url_to": "/b"}])
+        original = conn.search_read
+
+        async def search_read(model, *args, **kwargs):
+            if model == "website.page":
+                raise Exception("Object website.page doesn't exist")
+            return await original(model, *args, **kwargs)
+
+        monkeypatch.setattr(conn, "search_read", search_read)
+        result = run(list_routes())
+        assert result["total"] == 1
+        assert result["routes"][0]["type"] == "rewrite"
+
 
 # ---------------------------------------------------------------------------
 # list_access_rights
@@ -170,12 +329,12 @@ class TestListRoutes:
 
 class TestListAccessRights:
     def test_returns_acls_and_rules(self):
-        result = json.loads(list_access_rights())
+        result = run(list_access_rights())
         assert "access_rights" in result
         assert "record_rules" in result
 
     def test_has_entries(self):
-        result = json.loads(list_access_rights())
+        result = run(list_access_rights())
         assert len(result["access_rights"]) >= 1
         assert len(result["record_rules"]) >= 1
 
@@ -187,11 +346,11 @@ class TestListAccessRights:
 
 class TestGetConfig:
     def test_all_params(self):
-        result = json.loads(get_config())
+        result = run(get_config())
         assert result["total"] == 2
 
     def test_filter_by_key(self):
-        result = json.loads(get_config(key="web.base"))
+        result = run(get_config(key="web.base"))
         assert result["total"] == 1
         assert result["parameters"][0]["key"] == "web.base.url"
 
@@ -203,14 +362,44 @@ class TestGetConfig:
 
 class TestGetModuleInfo:
     def test_known_module(self):
-        result = json.loads(get_module_info("base"))
+        result = run(get_module_info("base"))
         assert result["name"] == "base"
         assert result["state"] == "installed"
 
     def test_unknown_module(self):
-        result = json.loads(get_module_info("nonexistent_mod"))
+        result = run(get_module_info("nonexistent_mod"))
         assert "error" in result
 
+    def test_dependencies_and_models(self):
+        assert run(get_module_info("sale"))["dependencies"] == [
+            {"name": "base", "auto_install_required": False}
+        ]
+        assert run(get_module_info("base"))["models"] == [
+            {"model": "res.partner", "name": "Contact"}
+        ]
+
+    def test_several_modules(self):
+        result = run(get_module_info("sale, base,nonexistent_mod"))
+        assert [m["name"] for m in result["modules"]] == ["sale", "base"]
+        assert result["not_found"] == ["nonexistent_mod"]
+
+    def test_dependency_tree(self, server_context):
+        server_context.connection.seed(
+            "ir.module.module.dependency",
+            [
+                {"id": 1, "name": "base", "module_id": [2, "Sales"]},
+                {"id": 2, "name": "sale", "module_id": [3, "Purchase"]},
+                {"id": 3, "name": "base", "module_id": [3, "Purchase"]},
+            ],
+        )
+        result = run(get_module_info("purchase", dependency_tree=True))
+        assert result["all_dependencies"] == ["base", "sale"]
+        assert result["dependency_graph"] == {
+            "purchase": ["base", "sale"],
+            "base": [],
+            "sale": ["base"],
+        }
+
 
 # ---------------------------------------------------------------------------
 # search_records
@@ -219,14 +408,134 @@ class TestGetModuleInfo:
 
 class TestSearchRecords:
     def test_basic_search(self):
-        result = json.loads(search_records("res.partner"))
+        result = run(search_records("res.partner"))
         assert result["model"] == "res.partner"
         assert result["total_count"] == 2
 
     def test_with_domain(self):
-        result = json.loads(search_records("res.partner", domain='[["is_company", "=", true]]'))
+        result = run(search_records("res.partner", domain='[["is_company", "=", true]]'))
         assert result["total_count"] == 1
 
+    def test_full_page_still_counts_all(self):
+        result = run(search_records("res.partner", limit=1))
+        assert result["returned_count"] == 1
+        assert result["total_count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# export_records
+# ---------------------------------------------------------------------------
+
+
+class TestExportRecords:
+    @pytest.fixture(autouse=True)
+    def _many_partners(self, server_context, tmp_path):
+        server_context.config.export_dir = str(tmp_path / "exports")
+        server_context.connection.seed(
+            "res.partner",
+            [{"id": i, "name": f"P{i}", "parent_id": [1, "P1"]} for i in range(1, 26)],
+        )
+
+    def test_ndjson_in_batches(self, tmp_path):
+        result = run(export_records("res.partner", batch_size=10))
+        assert result["record_count"] == 25
+        assert result["batch_count"] == 3
+        assert result["path"].startswith(str(tmp_path / "exports"))
+        with open(result["path"]) as fh:
+            rows = [json.loads(line) for line in fh]
+        assert [r["id"] for r in rows] == list(range(1, 26))
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"batch_size": -5}, {"max_records": -1}])
+    def test_invalid_sizes(self, server_context, kwargs, tmp_path):
+        result = run(export_records("res.partner", **kwargs))
+        assert "must be" in result["error"]
+        assert not (tmp_path / "exports").exists()
+
+    def test_bypasses_read_cache(self, server_context, monkeypatch):
+        conn = server_context.connection
+        bypass = conn.bypass_read_cache
+        entered = []
+
+        @contextlib.contextmanager
+        def tracking():
+            entered.append(True)
+            with bypass():
+                yield
+
+        monkeypatch.setattr(conn, "bypass_read_cache", tracking)
+        assert run(export_records("res.partner", batch_size=10))["record_count"] == 25
+        assert entered == [True]
+
+    def test_csv_with_fields(self):
+        result = run(
+            export_records(
+                "res.partner", fields='["name", "parent_id"]', file_format="csv", batch_size=7
+            )
+        )
+        assert result["columns"] == ["id", "name", "parent_id"]
+        with open(result["path"], newline="") as fh:
+            rows = list(csv.reader(fh))
+        assert rows[0] == ["id", "name", "parent_id"]
+        assert rows[1] == ["1", "P1", '[1,"P1"]']
+        assert len(rows) == 26
+
+    def test_domain_and_max_records(self):
+        result = run(
+            export_records(
+                "res.partner", domain='[["name", "ilike", "P1"]]', max_records=5, batch_size=2
+            )
+        )
+        assert result["record_count"] == 5  # P1, P10..P13
+        assert result["batch_count"] == 3
+
+    def test_empty_result(self):
+        result = run(export_records("res.partner", domain='[["name", "=", "nobody"]]'))
+        assert (result["record_count"], result["batch_count"]) == (0, 0)
+
+
+# ---------------------------------------------------------------------------
+# group_records
+# ---------------------------------------------------------------------------
+
+
+class TestGroupRecords:
+    @pytest.fixture(autouse=True)
+    def _orders(self, server_context):
+        server_context.connection.seed(
+            "sale.order",
+            [
+                {
+                    "id": 1,
+                    "user_id": [2, "Admin"],
+                    "date_order": "2025-01-03",
+                    "amount_total": 10.0,
+                },
+                {"id": 2, "user_id": [2, "Admin"], "date_order": "2025-01-20", "amount_total": 5.0},
+                {"id": 3, "user_id": [6, "Demo"], "date_order": "2025-02-01", "amount_total": 7.0},
+            ],
+        )
+
+    def _totals(self, result):
+        return {
+            tuple(g["user_id"]): (g["amount_total:sum"], g["__count"]) for g in result["groups"]
+        }
+
+    def test_sum_per_user(self):
+        result = run(group_records("sale.order", '["user_id"]', '["amount_total:sum"]'))
+        assert result["group_count"] == 2
+        assert self._totals(result) == {(2, "Admin"): (15.0, 2), (6, "Demo"): (7.0, 1)}
+
+    def test_date_granularity(self):
+        result = run(group_records("sale.order", '["date_order:month"]'))
+        counts = {g["date_order:month"]: g["__count"] for g in result["groups"]}
+        assert counts == {"2025-01": 2, "2025-02": 1}
+
+    def test_odoo_19_uses_formatted_read_group(self, mock_connection):
+        mock_connection._version["server_serie"] = "19.0"
+        result = run(group_records("sale.order", '["user_id"]', '["amount_total:sum"]'))
+        assert self._totals(result) == {(2, "Admin"): (15.0, 2), (6, "Demo"): (7.0, 1)}
+        assert "__domain" not in result["groups"][0]
+
 
 # ---------------------------------------------------------------------------
 # execute_method
@@ -235,7 +544,7 @@ class TestSearchRecords:
 
 class TestExecuteMethod:
     def test_execute(self):
-        result = json.loads(execute_method("res.partner", "name_search"))
+        result = run(execute_method("res.partner", "name_search"))
         assert result["model"] == "res.partner"
         assert result["method"] == "name_search"
         assert "result" in result
@@ -249,11 +558,93 @@ class TestExecuteMethod:
 class TestReadLogEntries:
     def test_no_logs(self):
         # ir.logging not seeded, so should return empty or error
-        result = json.loads(read_log_entries())
+        result = run(read_log_entries())
         # Could be {"total": 0, "entries": []} or {"error": ...}
         assert "total" in result or "error" in result
 
 
+class TestReadLogEntriesCursor:
+    @pytest.fixture(autouse=True)
+    def _logs(self, server_context):
+        server_context.connection.seed(
+            "ir.logging",
+            [
+                {
+                    "id": i,
+                    "create_date": f"2025-01-15 10:0{i}:00",
+                    "name": "odoo.addons.sale" if i % 2 else "odoo.http",
+                    "level": "ERROR" if i > 3 else "INFO",
+                    "func": "action_confirm",
+                    "path": "/odoo/addons/sale/models/sale_order.py",
+                    "line": "42",
+                    "message": f"message {i}",
+                }
+                for i in range(1, 6)
+            ],
+        )
+
+    def test_newest_first_with_cursor(self):
+        result = run(read_log_entries(limit=2))
+        assert [e["id"] for e in result["entries"]] == [5, 4]
+        assert result["cursor"] == 5
+
+    def test_follow_returns_only_new_entries(self, server_context):
+        result = run(read_log_entries(cursor=3))
+        assert [e["id"] for e in result["entries"]] == [4, 5]
+        assert result["cursor"] == 5
+        empty = run(read_log_entries(cursor=result["cursor"]))
+        assert (empty["entries"], empty["cursor"]) == ([], 5)
+
+    def test_name_path_and_time_filters(self):
+        result = run(read_log_entries(name="sale", path="sale_order"))
+        assert [e["id"] for e in result["entries"]] == [5, 3, 1]
+        result = run(read_log_entries(since="2025-01-15 10:02:00", until="2025-01-15 10:04:00"))
+        assert [e["id"] for e in result["entries"]] == [4, 3, 2]
+
+
+class TestReadLogEntriesFile:
+    @pytest.fixture()
+    def log_context(self, server_context, tmp_path):
+        from odoo_boost.mcp_server.context import ServerContext, set_context
+
+        log_path = tmp_path / "odoo.log"
+        log_path.write_text(
+            "2025-01-15 10:00:00,000 100 INFO mydb odoo.http: started\n"
+            "2025-01-15 10:01:00,000 100 ERROR mydb odoo.addons.sale: failed\n"
+            "Traceback (most recent call last):\n"
+        )
+        config = server_context.config.model_copy(
+            update={
+                "log_file": str(log_path),
+                "cache": server_context.config.cache.model_copy(
+                    update={"directory": str(tmp_path / "cache")}
+                ),
+            }
+        )
+        ctx = ServerContext(connection=server_context.connection, config=config)
+        set_context(ctx)
+        yield log_path
+        ctx.log_index.close()
+
+    def test_auto_uses_log_file(self, log_context):
+        result = run(read_log_entries(level="error"))
+        assert result["source"] == "file"
+        assert result["entries"][0]["message"] == "failed\nTraceback (most recent call last):"
+
+    def test_cursor_and_message_filter(self, log_context):
+        cursor = run(read_log_entries())["cursor"]
+        with log_context.open("a") as fh:
+            fh.write("2025-01-15 10:02:00,000 100 INFO mydb odoo.http: request done\n")
+        result = run(read_log_entries(cursor=cursor, message="DONE"))
+        assert [e["message"] for e in result["entries"]] == ["request done"]
+
+    def test_database_source_still_available(self, log_context):
+        assert run(read_log_entries(source="database"))["source"] == "database"
+
+    def test_file_source_requires_log_file(self):
+        assert "error" in run(read_log_entries(source="file"))
+
+
 # ---------------------------------------------------------------------------
 # search_docs
 # ---------------------------------------------------------------------------
@@ -275,12 +666,54 @@ class TestSearchDocs:
         assert "results" in result
         assert any("/17/" in r["url"] for r in result["results"])
 
+    def test_passages(self):
+        result = json.loads(search_docs(topic="record rule domain", limit=2))
+        assert len(result["passages"]) == 2
+        assert "Record Rules" in result["passages"][0]["title"]
+        assert result["passages"][0]["text"]
+
     def test_no_match(self):
         result = json.loads(search_docs(topic="xyznonexistent"))
         assert "message" in result
         assert "available_topics" in result
 
 
+# ---------------------------------------------------------------------------
+# search_guidelines
+# ---------------------------------------------------------------------------
+
+
+class TestSearchGuidelines:
+    def test_returns_whole_sections(self):
+        result = json.loads(search_guidelines(query="record rules", limit=2))
+        assert result["total"] == 2
+        section = result["sections"][0]
+        assert "Record Rules" in section["title"]
+        assert "Global rules" in section["text"]
+
+    def test_source_filter(self):
+        result = json.loads(search_guidelines(query="record rules", source="skills"))
+        assert {s["source"] for s in result["sections"]} == {"skill"}
+
+    def test_version_defaults_to_config(self):
+        result = json.loads(search_guidelines(query="odoo version", limit=50))
+        versions = {s["id"] for s in result["sections"] if s["source"] == "version"}
+        assert versions
+        assert all(v.startswith("guidelines/versions/v18") for v in versions)
+
+    def test_fetch_by_id(self):
+        result = json.loads(
+            search_guidelines(section_id="guidelines/security#record-rules-ir-rule")
+        )
+        assert result["title"] == "Security > Record Rules (ir.rule)"
+        assert "error" in json.loads(search_guidelines(section_id="missing#section"))
+
+    def test_list_documents(self):
+        documents = json.loads(search_guidelines())["documents"]
+        assert "guidelines/security" in documents
+        assert "skills/testing" in documents
+
+
 # ---------------------------------------------------------------------------
 # list_workflows
 # ---------------------------------------------------------------------------
@@ -288,11 +721,45 @@ class TestSearchDocs:
 
 class TestListWorkflows:
     def test_returns_both_types(self):
-        result = json.loads(list_workflows())
+        result = run(list_workflows())
         assert "automated_actions" in result
         assert "server_actions" in result
 
     def test_filter_by_model(self):
-        result = json.loads(list_workflows(model_name="res.partner"))
+        result = run(list_workflows(model_name="res.partner"))
         if result["automated_actions"]:
             assert result["automated_actions"][0]["model"] == "res.partner"
+
+
+# ---------------------------------------------------------------------------
+# server_stats
+# ---------------------------------------------------------------------------
+
+
+class TestServerStats:
+    def test_reports_instrumented_tools_and_cache(self, server_context):
+        instrumented = server_context.metrics.instrument(list_models)
+        run(instrumented())
+        run(instrumented())
+        result = json.loads(server_stats())
+        (tool,) = result["tools"]
+        assert (tool["tool"], tool["calls"], tool["errors"]) == ("list_models", 2, 0)
+        assert tool["result_bytes"] > 0
+        assert result["cache"]["hits"] >= 1
+        assert 0 < result["cache"]["hit_rate"] <= 1
+
+    def test_error_result_counted(self, server_context):
+        run(server_context.metrics.instrument(database_schema)("no.such.model"))
+        result = json.loads(server_stats())
+        assert result["tools"][0]["errors"] == 1
+
+    def test_reset(self, server_context):
+        run(server_context.metrics.instrument(list_models)())
+        server_context.connection.cached_reads = 3
+        before = json.loads(server_stats(reset=True))
+        assert before["tools"] and before["cache"]["hits"] + before["cache"]["misses"] > 0
+        after = json.loads(server_stats())
+        assert after["tools"] == []
+        assert (after["cache"]["hits"], after["cache"]["misses"]) == (0, 0)
+        assert after["cache"]["hit_rate"] is None
+        assert after["shared_reads"] == {"coalesced": 0, "cached": 0}